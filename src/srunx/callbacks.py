@@ -5,7 +5,7 @@ bridge. The ``SlackCallback`` concrete implementation lives in
 :mod:`srunx.observability.notifications.legacy_slack`.
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, ClassVar
 
 from srunx.common.logging import get_logger
 from srunx.domain import JobType, Workflow
@@ -17,7 +17,20 @@ _logger = get_logger(__name__)
 
 
 class Callback:
-    """Base callback class for job state notifications."""
+    """Base callback class for job state notifications.
+
+    ``_IMPLEMENTED`` lists the ``on_*`` hooks a subclass actually overrides;
+    it is computed automatically in ``__init_subclass__`` so dispatchers can
+    skip the no-op base methods via :func:`implements`.
+    """
+
+    _IMPLEMENTED: ClassVar[frozenset[str]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._IMPLEMENTED = frozenset(
+            name for name in _HOOKS if getattr(cls, name) is not getattr(Callback, name)
+        )
 
     def on_job_submitted(self, job: JobType) -> None:
         """Called when a job is submitted to SLURM.
@@ -100,6 +113,21 @@ class Callback:
         pass
 
 
+_HOOKS = tuple(name for name in vars(Callback) if name.startswith("on_"))
+
+
+def implements(callback: object, hook: str) -> bool:
+    """Return whether ``callback`` overrides ``hook`` (e.g. ``"on_job_running"``).
+
+    Objects that are not :class:`Callback` subclasses (duck-typed callbacks,
+    mocks) are assumed to implement every hook.
+    """
+    implemented = getattr(type(callback), "_IMPLEMENTED", None)
+    if not isinstance(implemented, frozenset):
+        return True
+    return hook in implemented
+
+
 class NotificationWatchCallback(Callback):
     """Attach a durable notification watch every time a job is submitted.
 
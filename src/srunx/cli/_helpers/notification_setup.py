@@ -62,14 +62,12 @@ def attach_notification_watch(
             AttachWatchError,
             attach_job_notification,
         )
-        from srunx.observability.storage.connection import init_db, open_connection
+        from srunx.observability.storage.connection import initialized_connection
         from srunx.observability.storage.repositories.endpoints import (
             EndpointRepository,
         )
 
-        init_db(delete_legacy=False)
-        conn = open_connection()
-        try:
+        with initialized_connection(delete_legacy=False) as conn:
             endpoint_repo = EndpointRepository(conn)
             # R12: scope the lookup to (kind, name) since the DB's UNIQUE
             # constraint is (kind, name); matching on name alone could
@@ -129,8 +127,6 @@ def attach_notification_watch(
                     preset,
                 )
             return result.subscription_id
-        finally:
-            conn.close()
     except Exception as exc:
         logger.warning(
             "Failed to attach notification watch for job %s: %s",
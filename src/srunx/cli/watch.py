@@ -425,14 +425,14 @@ def watch_cluster(
         )
 
         with resolve_transport(profile=profile, local=local, quiet=quiet) as rt:
-            # ScheduledReporter only exercises ``client.queue(...)``
-            # (see _get_job_stats / _get_user_stats), which is part of
-            # JobOperations. ``rt.job_ops`` is the CLI-facing
-            # handle and is either a local ``Slurm`` or an
-            # ``SlurmSSHClient``; the ``cast`` narrows the static type
-            # to match ScheduledReporter's concrete-``Slurm`` signature
-            # without changing that class (its refactor belongs to a
-            # later transport phase).
+            # ScheduledReporter only exercises ``client.queue(...)`` and
+            # ``client.queue_status_counts(...)`` (see _get_queue_snapshot /
+            # _get_queue_counts), both part of JobOperations. ``rt.job_ops``
+            # is the CLI-facing handle and is either a local ``Slurm`` or an
+            # ``SlurmSSHClient``; the ``cast`` narrows the static type to
+            # match ScheduledReporter's concrete-``Slurm`` signature without
+            # changing that class (its refactor belongs to a later transport
+            # phase).
             try:
                 callback = SlackCallback(notify)
             except ValueError as e:
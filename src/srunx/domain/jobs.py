@@ -437,7 +437,8 @@ class BaseJob(BaseModel):
             if line and "|" in line:
                 _, state = line.split("|", 1)
                 try:
-                    self._status = JobStatus(state)
+                    # "CANCELLED by 1000" → "CANCELLED"
+                    self._status = JobStatus(state.partition(" ")[0])
                 except ValueError:
                     # Unknown status, keep current status
                     pass
@@ -1,5 +1,7 @@
 """Workflow aggregate — a named DAG of jobs with dependency validation."""
 
+from collections import defaultdict, deque
+
 from srunx.common.exceptions import WorkflowValidationError
 from srunx.domain.jobs import Job, RunnableJobType, ShellJob
 
@@ -41,48 +43,44 @@ class Workflow:
         return job.depends_on if job else []
 
     def show(self):
-        msg = f"""\
-{" PLAN ":=^80}
-Workflow: {self.name}
-Jobs: {len(self.jobs)}
-"""
+        parts = [
+            f"{' PLAN ':=^80}\n",
+            f"Workflow: {self.name}\n",
+            f"Jobs: {len(self.jobs)}\n",
+        ]
 
-        def add_indent(indent: int, msg: str) -> str:
-            return "    " * indent + msg
+        def add_indent(indent: int, msg: str) -> None:
+            parts.append("    " * indent + msg)
 
         for job in self.jobs:
-            msg += add_indent(1, f"Job: {job.name}\n")
+            add_indent(1, f"Job: {job.name}\n")
             if isinstance(job, Job):
                 command_str = (
                     job.command
                     if isinstance(job.command, str)
                     else " ".join(job.command or [])
                 )
-                msg += add_indent(2, f"{'Command:': <13} {command_str}\n")
-                msg += add_indent(
+                add_indent(2, f"{'Command:': <13} {command_str}\n")
+                add_indent(
                     2,
                     f"{'Resources:': <13} {job.resources.nodes} nodes, {job.resources.gpus_per_node} GPUs/node\n",
                 )
                 if job.environment.conda:
-                    msg += add_indent(
-                        2, f"{'Conda env:': <13} {job.environment.conda}\n"
-                    )
+                    add_indent(2, f"{'Conda env:': <13} {job.environment.conda}\n")
                 if job.environment.container:
-                    msg += add_indent(
-                        2, f"{'Container:': <13} {job.environment.container}\n"
-                    )
+                    add_indent(2, f"{'Container:': <13} {job.environment.container}\n")
                 if job.environment.venv:
-                    msg += add_indent(2, f"{'Venv:': <13} {job.environment.venv}\n")
+                    add_indent(2, f"{'Venv:': <13} {job.environment.venv}\n")
             elif isinstance(job, ShellJob):
-                msg += add_indent(2, f"{'Script path:': <13} {job.script_path}\n")
+                add_indent(2, f"{'Script path:': <13} {job.script_path}\n")
                 if job.script_vars:
-                    msg += add_indent(2, f"{'Script vars:': <13} {job.script_vars}\n")
+                    add_indent(2, f"{'Script vars:': <13} {job.script_vars}\n")
             if job.depends_on:
                 dep_strs = [str(dep) for dep in job.parsed_dependencies]
-                msg += add_indent(2, f"{'Dependencies:': <13} {', '.join(dep_strs)}\n")
+                add_indent(2, f"{'Dependencies:': <13} {', '.join(dep_strs)}\n")
 
-        msg += f"{'=' * 80}\n"
-        print(msg)
+        parts.append(f"{'=' * 80}\n")
+        print("".join(parts))
 
     def validate(self):
         """Validate workflow job dependencies."""
@@ -91,38 +89,35 @@ Jobs: {len(self.jobs)}
         if len(job_names) != len(self.jobs):
             raise WorkflowValidationError("Duplicate job names found in workflow")
 
+        # Check that all dependency job names exist while building the
+        # graph, then check for circular dependencies with Kahn's
+        # algorithm: repeatedly retire jobs whose dependencies are all
+        # retired. Whatever is left sits on, or downstream of, a cycle.
+        dependents: dict[str, list[str]] = defaultdict(list)
+        pending: dict[str, int] = {}
         for job in self.jobs:
-            # Check that all dependency job names exist
-            for parsed_dep in job.parsed_dependencies:
-                if parsed_dep.job_name not in job_names:
+            deps = {parsed_dep.job_name for parsed_dep in job.parsed_dependencies}
+            for dep in deps:
+                if dep not in job_names:
                     raise WorkflowValidationError(
-                        f"Job '{job.name}' depends on unknown job '{parsed_dep.job_name}'"
+                        f"Job '{job.name}' depends on unknown job '{dep}'"
                     )
-
-        # Check for circular dependencies
-        visited = set()
-        rec_stack = set()
-
-        def has_cycle(job_name: str) -> bool:
-            if job_name in rec_stack:
-                return True
-            if job_name in visited:
-                return False
-
-            visited.add(job_name)
-            rec_stack.add(job_name)
-
-            job = self.get(job_name)
-            if job:
-                for parsed_dep in job.parsed_dependencies:
-                    if has_cycle(parsed_dep.job_name):
-                        return True
-
-            rec_stack.remove(job_name)
-            return False
-
-        for job in self.jobs:
-            if has_cycle(job.name):
-                raise WorkflowValidationError(
-                    f"Circular dependency detected involving job '{job.name}'"
-                )
+                dependents[dep].append(job.name)
+            pending[job.name] = len(deps)
+
+        ready = deque(name for name, count in pending.items() if count == 0)
+        retired = 0
+        while ready:
+            name = ready.popleft()
+            retired += 1
+            for dependent in dependents[name]:
+                pending[dependent] -= 1
+                if pending[dependent] == 0:
+                    ready.append(dependent)
+
+        if retired != len(self.jobs):
+            stuck = [job.name for job in self.jobs if pending[job.name]]
+            raise WorkflowValidationError(
+                f"Circular dependency detected involving job '{stuck[0]}' "
+                f"(unresolvable: {', '.join(stuck)})"
+            )
@@ -359,7 +359,7 @@ def run_workflow(
 
         # Non-sweep path — mount-aware branch routes submission through a
         # small SSH executor pool so WorkflowRunner's parallel execution
-        # (``ThreadPoolExecutor(max_workers=8)``) can submit concurrently
+        # (one ``ThreadPoolExecutor`` worker per job) can submit concurrently
         # against the remote cluster. The pool is closed in ``finally``.
         pool = None
         executor_factory = None
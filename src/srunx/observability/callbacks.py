@@ -10,27 +10,35 @@ from __future__ import annotations
 
 from typing import Any
 
-from srunx.callbacks import Callback
+from srunx.callbacks import Callback, implements
 from srunx.domain import BaseJob
 from srunx.domain.jobs import JobStatus
 
+# Terminal status → ``Callback`` hook. TIMEOUT is reported as a cancellation.
+_TERMINAL_HOOKS: dict[JobStatus, str] = {
+    JobStatus.COMPLETED: "on_job_completed",
+    JobStatus.FAILED: "on_job_failed",
+    JobStatus.CANCELLED: "on_job_cancelled",
+    JobStatus.TIMEOUT: "on_job_cancelled",
+}
+
 
 class CallbackSink:
-    """Routes sink events to the equivalent ``Callback`` hook method."""
+    """Routes sink events to the equivalent ``Callback`` hook method.
+
+    Hooks the wrapped callback does not override are skipped without a call.
+    """
 
     def __init__(self, callback: Callback) -> None:
         self._cb = callback
 
     def on_submit(self, job: BaseJob, **_: Any) -> None:
-        self._cb.on_job_submitted(job)
+        if implements(self._cb, "on_job_submitted"):
+            self._cb.on_job_submitted(job)
 
     def on_terminal(self, job: BaseJob) -> None:
-        match job.status:
-            case JobStatus.COMPLETED:
-                self._cb.on_job_completed(job)
-            case JobStatus.FAILED:
-                self._cb.on_job_failed(job)
-            case JobStatus.CANCELLED | JobStatus.TIMEOUT:
-                self._cb.on_job_cancelled(job)
-            case _:
-                pass  # Non-terminal / unknown — nothing to dispatch.
+        hook = _TERMINAL_HOOKS.get(job.status)
+        if hook is None:
+            return  # Non-terminal / unknown — nothing to dispatch.
+        if implements(self._cb, hook):
+            getattr(self._cb, hook)(job)
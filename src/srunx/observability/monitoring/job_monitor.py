@@ -4,7 +4,7 @@ from typing import TYPE_CHECKING, Any
 
 from loguru import logger
 
-from srunx.callbacks import Callback
+from srunx.callbacks import Callback, implements
 from srunx.domain import BaseJob, JobStatus
 from srunx.observability.monitoring.base import BaseMonitor
 from srunx.observability.monitoring.types import MonitorConfig
@@ -17,6 +17,16 @@ if TYPE_CHECKING:
     from srunx.slurm.protocols import JobOperations
 
 
+# Status transition → ``Callback`` hook. TIMEOUT is reported as a failure.
+_STATUS_HOOKS: dict[JobStatus, str] = {
+    JobStatus.RUNNING: "on_job_running",
+    JobStatus.COMPLETED: "on_job_completed",
+    JobStatus.FAILED: "on_job_failed",
+    JobStatus.CANCELLED: "on_job_cancelled",
+    JobStatus.TIMEOUT: "on_job_failed",
+}
+
+
 class JobMonitor(BaseMonitor):
     """Monitor SLURM jobs until they reach terminal states.
 
@@ -194,17 +204,13 @@ class JobMonitor(BaseMonitor):
                 # callback notifications.
                 logger.warning(f"record_completion failed: {exc}")
 
+        hook = _STATUS_HOOKS.get(status)
+        if hook is None:
+            return
         for callback in self.callbacks:
+            if not implements(callback, hook):
+                continue
             try:
-                if status == JobStatus.RUNNING:
-                    callback.on_job_running(job)
-                elif status == JobStatus.COMPLETED:
-                    callback.on_job_completed(job)
-                elif status == JobStatus.FAILED:
-                    callback.on_job_failed(job)
-                elif status == JobStatus.CANCELLED:
-                    callback.on_job_cancelled(job)
-                elif status == JobStatus.TIMEOUT:
-                    callback.on_job_failed(job)
+                getattr(callback, hook)(job)
             except Exception as e:
                 logger.error(f"Callback error for job {job.job_id}: {e}")
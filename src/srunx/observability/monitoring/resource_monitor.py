@@ -5,7 +5,7 @@ from typing import Any
 
 from loguru import logger
 
-from srunx.callbacks import Callback
+from srunx.callbacks import Callback, implements
 from srunx.observability.monitoring.base import BaseMonitor
 from srunx.observability.monitoring.resource_source import ResourceSource
 from srunx.observability.monitoring.types import MonitorConfig, ResourceSnapshot
@@ -329,12 +329,14 @@ class ResourceMonitor(BaseMonitor):
 
         # Notify only on state transitions
         if is_available != self._was_available:
+            hook = (
+                "on_resources_available" if is_available else "on_resources_exhausted"
+            )
             for callback in self.callbacks:
+                if not implements(callback, hook):
+                    continue
                 try:
-                    if is_available:
-                        callback.on_resources_available(snapshot)
-                    else:
-                        callback.on_resources_exhausted(snapshot)
+                    getattr(callback, hook)(snapshot)
                 except Exception as e:
                     logger.error(f"Callback error for resource event: {e}")
 
@@ -1,9 +1,14 @@
 """Scheduled reporter for periodic SLURM status updates."""
 
+import functools
 import os
 import re
 import signal
 import sys
+import time
+import weakref
+from collections import Counter
+from collections.abc import Callable
 from datetime import UTC, datetime, timedelta
 
 from apscheduler.schedulers.blocking import BlockingScheduler
@@ -11,8 +16,8 @@ from apscheduler.triggers.cron import CronTrigger
 from apscheduler.triggers.interval import IntervalTrigger
 from loguru import logger
 
-from srunx.callbacks import Callback
-from srunx.domain import JobStatus
+from srunx.callbacks import Callback, implements
+from srunx.domain import BaseJob, JobStatus
 from srunx.observability.monitoring.resource_monitor import ResourceMonitor
 from srunx.observability.monitoring.types import (
     JobStats,
@@ -23,6 +28,16 @@ from srunx.observability.monitoring.types import (
 )
 from srunx.slurm.local import Slurm
 
+# ``<number><unit>`` as used by interval schedules and report timeframes.
+_INTERVAL_RE = re.compile(r"^(\d+)([smhd])$")
+_UNIT_SECONDS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+_UNIT_KWARG = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
+
+_EMPTY_STATS = JobStats(pending=0, running=0, completed=0, failed=0, cancelled=0)
+
+# How long one squeue listing is reused across the sections of a report.
+_SQUEUE_TTL_SECONDS = 5.0
+
 
 class ScheduledReporter:
     """Scheduled reporter for periodic SLURM cluster status updates.
@@ -62,6 +77,21 @@ class ScheduledReporter:
         self.config = config
         self.scheduler = BlockingScheduler()
 
+        # Resolve the report hook once; a callback that leaves it as the
+        # base-class no-op (or a duck-typed one without it) can never
+        # deliver a report.
+        self._report_sink: Callable[[Report], None] | None = None
+        if implements(callback, "on_scheduled_report"):
+            self._report_sink = getattr(callback, "on_scheduled_report", None)
+        if self._report_sink is None:
+            logger.warning(
+                f"Callback {type(callback).__name__} does not implement "
+                "on_scheduled_report method"
+            )
+
+        # Last full squeue listing and when it was taken (monotonic).
+        self._squeue_cache: tuple[float, list[BaseJob]] | None = None
+
         # Cache ResourceMonitor if needed
         self._resource_monitor: ResourceMonitor | None = None
         if "resources" in config.include:
@@ -125,7 +155,7 @@ class ScheduledReporter:
             ValueError: If interval format is invalid
         """
         # Pattern: <number><unit> where unit is s/m/h/d
-        match = re.match(r"^(\d+)([smhd])$", self.config.schedule)
+        match = _INTERVAL_RE.match(self.config.schedule)
         if not match:
             raise ValueError(
                 f"Invalid interval format: {self.config.schedule}. "
@@ -136,8 +166,7 @@ class ScheduledReporter:
         unit = match.group(2)
 
         # Convert to seconds for validation
-        unit_to_seconds = {"s": 1, "m": 60, "h": 3600, "d": 86400}
-        interval_seconds = value * unit_to_seconds[unit]
+        interval_seconds = value * _UNIT_SECONDS[unit]
 
         # Enforce minimum interval of 60 seconds (1 minute)
         if interval_seconds == 0:
@@ -150,25 +179,19 @@ class ScheduledReporter:
                 "Use higher intervals to avoid SLURM overload."
             )
 
-        unit_map = {
-            "s": "seconds",
-            "m": "minutes",
-            "h": "hours",
-            "d": "days",
-        }
-
-        kwargs = {unit_map[unit]: value}
-        return IntervalTrigger(**kwargs)
+        return IntervalTrigger(**{_UNIT_KWARG[unit]: value})
 
     def _setup_signal_handlers(self) -> None:
-        """Setup signal handlers for graceful shutdown."""
-
-        def signal_handler(signum: int, frame: object) -> None:
-            self.stop()
-            sys.exit(0)
+        """Setup signal handlers for graceful shutdown.
 
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        One module-level handler serves every live reporter; it is only
+        (re)installed when not already in place, and holds reporters
+        weakly so they can still be garbage collected.
+        """
+        _REPORTERS.add(self)
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            if signal.getsignal(signum) is not _stop_reporters:
+                signal.signal(signum, _stop_reporters)
 
     def _generate_and_send_report(self) -> bool:
         """Generate report and send via callback.
@@ -195,56 +218,116 @@ class ScheduledReporter:
         Returns:
             Report containing requested statistics
         """
-        report = Report(timestamp=datetime.now())
+        report = Report(timestamp=datetime.now(UTC))
+
+        # One squeue snapshot per report: the full listing when the
+        # running-jobs section needs it anyway, otherwise just the
+        # (state, user) counts behind the job and user stats.
+        jobs: list[BaseJob] | None = None
+        counts = None
+        if "running" in self.config.include:
+            jobs = self._get_queue_snapshot()
+            if jobs is not None:
+                counts = Counter((j._status.value, j.user or "") for j in jobs)
+        elif "jobs" in self.config.include or "user" in self.config.include:
+            counts = self._get_queue_counts()
 
         if "jobs" in self.config.include:
-            report.job_stats = self._get_job_stats()
+            report.job_stats = self._get_job_stats(counts)
 
         if "resources" in self.config.include:
             report.resource_stats = self._get_resource_stats()
 
         if "user" in self.config.include:
-            report.user_stats = self._get_user_stats()
+            report.user_stats = self._get_user_stats(counts)
 
         if "running" in self.config.include:
-            report.running_jobs = self._get_running_jobs()
+            report.running_jobs = self._get_running_jobs(jobs)
 
         return report
 
-    def _get_job_stats(self) -> JobStats:
-        """Get overall job queue statistics.
+    def _get_queue_snapshot(self) -> list[BaseJob] | None:
+        """Return the active job listing, reusing one taken moments ago.
+
+        Listings younger than ``_SQUEUE_TTL_SECONDS`` are served from
+        memory, so every section of a report (and a manual send racing a
+        scheduled one) shares a single squeue call.
 
         Returns:
-            Job statistics for all users
+            The jobs, or ``None`` if the queue could not be read
         """
+        now = time.monotonic()
+        cached = self._squeue_cache
+        if cached is not None and now - cached[0] < _SQUEUE_TTL_SECONDS:
+            return cached[1]
         try:
-            # Get all jobs in queue
-            all_jobs = self.client.queue()
+            jobs = self.client.queue()
+        except (RuntimeError, ValueError, ConnectionError, OSError) as e:
+            logger.warning(f"Failed to retrieve job list: {e}")
+            return None
+        except Exception as e:
+            logger.exception(f"Unexpected error retrieving job list: {e}")
+            return None
+        logger.debug(f"Retrieved {len(jobs)} total jobs from queue")
+        self._squeue_cache = (now, jobs)
+        return jobs
+
+    def _get_queue_counts(self) -> Counter[tuple[str, str]] | None:
+        """Count active jobs by ``(state, user)`` with a single squeue call.
+
+        Returns:
+            The counts, or ``None`` if the queue could not be read
+        """
+        try:
+            return self.client.queue_status_counts()
         except (RuntimeError, ValueError, ConnectionError, OSError) as e:
             logger.warning(f"Failed to retrieve job queue: {e}")
-            return JobStats(
-                pending=0,
-                running=0,
-                completed=0,
-                failed=0,
-                cancelled=0,
-            )
         except Exception as e:
             logger.exception(f"Unexpected error retrieving job queue: {e}")
-            return JobStats(
-                pending=0,
-                running=0,
-                completed=0,
-                failed=0,
-                cancelled=0,
-            )
+        return None
+
+    def _get_job_stats(
+        self, counts: Counter[tuple[str, str]] | None = None
+    ) -> JobStats:
+        """Get overall job queue statistics.
+
+        Args:
+            counts: Queue counts from :meth:`_get_queue_counts`; fetched
+                when not supplied
+
+        Returns:
+            Job statistics for all users
+        """
+        if counts is None:
+            counts = self._get_queue_counts()
+        if counts is None:
+            return _EMPTY_STATS
+        return self._tally(counts)
 
-        # Count by status
-        pending = sum(1 for j in all_jobs if j._status == JobStatus.PENDING)
-        running = sum(1 for j in all_jobs if j._status == JobStatus.RUNNING)
+    def _tally(
+        self, counts: Counter[tuple[str, str]], user: str | None = None
+    ) -> JobStats:
+        """Build :class:`JobStats` from queue counts in one pass.
 
-        # Query sacct for historical completed/failed/cancelled counts
-        completed, failed, cancelled = self._get_historical_counts()
+        Args:
+            counts: ``(state, user)`` queue counts
+            user: Only count this user's jobs; also scopes the historical
+                counts
+
+        Returns:
+            Pending/running from ``counts`` plus historical terminal counts
+        """
+        pending = running = 0
+        for (state, owner), n in counts.items():
+            if user is not None and owner != user:
+                continue
+            if state == JobStatus.PENDING.value:
+                pending += n
+            elif state == JobStatus.RUNNING.value:
+                running += n
+
+        # Historical completed/failed/cancelled counts (state DB or sacct)
+        completed, failed, cancelled = self._get_historical_counts(user=user)
 
         return JobStats(
             pending=pending,
@@ -338,7 +421,7 @@ class ScheduledReporter:
         ``sacct`` without the DB outage surfacing as zero-counts.
         """
         try:
-            from srunx.observability.storage.connection import init_db, open_connection
+            from srunx.observability.storage.connection import initialized_connection
             from srunx.observability.storage.repositories.base import now_iso
             from srunx.observability.storage.repositories.jobs import JobRepository
 
@@ -350,17 +433,13 @@ class ScheduledReporter:
                 .replace("+00:00", "Z")
             )
 
-            init_db(delete_legacy=False)
-            conn = open_connection()
-            try:
+            with initialized_connection(delete_legacy=False) as conn:
                 counts = JobRepository(conn).count_by_status_in_range(
                     from_at,
                     to_at,
                     statuses=["COMPLETED", "FAILED", "CANCELLED"],
                     timestamp_field="completed_at",
                 )
-            finally:
-                conn.close()
 
             return (
                 counts.get("COMPLETED", 0),
@@ -372,17 +451,20 @@ class ScheduledReporter:
             return None
 
     @staticmethod
+    @functools.lru_cache(maxsize=8)
     def _parse_timeframe_to_delta(timeframe: str) -> timedelta:
-        """Parse ``<number><unit>`` (e.g. ``24h``, ``30m``) into a ``timedelta``."""
-        match = re.match(r"^(\d+)([smhd])$", timeframe)
+        """Parse ``<number><unit>`` (e.g. ``24h``, ``30m``) into a ``timedelta``.
+
+        Memoized: every report tick re-reads the same configured timeframe.
+        """
+        match = _INTERVAL_RE.match(timeframe)
         if not match:
             raise ValueError(
                 f"Invalid timeframe: {timeframe}. Expected e.g. '24h', '30m', '1d'."
             )
         value = int(match.group(1))
         unit = match.group(2)
-        unit_to_kwarg = {"s": "seconds", "m": "minutes", "h": "hours", "d": "days"}
-        return timedelta(**{unit_to_kwarg[unit]: value})
+        return timedelta(**{_UNIT_KWARG[unit]: value})
 
     def _get_resource_stats(self) -> ResourceStats:
         """Get GPU and node resource statistics.
@@ -408,65 +490,43 @@ class ScheduledReporter:
             nodes_down=snapshot.nodes_down,
         )
 
-    def _get_user_stats(self) -> JobStats:
+    def _get_user_stats(
+        self, counts: Counter[tuple[str, str]] | None = None
+    ) -> JobStats:
         """Get user-specific job statistics.
 
+        Args:
+            counts: Queue counts from :meth:`_get_queue_counts`; fetched
+                when not supplied
+
         Returns:
             Job statistics filtered by user
         """
         # Determine target user
         target_user = self.config.user or os.getenv("USER")
 
-        try:
-            # Get user's jobs
-            user_jobs = self.client.queue(user=target_user) if target_user else []
-        except (RuntimeError, ValueError, ConnectionError, OSError) as e:
-            logger.warning(f"Failed to retrieve user jobs for {target_user}: {e}")
-            return JobStats(
-                pending=0,
-                running=0,
-                completed=0,
-                failed=0,
-                cancelled=0,
-            )
-        except Exception as e:
-            logger.exception(
-                f"Unexpected error retrieving user jobs for {target_user}: {e}"
-            )
-            return JobStats(
-                pending=0,
-                running=0,
-                completed=0,
-                failed=0,
-                cancelled=0,
-            )
-
-        # Count by status
-        pending = sum(1 for j in user_jobs if j._status == JobStatus.PENDING)
-        running = sum(1 for j in user_jobs if j._status == JobStatus.RUNNING)
+        if counts is None:
+            counts = self._get_queue_counts()
+        if counts is None:
+            return _EMPTY_STATS
+        # Without a user there are no active jobs to attribute.
+        return self._tally(counts if target_user else Counter(), user=target_user)
 
-        # Historical counts from sacct
-        completed, failed, cancelled = self._get_historical_counts(user=target_user)
-
-        return JobStats(
-            pending=pending,
-            running=running,
-            completed=completed,
-            failed=failed,
-            cancelled=cancelled,
-        )
-
-    def _get_running_jobs(self) -> list[RunningJob]:
+    def _get_running_jobs(self, jobs: list[BaseJob] | None = None) -> list[RunningJob]:
         """Get list of running and pending jobs.
 
+        Args:
+            jobs: Listing from :meth:`_get_queue_snapshot`; fetched when not
+                supplied
+
         Returns:
             List of running jobs (limited by max_jobs config)
         """
-        try:
-            # Get all jobs in queue
-            all_jobs = self.client.queue()
-            logger.debug(f"Retrieved {len(all_jobs)} total jobs from queue")
+        all_jobs = jobs if jobs is not None else self._get_queue_snapshot()
+        if all_jobs is None:
+            return []
 
+        try:
             # Filter to running and pending only
             active_jobs = [
                 j
@@ -558,15 +618,8 @@ class ScheduledReporter:
         Args:
             report: Generated report to send
         """
-        # Call callback with report
-        # The callback will format and send the report
-        if hasattr(self.callback, "on_scheduled_report"):
-            self.callback.on_scheduled_report(report)  # type: ignore
-        else:
-            logger.warning(
-                f"Callback {type(self.callback).__name__} does not implement "
-                "on_scheduled_report method"
-            )
+        if self._report_sink is not None:
+            self._report_sink(report)
 
     def run(self) -> None:
         """Start scheduler in blocking mode.
@@ -595,7 +648,7 @@ class ScheduledReporter:
 
             table.add_row("🔄 Status", "Running")
             table.add_row("📅 Schedule", self.config.schedule)
-            table.add_row("📊 Sections", ", ".join(self.config.include))
+            table.add_row("📊 Sections", ", ".join(sorted(self.config.include)))
 
             return Panel(
                 table,
@@ -616,3 +669,13 @@ class ScheduledReporter:
         """Stop the scheduler gracefully."""
         if self.scheduler.running:
             self.scheduler.shutdown(wait=False)
+
+
+# Reporters stopped by the shared SIGINT / SIGTERM handler.
+_REPORTERS: weakref.WeakSet[ScheduledReporter] = weakref.WeakSet()
+
+
+def _stop_reporters(signum: int, frame: object) -> None:
+    for reporter in list(_REPORTERS):
+        reporter.stop()
+    sys.exit(0)
@@ -137,8 +137,9 @@ class ReportConfig(BaseModel):
     """Configuration for scheduled reporting."""
 
     schedule: str
-    include: list[str] = Field(
-        default_factory=lambda: ["jobs", "resources", "user", "running"]
+    # A set: the reporter tests section membership on every tick.
+    include: frozenset[str] = Field(
+        default_factory=lambda: frozenset({"jobs", "resources", "user", "running"})
     )
     partition: str | None = None
     user: str | None = None
@@ -149,7 +150,7 @@ class ReportConfig(BaseModel):
     @model_validator(mode="after")
     def _validate(self) -> "ReportConfig":
         valid_include = {"jobs", "resources", "user", "running"}
-        invalid = set(self.include) - valid_include
+        invalid = self.include - valid_include
         if invalid:
             raise ValueError(f"Invalid include options: {invalid}")
         if not self.schedule:
@@ -1,6 +1,7 @@
 """Slack incoming-webhook delivery adapter.
 
-Uses :class:`slack_sdk.WebhookClient` (already a project dependency) to
+Uses :func:`~srunx.observability.notifications.webhook_client.shared_webhook_client`
+(a :class:`slack_sdk.WebhookClient` with a persistent connection) to
 POST mrkdwn-formatted blocks to an Incoming Webhook URL. Every user-
 supplied identifier is sanitized through
 :func:`srunx.observability.notifications.sanitize.sanitize_slack_text`.
@@ -10,18 +11,24 @@ from __future__ import annotations
 
 from typing import Any
 
-from slack_sdk import WebhookClient
-
 from srunx.observability.notifications.adapters.base import DeliveryError
 from srunx.observability.notifications.sanitize import (
     is_valid_slack_webhook_url,
     sanitize_slack_text,
 )
+from srunx.observability.notifications.webhook_client import shared_webhook_client
 from srunx.observability.storage.models import Event
 
 
 class SlackWebhookAdapter:
-    """Deliver events via a Slack Incoming Webhook URL."""
+    """Deliver events via a Slack Incoming Webhook URL.
+
+    Posts go through the process-wide keep-alive client for the webhook
+    URL, so consecutive deliveries to the same endpoint reuse the open TLS
+    connection. The
+    delivery poller already runs :meth:`send` on a worker thread, which
+    keeps these blocking posts off its event loop.
+    """
 
     kind: str = "slack_webhook"
 
@@ -55,7 +62,7 @@ class SlackWebhookAdapter:
 
         text, blocks = self._build_message(event)
 
-        client = WebhookClient(webhook_url)
+        client = shared_webhook_client(webhook_url)
         try:
             response = client.send(text=text, blocks=blocks)
         except Exception as exc:  # network / SSL / etc.
@@ -2,6 +2,33 @@
 
 from datetime import datetime, timedelta
 
+from srunx.observability.notifications.sanitize import sanitize_slack_text
+
+# Every bar at the default width, indexed by the number of filled cells.
+_BAR_LEN = 10
+_BARS = tuple("█" * i + "░" * (_BAR_LEN - i) for i in range(_BAR_LEN + 1))
+
+
+def _format_runtime(runtime: object) -> str:
+    """Format a running job's runtime as ``HH:MM`` or ``<days>dHH:MM``."""
+    if not runtime:
+        return "-"
+    # model_dump() keeps timedelta objects as-is
+    if isinstance(runtime, timedelta):
+        total = int(runtime.total_seconds())
+    elif isinstance(runtime, dict):
+        # Fallback for dict format (shouldn't happen with model_dump)
+        total = runtime.get("days", 0) * 86400 + runtime.get("seconds", 0)
+    else:
+        total = 0
+
+    days, remainder = divmod(total, 86400)
+    hours, remainder = divmod(remainder, 3600)
+    minutes = remainder // 60
+    if days > 0:
+        return f"{days}d{hours:02d}:{minutes:02d}"
+    return f"{hours:02d}:{minutes:02d}"
+
 
 class SlackTableFormatter:
     """Format data as ASCII tables for Slack code blocks."""
@@ -10,41 +37,9 @@ class SlackTableFormatter:
     def _sanitize_text(text: str) -> str:
         """Sanitize text for safe use in Slack messages.
 
-        Prevents injection attacks by escaping special characters and
-        removing control characters that could break message formatting.
-
-        Args:
-            text: Text to sanitize.
-
-        Returns:
-            Sanitized text with special characters escaped and control
-            characters removed.
+        Delegates to :func:`srunx.observability.notifications.sanitize.sanitize_slack_text`.
         """
-        # Remove or replace control characters
-        text = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-
-        # Escape special characters that could enable injection attacks
-        # Note: & must be first to avoid double-escaping
-        replacements = {
-            "&": "&amp;",  # HTML entity escape (must be first)
-            "<": "&lt;",  # Prevent HTML/script tag injection
-            ">": "&gt;",  # Prevent HTML/script tag injection
-            "`": "'",  # Prevent code block injection
-            "*": "\\*",  # Escape markdown bold
-            "_": "\\_",  # Escape markdown italic
-            "~": "\\~",  # Escape markdown strikethrough
-            "[": "\\[",  # Escape markdown link syntax
-            "]": "\\]",  # Escape markdown link syntax
-        }
-        for char, replacement in replacements.items():
-            text = text.replace(char, replacement)
-
-        # Limit length to prevent message overflow
-        max_length = 1000
-        if len(text) > max_length:
-            text = text[:max_length] + "..."
-
-        return text
+        return sanitize_slack_text(text)
 
     @staticmethod
     def header(title: str, timestamp: datetime | None = None) -> str:
@@ -52,14 +47,16 @@ class SlackTableFormatter:
 
         Args:
             title: Header title with emoji
-            timestamp: Optional timestamp to display
+            timestamp: Optional timestamp to display, shown in local time
+                (naive values are taken to be local already)
 
         Returns:
             Formatted header string
         """
         lines = [title, "━" * 40]
         if timestamp:
-            lines.append(f"🕐 {timestamp.strftime('%Y-%m-%d %H:%M:%S')}")
+            local = timestamp.astimezone()
+            lines.append(f"🕐 {local.strftime('%Y-%m-%d %H:%M:%S')}")
         return "\n".join(lines)
 
     @staticmethod
@@ -186,10 +183,12 @@ class SlackTableFormatter:
             Progress bar string (e.g., "██████░░░░")
         """
         if total == 0:
-            return "░" * width
+            return _BARS[0] if width == _BAR_LEN else "░" * width
 
         ratio = min(value / total, 1.0)
         filled = int(ratio * width)
+        if width == _BAR_LEN and filled >= 0:
+            return _BARS[filled]
         empty = width - filled
 
         return "█" * filled + "░" * empty
@@ -235,17 +234,18 @@ class SlackNotificationFormatter:
 
         # Build data dict
         data = {
-            "Job ID": str(job_id),
+            "Job ID": str(job_id),  # pure-numeric, no sanitize needed
             "Name": name,
             "Status": f"{old_status}→{new_status}",
         }
 
         if partition:
-            data["Partition"] = partition
+            # Partition names come from the cluster config / user input.
+            data["Partition"] = self.table._sanitize_text(partition)
         if runtime:
             data["Runtime"] = runtime
         if gpus:
-            data["GPUs"] = str(gpus)
+            data["GPUs"] = str(gpus)  # pure-numeric, no sanitize needed
 
         title_box = self.table.box_title(f"{emoji} Job {status_text}")
         kv_table = self.table.key_value_table(data)
@@ -367,6 +367,7 @@ class SlackNotificationFormatter:
             running = job_stats.get("running", 0)
             total_active = pending + running
 
+            # pure-numeric, no sanitize needed
             queue_data = {
                 "Total Active": str(total_active),
                 "Pending": str(pending),
@@ -390,6 +391,8 @@ class SlackNotificationFormatter:
                 else ""
             )
 
+            # Only the partition is user-controlled (sanitized above); the
+            # rest is pure-numeric, no sanitize needed.
             resource_data = {
                 f"GPU Resources{partition_text}": "",
                 "Total": str(total),
@@ -403,45 +406,18 @@ class SlackNotificationFormatter:
         # Running Jobs
         if running_jobs:
             headers = ["ID", "Name", "User", "Runtime", "GPU"]
-            rows = []
-            for job in running_jobs:
-                # Format runtime from timedelta
-                runtime_str = "-"
-                if job.get("runtime"):
-                    rt = job["runtime"]
-                    # asdict() keeps timedelta objects as-is
-                    if isinstance(rt, timedelta):
-                        days = rt.days
-                        seconds = rt.seconds
-                    elif isinstance(rt, dict):
-                        # Fallback for dict format (shouldn't happen with asdict)
-                        days = rt.get("days", 0)
-                        seconds = rt.get("seconds", 0)
-                    else:
-                        days = 0
-                        seconds = 0
-
-                    hours, remainder = divmod(seconds, 3600)
-                    minutes, _ = divmod(remainder, 60)
-
-                    if days > 0:
-                        runtime_str = f"{days}d{hours:02d}:{minutes:02d}"
-                    else:
-                        runtime_str = f"{hours:02d}:{minutes:02d}"
-
-                # Sanitize job name and user
-                job_name = self.table._sanitize_text(job.get("name", "-"))
-                job_user = self.table._sanitize_text(job.get("user", "-"))
-
-                rows.append(
-                    [
-                        str(job.get("job_id", "-")),
-                        job_name[:12],
-                        job_user[:8],
-                        runtime_str[:8],
-                        str(job.get("gpus", "-")),
-                    ]
-                )
+            # Sanitize job name and user
+            sanitize = self.table._sanitize_text
+            rows = [
+                [
+                    str(job.get("job_id", "-")),
+                    sanitize(job.get("name", "-"))[:12],
+                    sanitize(job.get("user", "-"))[:8],
+                    _format_runtime(job.get("runtime"))[:8],
+                    str(job.get("gpus", "-")),
+                ]
+                for job in running_jobs
+            ]
 
             sections.append(
                 self.table.data_table(
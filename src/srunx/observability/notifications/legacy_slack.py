@@ -12,28 +12,327 @@ through the durable outbox.
 
 from __future__ import annotations
 
-import re
-from typing import TYPE_CHECKING
-
-from slack_sdk import WebhookClient
+import atexit
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict, deque
+from typing import TYPE_CHECKING, Any
 
 from srunx.callbacks import Callback
+from srunx.common.logging import get_logger
 from srunx.domain import JobType, Workflow
 from srunx.observability.notifications.formatting import SlackNotificationFormatter
+from srunx.observability.notifications.sanitize import (
+    is_valid_slack_webhook_url,
+    sanitize_slack_text,
+)
+from srunx.observability.notifications.webhook_client import shared_webhook_client
 from srunx.utils import job_status_msg
 
 if TYPE_CHECKING:
     from srunx.observability.monitoring.types import Report, ResourceSnapshot
 
+_logger = get_logger(__name__)
+
+# Returned by ``_PendingQueue.get`` once the queue is closed and empty.
+_STOP = object()
+
+# Seconds ``SlackCallback`` waits for its queue to drain at shutdown.
+_CLOSE_TIMEOUT = 10.0
+
+# Upper bound on remembered job notifications for de-duplication.
+_DEDUP_MAX_ENTRIES = 4096
+
+# Slack rejects messages with more than 50 blocks.
+_MAX_BLOCKS_PER_MESSAGE = 50
+
+# Fallback ``text`` of each notification. Job titles double as the
+# de-duplication / coalescing key, so every hook must use the same object.
+_TITLE_JOB_SUBMITTED = "Job submitted"
+_TITLE_JOB_COMPLETED = "Job completed"
+_TITLE_JOB_FAILED = "Job failed"
+_TITLE_JOB_RUNNING = "Job running"
+_TITLE_JOB_CANCELLED = "Job cancelled"
+_TITLE_WORKFLOW_COMPLETED = "Workflow completed"
+_TITLE_RESOURCES_AVAILABLE = "Resources available"
+_TITLE_RESOURCES_EXHAUSTED = "Resources exhausted"
+_TITLE_STATUS_REPORT = "SLURM Status Report"
+_TITLE_JOB_UPDATES = "Job updates"
+
+# Static head of the submission line; only the name and ID vary per job.
+_SUBMIT_PREFIX = f"`⚡ {'SUBMITTED':<12} Job "
+
+
+# Fields ``SlackNotificationFormatter.cluster_status`` actually reads; dumping
+# only these keeps pydantic from serializing the rest of each model per report.
+_JOB_STATS_FIELDS = frozenset({"pending", "running"})
+_RESOURCE_STATS_FIELDS = frozenset(
+    {
+        "partition",
+        "total_gpus",
+        "gpus_in_use",
+        "gpus_available",
+        "nodes_idle",
+        "nodes_total",
+    }
+)
+_RUNNING_JOB_FIELDS = frozenset({"job_id", "name", "user", "runtime", "gpus"})
+
+
+def _mrkdwn_block(text: str) -> list[dict[str, Any]]:
+    """Wrap ``text`` in the single mrkdwn section every notification uses."""
+    return [{"type": "section", "text": {"type": "mrkdwn", "text": text}}]
+
+
+class _TokenBucket:
+    """Thread-safe token bucket: ``rate`` tokens/sec, at most ``capacity``."""
+
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.last_refill) * self.rate
+        )
+        self.last_refill = now
+
+    def try_acquire(self) -> bool:
+        """Take one token if available; never blocks."""
+        with self._lock:
+            self._refill()
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return True
+            return False
+
+    def wait(self) -> None:
+        """Block until a token is available, then take it."""
+        while True:
+            with self._lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+
+
+class _PendingQueue:
+    """Bounded FIFO of queued posts that coalesces repeats at its tail.
+
+    A full queue drops its oldest item to make room. After ``close`` the
+    remaining items are still handed out, then ``get`` returns ``_STOP``.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self._items: deque[tuple[Any, dict[str, Any]]] = deque()
+        self._maxsize = maxsize
+        self._cond = threading.Condition()
+        self._closed = False
+
+    def put(self, key: tuple[Any, str] | None, kwargs: dict[str, Any]) -> bool:
+        """Queue ``(key, kwargs)``; return whether the oldest item was dropped.
+
+        If the newest queued item has the same non-``None`` key it is
+        replaced instead.
+        """
+        with self._cond:
+            if key is not None and self._items and self._items[-1][0] == key:
+                self._items[-1] = (key, kwargs)
+                return False
+            dropped = 0 < self._maxsize <= len(self._items)
+            if dropped:
+                self._items.popleft()
+            self._items.append((key, kwargs))
+            self._cond.notify()
+            return dropped
+
+    def get(self, timeout: float | None = None) -> Any:
+        """Pop the oldest item, ``_STOP`` once closed and empty, or ``None``
+        if *timeout* expires first."""
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._items or self._closed, timeout):
+                return None
+            return self._items.popleft() if self._items else _STOP
+
+    def close(self) -> None:
+        """Make ``get`` return ``_STOP`` once the queue is drained."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+
+
+class _Sender:
+    """Background thread that posts one ``SlackCallback``'s queued messages.
+
+    Kept separate from the callback so the thread never references it: a
+    dropped ``SlackCallback`` is collected while its pending posts still
+    go out.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        pending: _PendingQueue,
+        bucket: _TokenBucket,
+        batch_window: float,
+    ) -> None:
+        self.client = client
+        self.pending = pending
+        self.bucket = bucket
+        self.batch_window = batch_window
+        self.thread = threading.Thread(target=self._drain, name="slack-cb", daemon=True)
+        self.thread.start()
+        _SENDERS.add(self)
+
+    def request_stop(self) -> None:
+        """Let the thread exit once the queue is empty; never blocks."""
+        self.pending.close()
+
+    def stop(self, timeout: float | None = _CLOSE_TIMEOUT) -> None:
+        """Request a stop and wait at most *timeout* for the queue to drain."""
+        self.request_stop()
+        self.thread.join(timeout)
+
+    def _drain(self) -> None:
+        item = None
+        while True:
+            if item is None:
+                item = self.pending.get()
+            if item is _STOP:
+                return
+            key, kwargs = item
+            item = None
+            if key is not None and self.batch_window > 0:
+                kwargs, item = self._collect_batch(key, kwargs)
+            self.bucket.wait()
+            self._send(**kwargs)
+
+    def _collect_batch(
+        self, key: tuple[Any, str], kwargs: dict[str, Any]
+    ) -> tuple[dict[str, Any], Any]:
+        """Combine job notifications queued within the batch window.
+
+        Args:
+            key: Coalesce key of the first job notification.
+            kwargs: ``send`` arguments of the first job notification.
+
+        Returns:
+            The ``send`` arguments for the combined message, and the first
+            queue item that could not join the batch (``None`` if the
+            window simply expired).
+        """
+        entries: list[tuple[tuple[Any, str], list[dict[str, Any]]]] = [
+            (key, kwargs["blocks"])
+        ]
+        n_blocks = len(kwargs["blocks"])
+        deadline = time.monotonic() + self.batch_window
+        leftover = None
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            item = self.pending.get(timeout=remaining)
+            if item is None:
+                break
+            if item is _STOP or item[0] is None:
+                leftover = item
+                break
+            next_key, next_kwargs = item
+            blocks = next_kwargs["blocks"]
+            if next_key == entries[-1][0]:
+                # Same job and event as the previous entry: newest wins.
+                n_blocks -= len(entries[-1][1])
+                entries[-1] = (next_key, blocks)
+            elif n_blocks + len(blocks) > _MAX_BLOCKS_PER_MESSAGE:
+                leftover = item
+                break
+            else:
+                entries.append((next_key, blocks))
+            n_blocks += len(blocks)
+
+        if len(entries) == 1:
+            return {**kwargs, "blocks": entries[0][1]}, leftover
+        return {
+            "text": _TITLE_JOB_UPDATES,
+            "blocks": [block for _key, blocks in entries for block in blocks],
+        }, leftover
+
+    def _send(self, **kwargs: Any) -> None:
+        # Runs on the sender thread: nobody is waiting on the result, so a
+        # failed post is logged here instead of vanishing silently.
+        try:
+            self.client.send(**kwargs)
+        except Exception as exc:
+            _logger.warning(f"Slack webhook send failed: {exc}")
+
+
+# Senders whose thread is still running; a sender lives as long as its thread.
+_SENDERS: weakref.WeakSet[_Sender] = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_senders() -> None:
+    """Give every live sender a shared ``_CLOSE_TIMEOUT`` to drain at exit."""
+    deadline = time.monotonic() + _CLOSE_TIMEOUT
+    for sender in list(_SENDERS):
+        sender.stop(max(0.0, deadline - time.monotonic()))
+
 
 class SlackCallback(Callback):
-    """Callback that sends notifications to Slack via webhook."""
+    """Callback that sends notifications to Slack via webhook.
+
+    Webhook posts are queued and delivered by a single background thread
+    so the caller (the job monitor / workflow runner) never blocks on the
+    Slack round-trip; the sender posts through the process-wide keep-alive
+    client for the webhook URL, shared with other callbacks and the
+    delivery adapter. Pending sends are flushed by :meth:`close` and, for
+    callbacks never closed, at interpreter exit.
+
+    The sender is paced by a token bucket (Slack webhooks allow roughly one
+    message per second). The queue is bounded: when it is full the oldest
+    pending notification is dropped and counted in ``dropped_total``, and a
+    job event that is already waiting at the tail of the queue is replaced
+    in place instead of being queued twice.
+
+    Identical job notifications (same job, event and message) sent again
+    within ``dedup_ttl`` seconds are suppressed, so a monitor that re-polls
+    a steady-state job does not re-post the same block every cycle.
+
+    Job notifications arriving within ``batch_window`` seconds of each other
+    are combined into one message (up to Slack's 50-block limit), so a burst
+    of state changes costs one post instead of one per job. Workflow,
+    resource and report notifications are never batched and flush any
+    pending batch ahead of them.
+    """
 
-    def __init__(self, webhook_url: str):
+    def __init__(
+        self,
+        webhook_url: str,
+        rate_per_sec: float = 1.0,
+        burst: int = 10,
+        max_queue: int = 512,
+        dedup_ttl: float = 300.0,
+        batch_window: float = 0.5,
+    ):
         """Initialize Slack callback.
 
         Args:
             webhook_url: Slack webhook URL for sending notifications.
+            rate_per_sec: Sustained number of webhook posts allowed per second.
+            burst: Maximum number of posts allowed back-to-back.
+            max_queue: Maximum number of notifications waiting to be sent.
+            dedup_ttl: Seconds during which an identical job notification
+                is not sent again.
+            batch_window: Seconds to wait for further job notifications
+                to combine into the same message; ``0`` disables batching.
 
         Raises:
             ValueError: If webhook_url is not a valid Slack webhook URL.
@@ -42,18 +341,75 @@ class SlackCallback(Callback):
             raise ValueError(
                 "Invalid Slack webhook URL. Must be https://hooks.slack.com/services/..."
             )
-        self.client = WebhookClient(webhook_url)
+        self.client = shared_webhook_client(webhook_url)
         self.formatter = SlackNotificationFormatter()
+        self._pending = _PendingQueue(max_queue)
+        self.dropped_total = 0
+        self._dropped_lock = threading.Lock()
+        self._recent: OrderedDict[tuple[Any, ...], float] = OrderedDict()
+        self._recent_lock = threading.Lock()
+        self._dedup_ttl = dedup_ttl
+        sender = _Sender(
+            self.client, self._pending, _TokenBucket(rate_per_sec, burst), batch_window
+        )
+        self._sender = sender
+        self._worker = sender.thread
+        # A collected callback lets its sender finish the queue and exit;
+        # unlike a bound-method ``atexit`` handler this keeps nothing alive.
+        weakref.finalize(self, sender.request_stop).atexit = False
+
+    def close(self, timeout: float | None = _CLOSE_TIMEOUT) -> None:
+        """Flush pending notifications and stop the sender thread.
+
+        Args:
+            timeout: Seconds to wait for the queue to drain. The sender is a
+                daemon thread, so anything still pending after this is lost
+                at interpreter exit.
+        """
+        self._sender.stop(timeout)
+
+    def _submit(
+        self, *, coalesce_key: tuple[Any, str] | None = None, **kwargs: Any
+    ) -> None:
+        """Queue a ``client.send`` call for the sender thread.
+
+        Args:
+            coalesce_key: ``(job_id, event)`` identifying the notification.
+                If the most recently queued item has the same key it is
+                replaced rather than queued again.
+            **kwargs: Arguments forwarded to ``WebhookClient.send``.
+        """
+        if self._pending.put(coalesce_key, kwargs):
+            with self._dropped_lock:
+                self.dropped_total += 1
+            _logger.warning("Slack notification queue full, dropped oldest message")
+
+    def _seen_recently(self, key: tuple[Any, ...]) -> bool:
+        """Record ``key`` and report whether it was already sent within the TTL."""
+        now = time.monotonic()
+        with self._recent_lock:
+            # Entries are inserted in time order, so expired ones are at the front.
+            while self._recent:
+                oldest, sent_at = next(iter(self._recent.items()))
+                if now - sent_at <= self._dedup_ttl:
+                    break
+                del self._recent[oldest]
+            if key in self._recent:
+                return True
+            self._recent[key] = now
+            if len(self._recent) > _DEDUP_MAX_ENTRIES:
+                self._recent.popitem(last=False)
+        return False
 
     @staticmethod
     def _is_valid_slack_webhook(url: str) -> bool:
         """Validate Slack webhook URL format.
 
         Format: ``https://hooks.slack.com/services/WORKSPACE_ID/CHANNEL_ID/TOKEN``
-        — exactly 3 path segments after ``/services/``.
+        — exactly 3 path segments after ``/services/``. Uses the shared
+        precompiled pattern from :mod:`~srunx.observability.notifications.sanitize`.
         """
-        pattern = r"^https://hooks\.slack\.com/services/[A-Za-z0-9_-]+/[A-Za-z0-9_-]+/[A-Za-z0-9_-]+$"
-        return re.match(pattern, url) is not None
+        return is_valid_slack_webhook_url(url)
 
     @staticmethod
     def _sanitize_text(text: str) -> str:
@@ -64,62 +420,53 @@ class SlackCallback(Callback):
         implementation. Kept as a ``@staticmethod`` wrapper for backward
         compatibility with existing call sites and tests.
         """
-        from srunx.observability.notifications.sanitize import sanitize_slack_text
-
         return sanitize_slack_text(text)
 
+    def _send_job_event(
+        self, job: JobType, title: str, message: str | None = None
+    ) -> None:
+        """Send a job notification; the single path for every ``on_job_*`` hook.
+
+        Args:
+            job: Job the event is about.
+            title: Fallback text, also used as the event key for
+                de-duplication and coalescing.
+            message: Pre-rendered mrkdwn; defaults to the sanitized
+                :func:`~srunx.utils.job_status_msg` line.
+        """
+        if message is None:
+            message = f"`{self._sanitize_text(job_status_msg(job))}`"
+        blocks = _mrkdwn_block(message)
+        digest = hashlib.blake2b(str(blocks).encode(), digest_size=8).digest()
+        if self._seen_recently((job.job_id, title, digest)):
+            return
+        self._submit(coalesce_key=(job.job_id, title), text=title, blocks=blocks)
+
     def on_job_submitted(self, job: JobType) -> None:
         safe_name = self._sanitize_text(job.name)
-        self.client.send(
-            text="Job submitted",
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"`⚡ {'SUBMITTED':<12} Job {safe_name:<12} (ID: {job.job_id})`",
-                    },
-                }
-            ],
-        )
-
-    def _send_job_status(self, job: JobType, label: str) -> None:
-        safe_message = self._sanitize_text(job_status_msg(job))
-        self.client.send(
-            text=label,
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": f"`{safe_message}`"},
-                }
-            ],
+        self._send_job_event(
+            job,
+            _TITLE_JOB_SUBMITTED,
+            f"{_SUBMIT_PREFIX}{safe_name:<12} (ID: {job.job_id})`",
         )
 
     def on_job_completed(self, job: JobType) -> None:
-        self._send_job_status(job, "Job completed")
+        self._send_job_event(job, _TITLE_JOB_COMPLETED)
 
     def on_job_failed(self, job: JobType) -> None:
-        self._send_job_status(job, "Job failed")
+        self._send_job_event(job, _TITLE_JOB_FAILED)
 
     def on_job_running(self, job: JobType) -> None:
-        self._send_job_status(job, "Job running")
+        self._send_job_event(job, _TITLE_JOB_RUNNING)
 
     def on_job_cancelled(self, job: JobType) -> None:
-        self._send_job_status(job, "Job cancelled")
+        self._send_job_event(job, _TITLE_JOB_CANCELLED)
 
     def on_workflow_completed(self, workflow: Workflow) -> None:
         safe_name = self._sanitize_text(workflow.name)
-        self.client.send(
-            text="Workflow completed",
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"🎉 Workflow {safe_name} completed🎉",
-                    },
-                }
-            ],
+        self._submit(
+            text=_TITLE_WORKFLOW_COMPLETED,
+            blocks=_mrkdwn_block(f"🎉 Workflow {safe_name} completed🎉"),
         )
 
     def on_resources_available(self, snapshot: ResourceSnapshot) -> None:
@@ -131,14 +478,9 @@ class SlackCallback(Callback):
             total_nodes=snapshot.nodes_total,
             utilization=snapshot.gpu_utilization * 100,
         )
-        self.client.send(
-            text="Resources available",
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": message},
-                }
-            ],
+        self._submit(
+            text=_TITLE_RESOURCES_AVAILABLE,
+            blocks=_mrkdwn_block(message),
         )
 
     def on_resources_exhausted(self, snapshot: ResourceSnapshot) -> None:
@@ -147,35 +489,33 @@ class SlackCallback(Callback):
             partition_info = f" on {safe_partition}"
         else:
             partition_info = ""
-        self.client.send(
-            text="Resources exhausted",
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {
-                        "type": "mrkdwn",
-                        "text": f"⚠️ Resources exhausted{partition_info}: {snapshot.gpus_available} GPU(s) free (threshold not met)",
-                    },
-                }
-            ],
+        self._submit(
+            text=_TITLE_RESOURCES_EXHAUSTED,
+            blocks=_mrkdwn_block(
+                f"⚠️ Resources exhausted{partition_info}: {snapshot.gpus_available} GPU(s) free (threshold not met)"
+            ),
         )
 
     def on_scheduled_report(self, report: Report) -> None:
-        from loguru import logger
-
         if report.running_jobs:
-            logger.info(
+            _logger.info(
                 f"Adding running jobs section with {len(report.running_jobs)} jobs"
             )
         else:
-            logger.info("No running jobs to display in report")
+            _logger.info("No running jobs to display in report")
 
-        job_stats_dict = report.job_stats.model_dump() if report.job_stats else None
+        job_stats_dict = (
+            report.job_stats.model_dump(include=_JOB_STATS_FIELDS)
+            if report.job_stats
+            else None
+        )
         resource_stats_dict = (
-            report.resource_stats.model_dump() if report.resource_stats else None
+            report.resource_stats.model_dump(include=_RESOURCE_STATS_FIELDS)
+            if report.resource_stats
+            else None
         )
         running_jobs_list = (
-            [job.model_dump() for job in report.running_jobs]
+            [job.model_dump(include=_RUNNING_JOB_FIELDS) for job in report.running_jobs]
             if report.running_jobs
             else None
         )
@@ -187,12 +527,7 @@ class SlackCallback(Callback):
             timestamp=report.timestamp,
         )
 
-        self.client.send(
-            text="SLURM Status Report",
-            blocks=[
-                {
-                    "type": "section",
-                    "text": {"type": "mrkdwn", "text": message},
-                }
-            ],
+        self._submit(
+            text=_TITLE_STATUS_REPORT,
+            blocks=_mrkdwn_block(message),
         )
@@ -7,20 +7,55 @@ so both the CLI-side ``SlackCallback`` and the new
 
 from __future__ import annotations
 
+import functools
 import re
+import string
 
 # Canonical Slack Incoming Webhook URL pattern. Shared by the Web endpoint
 # router (create/update), the delivery adapter (send time), and the config
 # bootstrap migration so every path that stores or POSTs a webhook applies the
 # same anti-SSRF check.
 SLACK_WEBHOOK_URL_RE = re.compile(
-    r"^https://hooks\.slack\.com/services/[A-Za-z0-9_-]+/[A-Za-z0-9_-]+/[A-Za-z0-9_-]+$"
+    r"^https://hooks\.slack\.com/services/[A-Za-z0-9_-]+/[A-Za-z0-9_-]+/[A-Za-z0-9_-]+$",
+    re.ASCII,
 )
 
+# Plain-string form of ``SLACK_WEBHOOK_URL_RE`` used by
+# :func:`is_valid_slack_webhook_url`; avoids a regex match per validation.
+_WEBHOOK_PREFIX = "https://hooks.slack.com/services/"
+_WEBHOOK_SEGMENT_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+
 
 def is_valid_slack_webhook_url(url: object) -> bool:
     """Return True iff ``url`` is a well-formed Slack Incoming Webhook URL."""
-    return isinstance(url, str) and SLACK_WEBHOOK_URL_RE.match(url) is not None
+    if not isinstance(url, str) or not url.startswith(_WEBHOOK_PREFIX):
+        return False
+    parts = url[len(_WEBHOOK_PREFIX) :].split("/")
+    return len(parts) == 3 and all(
+        part and _WEBHOOK_SEGMENT_CHARS.issuperset(part) for part in parts
+    )
+
+
+# Every substitution is applied in one regex pass: the engine scans runs of
+# ordinary characters in C and only calls back on a match, which beats a
+# per-character ``str.translate`` dict lookup on typical (mostly plain) names.
+# A single pass also means ``&`` can never be double-escaped.
+_ESCAPES = {
+    "\n": " ",  # Remove or replace control characters
+    "\r": " ",
+    "\t": " ",
+    "&": "&amp;",  # HTML entity escape
+    "<": "&lt;",  # Prevent HTML/script tag injection
+    ">": "&gt;",  # Prevent HTML/script tag injection
+    "`": "'",  # Prevent code block injection
+    "*": "\\*",  # Escape markdown bold
+    "_": "\\_",  # Escape markdown italic
+    "~": "\\~",  # Escape markdown strikethrough
+    "[": "\\[",  # Escape markdown link syntax
+    "]": "\\]",  # Escape markdown link syntax
+}
+_ESCAPE_RE = re.compile("[" + re.escape("".join(_ESCAPES)) + "]")
+_MAX_LENGTH = 1000
 
 
 def sanitize_slack_text(text: str) -> str:
@@ -36,28 +71,25 @@ def sanitize_slack_text(text: str) -> str:
         Sanitized text with special characters escaped and control
         characters removed.
     """
-    # Remove or replace control characters
-    text = text.replace("\n", " ").replace("\r", " ").replace("\t", " ")
-
-    # Escape special characters that could enable injection attacks
-    # Note: & must be first to avoid double-escaping
-    replacements = {
-        "&": "&amp;",  # HTML entity escape (must be first)
-        "<": "&lt;",  # Prevent HTML/script tag injection
-        ">": "&gt;",  # Prevent HTML/script tag injection
-        "`": "'",  # Prevent code block injection
-        "*": "\\*",  # Escape markdown bold
-        "_": "\\_",  # Escape markdown italic
-        "~": "\\~",  # Escape markdown strikethrough
-        "[": "\\[",  # Escape markdown link syntax
-        "]": "\\]",  # Escape markdown link syntax
-    }
-    for char, replacement in replacements.items():
-        text = text.replace(char, replacement)
+    # Every escape maps one character to at least one, so only the first
+    # _MAX_LENGTH + 1 input characters can reach the output (the extra one
+    # decides whether "..." is appended). Cut before escaping so a huge
+    # message (e.g. a traceback) costs O(_MAX_LENGTH), not O(len(text)),
+    # and never becomes a cache key.
+    return _sanitize_bounded(text[: _MAX_LENGTH + 1])
+
+
+@functools.lru_cache(maxsize=1024)
+def _sanitize_bounded(text: str) -> str:
+    """Escape *text* (at most ``_MAX_LENGTH + 1`` characters) and cap its length.
+
+    Memoized because monitors re-sanitize the same job / workflow names on
+    every poll; the bounded input keeps each cache entry small.
+    """
+    text = _ESCAPE_RE.sub(lambda m: _ESCAPES[m.group()], text)
 
     # Limit length to prevent message overflow
-    max_length = 1000
-    if len(text) > max_length:
-        text = text[:max_length] + "..."
+    if len(text) > _MAX_LENGTH:
+        text = text[:_MAX_LENGTH] + "..."
 
     return text
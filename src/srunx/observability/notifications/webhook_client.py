@@ -0,0 +1,178 @@
+"""Keep-alive transport for Slack Incoming Webhooks.
+
+:class:`slack_sdk.WebhookClient` posts through ``urllib.request.urlopen``,
+which opens a new connection — and pays a new TLS handshake — for every
+message. :class:`KeepAliveWebhookClient` swaps only that transport hook
+for a persistent :mod:`http.client` connection, so successive
+notifications to the same webhook reuse one socket while the SDK keeps
+building the body, logging, and running its retry handlers. Unless the
+caller passes its own, those handlers retry transient connection failures
+with a short back-off and honour Slack's ``Retry-After`` on HTTP 429.
+
+:func:`shared_webhook_client` hands out one client per webhook URL for the
+whole process, so every ``SlackCallback`` and the delivery adapter posting
+to the same webhook share a single connection.
+
+``WebhookClient`` exposes no public transport seam, so the override targets
+the private ``_perform_http_request_internal``. ``pyproject.toml`` caps
+``slack-sdk`` below the next untested minor release, and a test asserts the
+SDK still routes sends through that method.
+"""
+
+from __future__ import annotations
+
+import atexit
+import http.client
+import io
+import threading
+from typing import Any
+from urllib.error import HTTPError, URLError
+from urllib.parse import SplitResult, urlsplit
+from urllib.request import Request
+
+from slack_sdk import WebhookClient
+from slack_sdk.errors import SlackRequestError
+from slack_sdk.http_retry import (
+    BackoffRetryIntervalCalculator,
+    ConnectionErrorRetryHandler,
+    RateLimitErrorRetryHandler,
+    RetryHandler,
+)
+from slack_sdk.webhook import WebhookResponse
+
+# Errors raised when a pooled connection was closed by the server while idle.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+
+def _default_retry_handlers() -> list[RetryHandler]:
+    return [
+        ConnectionErrorRetryHandler(
+            max_retry_count=2,
+            interval_calculator=BackoffRetryIntervalCalculator(backoff_factor=0.2),
+        ),
+        RateLimitErrorRetryHandler(max_retry_count=1),
+    ]
+
+
+class KeepAliveWebhookClient(WebhookClient):
+    """``WebhookClient`` that reuses one persistent HTTP(S) connection.
+
+    Thread-safe: requests are serialized on the shared connection. Clients
+    configured with a proxy fall back to the SDK's per-request ``urlopen``.
+    """
+
+    def __init__(self, url: str, **kwargs: Any) -> None:
+        kwargs.setdefault("retry_handlers", _default_retry_handlers())
+        super().__init__(url, **kwargs)
+        self._conn: http.client.HTTPConnection | None = None
+        self._conn_lock = threading.Lock()
+
+    def close(self) -> None:
+        """Close the pooled connection (a later send reopens it)."""
+        with self._conn_lock:
+            self._reset()
+
+    def _reset(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def _connection(self, parts: SplitResult) -> http.client.HTTPConnection:
+        if self._conn is None:
+            if parts.scheme == "https":
+                self._conn = http.client.HTTPSConnection(
+                    parts.netloc, timeout=self.timeout, context=self.ssl
+                )
+            else:
+                self._conn = http.client.HTTPConnection(
+                    parts.netloc, timeout=self.timeout
+                )
+        return self._conn
+
+    def _perform_http_request_internal(self, url: str, req: Request) -> WebhookResponse:
+        if self.proxy is not None:
+            return super()._perform_http_request_internal(url, req)
+
+        parts = urlsplit(url)
+        if parts.scheme not in ("http", "https"):
+            raise SlackRequestError(f"Invalid URL detected: {url}")
+        path = f"{parts.path}?{parts.query}" if parts.query else parts.path
+        headers = dict(req.header_items())
+
+        with self._conn_lock:
+            while True:
+                reused = self._conn is not None
+                conn = self._connection(parts)
+                try:
+                    conn.request("POST", path, body=req.data, headers=headers)
+                    http_resp = conn.getresponse()
+                    raw_body = http_resp.read()
+                    break
+                except _STALE_CONNECTION_ERRORS as exc:
+                    self._reset()
+                    if not reused:
+                        raise URLError(exc) from exc
+                    # The server dropped an idle connection; retry once on
+                    # a fresh one.
+                except TimeoutError:
+                    # Slack may already have accepted the POST; don't let a
+                    # retry handler post it twice.
+                    self._reset()
+                    raise
+                except OSError as exc:
+                    # Wrap socket errors the way urlopen does so the SDK's
+                    # ConnectionErrorRetryHandler recognises them.
+                    self._reset()
+                    raise URLError(exc) from exc
+                except Exception:
+                    self._reset()
+                    raise
+            if http_resp.will_close:
+                self._reset()
+
+        if http_resp.status >= 400:
+            # Surface errors the way urlopen does so the SDK's retry
+            # handlers (429 back-off etc.) still see an HTTPError.
+            raise HTTPError(
+                url,
+                http_resp.status,
+                http_resp.reason,
+                http_resp.headers,
+                io.BytesIO(raw_body),
+            )
+
+        charset = http_resp.headers.get_content_charset() or "utf-8"
+        return WebhookResponse(
+            url=url,
+            status_code=http_resp.status,
+            body=raw_body.decode(charset),
+            headers=http_resp.headers,  # type: ignore[arg-type]
+        )
+
+
+_SHARED_CLIENTS: dict[str, KeepAliveWebhookClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def shared_webhook_client(url: str) -> KeepAliveWebhookClient:
+    """Return the process-wide keep-alive client for ``url``."""
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(url)
+        if client is None:
+            client = KeepAliveWebhookClient(url)
+            _SHARED_CLIENTS[url] = client
+        return client
+
+
+@atexit.register
+def close_shared_clients() -> None:
+    """Close and forget every shared client."""
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client in clients:
+        client.close()
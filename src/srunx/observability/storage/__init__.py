@@ -11,7 +11,11 @@ import sqlite3
 from collections.abc import Iterator
 from pathlib import Path
 
-from srunx.observability.storage.connection import init_db, open_connection
+from srunx.observability.storage.connection import (
+    init_db,
+    initialized_connection,
+    open_connection,
+)
 from srunx.observability.storage.repositories.jobs import JobRepository
 
 
@@ -22,8 +26,8 @@ def get_job_repo(
     """Yield a ``(JobRepository, connection)`` pair bound to a fresh conn.
 
     Convenience helper for callers that want a short-lived repository
-    without pulling in FastAPI-style DI. The DB is auto-migrated on first
-    use via ``init_db``.
+    without pulling in FastAPI-style DI. The DB is auto-migrated the first
+    time this process opens it.
 
     Example::
 
@@ -31,12 +35,8 @@ def get_job_repo(
             repo.record_submission(job_id=12345, name="t", status="PENDING",
                                     submission_source="cli")
     """
-    init_db(db_path, delete_legacy=False)
-    conn = open_connection(db_path)
-    try:
+    with initialized_connection(db_path, delete_legacy=False) as conn:
         yield JobRepository(conn), conn
-    finally:
-        conn.close()
 
 
 __all__ = ["JobRepository", "get_job_repo", "init_db", "open_connection"]
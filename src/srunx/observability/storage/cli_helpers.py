@@ -55,7 +55,10 @@ def record_submission_from_job(
             return
 
         from srunx.domain import Job
-        from srunx.observability.storage.connection import initialized_connection
+        from srunx.observability.storage.connection import (
+            initialized_connection,
+            transaction,
+        )
         from srunx.observability.storage.repositories.job_state_transitions import (
             JobStateTransitionRepository,
         )
@@ -71,58 +74,59 @@ def record_submission_from_job(
         else:
             effective_source = "workflow" if workflow_name else "cli"
 
-        with initialized_connection() as conn:
-            resources = getattr(job, "resources", None)
-            environment = getattr(job, "environment", None)
-            command_val: list[str] | None = None
-            if isinstance(job, Job) and job.command is not None:
-                command_val = (
-                    job.command if isinstance(job.command, list) else [str(job.command)]
-                )
-
-            job_repo = JobRepository(conn)
-            row_id = job_repo.record_submission(
-                job_id=int(job.job_id),
-                name=job.name,
-                status=(job._status.value if hasattr(job, "_status") else "PENDING"),
-                submission_source=effective_source,
-                transport_type=transport_type,
-                profile_name=profile_name,
-                scheduler_key=scheduler_key,
-                command=command_val,
-                nodes=getattr(resources, "nodes", None) if resources else None,
-                gpus_per_node=(
-                    getattr(resources, "gpus_per_node", None) if resources else None
-                ),
-                memory_per_node=(
-                    getattr(resources, "memory_per_node", None) if resources else None
-                ),
-                time_limit=(
-                    getattr(resources, "time_limit", None) if resources else None
-                ),
-                partition=(
-                    getattr(resources, "partition", None) if resources else None
-                ),
-                nodelist=(getattr(resources, "nodelist", None) if resources else None),
-                conda=(getattr(environment, "conda", None) if environment else None),
-                venv=(getattr(environment, "venv", None) if environment else None),
-                env_vars=(
-                    getattr(environment, "env_vars", None) if environment else None
-                ),
-                workflow_run_id=workflow_run_id,
+        # Resource / environment fields are read straight from the
+        # models' ``__dict__`` (one lookup each instead of a guarded
+        # ``getattr`` pair); jobs without them record NULLs.
+        resources = getattr(job, "resources", None)
+        environment = getattr(job, "environment", None)
+        res: dict[str, Any] = vars(resources) if resources else {}
+        env: dict[str, Any] = vars(environment) if environment else {}
+        command_val: list[str] | None = None
+        if isinstance(job, Job) and job.command is not None:
+            command_val = (
+                job.command if isinstance(job.command, list) else [str(job.command)]
             )
-            # Seed a baseline transition only when we actually inserted
-            # the row. INSERT OR IGNORE returns 0 when the row already
-            # exists; seeding again would be harmless but produces
-            # noise in the transitions table.
-            if row_id > 0:
-                JobStateTransitionRepository(conn).insert(
+
+        with initialized_connection() as conn:
+            # One IMMEDIATE transaction for the row and its seed transition:
+            # takes the write lock up front and never leaves a job without
+            # its PENDING baseline.
+            with transaction(conn, "IMMEDIATE"):
+                job_repo = JobRepository(conn)
+                row_id = job_repo.record_submission(
                     job_id=int(job.job_id),
-                    from_status=None,
-                    to_status="PENDING",
-                    source="webhook",
+                    name=job.name,
+                    status=(
+                        job._status.value if hasattr(job, "_status") else "PENDING"
+                    ),
+                    submission_source=effective_source,
+                    transport_type=transport_type,
+                    profile_name=profile_name,
                     scheduler_key=scheduler_key,
+                    command=command_val,
+                    nodes=res.get("nodes"),
+                    gpus_per_node=res.get("gpus_per_node"),
+                    memory_per_node=res.get("memory_per_node"),
+                    time_limit=res.get("time_limit"),
+                    partition=res.get("partition"),
+                    nodelist=res.get("nodelist"),
+                    conda=env.get("conda"),
+                    venv=env.get("venv"),
+                    env_vars=env.get("env_vars"),
+                    workflow_run_id=workflow_run_id,
                 )
+                # Seed a baseline transition only when we actually inserted
+                # the row. INSERT OR IGNORE returns 0 when the row already
+                # exists; seeding again would be harmless but produces
+                # noise in the transitions table.
+                if row_id > 0:
+                    JobStateTransitionRepository(conn).insert(
+                        job_id=int(job.job_id),
+                        from_status=None,
+                        to_status="PENDING",
+                        source="webhook",
+                        scheduler_key=scheduler_key,
+                    )
     except Exception as exc:  # noqa: BLE001 — best-effort
         logger.debug(f"record_submission_from_job failed: {exc}")
 
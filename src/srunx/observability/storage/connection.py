@@ -6,7 +6,8 @@ Key invariants enforced here:
 
 - DB path resolution honours ``$XDG_CONFIG_HOME`` with a ``~/.config`` fallback.
 - Every opened connection applies ``foreign_keys=ON``, ``journal_mode=WAL``,
-  and ``busy_timeout=5000``.
+  ``synchronous=NORMAL``, and ``busy_timeout=5000``; :func:`init_db` and
+  :func:`initialized_connection` run ``PRAGMA optimize`` before closing.
 - The DB file is created with mode ``0o600`` and its parent directory with
   mode ``0o700``.
 - :func:`init_db` deletes the legacy ``~/.srunx/history.db`` (or renames it
@@ -19,6 +20,7 @@ import contextlib
 import os
 import sqlite3
 import stat
+import threading
 from collections.abc import Iterator
 from pathlib import Path
 
@@ -29,6 +31,15 @@ logger = get_logger(__name__)
 
 LEGACY_HISTORY_DB_PATH = Path.home() / ".srunx" / "history.db"
 
+# ``schema_version`` row count of each DB file this process has migrated.
+# A file is only trusted as migrated while it still has that many rows, so
+# a deleted-and-recreated DB is initialized again even if it reuses the old
+# inode. Legacy ``history.db`` cleanup is tracked separately because
+# ``delete_legacy=False`` callers migrate without it.
+_MIGRATED: dict[Path, int] = {}
+_LEGACY_CLEANED: set[Path] = set()
+_MIGRATED_LOCK = threading.Lock()
+
 
 def get_config_dir() -> Path:
     """Return the XDG-compliant srunx config directory.
@@ -79,6 +90,27 @@ def _apply_pragmas(conn: sqlite3.Connection) -> None:
             if "database is locked" not in str(exc) or attempt == 9:
                 raise
             _time.sleep(0.05 * (attempt + 1))
+    # Under WAL, NORMAL only syncs at checkpoints: commits stay atomic and
+    # durable across application crashes, and no longer fsync one by one.
+    conn.execute("PRAGMA synchronous = NORMAL")
+    # Keep sort / temp B-trees (stats GROUP BYs) off disk; 8 MiB page cache.
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.execute("PRAGMA cache_size = -8000")
+
+
+def _optimize(conn: sqlite3.Connection) -> None:
+    """Run ``PRAGMA optimize`` so the planner's table statistics track growth.
+
+    SQLite only re-ANALYZEs tables whose size changed enough to matter, and
+    ``analysis_limit`` caps the rows each ANALYZE samples, so this is cheap
+    enough to run before closing a connection. Best-effort: a busy DB just
+    skips it until next time.
+    """
+    try:
+        conn.execute("PRAGMA analysis_limit = 400")
+        conn.execute("PRAGMA optimize")
+    except sqlite3.OperationalError as exc:
+        logger.debug(f"PRAGMA optimize skipped: {exc}")
 
 
 def open_connection(db_path: Path | None = None) -> sqlite3.Connection:
@@ -161,6 +193,12 @@ def _delete_legacy_history_db() -> None:
             )
 
 
+def _clean_legacy_history_db() -> None:
+    _delete_legacy_history_db()
+    with _MIGRATED_LOCK:
+        _LEGACY_CLEANED.add(LEGACY_HISTORY_DB_PATH)
+
+
 def init_db(db_path: Path | None = None, *, delete_legacy: bool = True) -> Path:
     """Initialize the srunx SQLite DB.
 
@@ -181,13 +219,35 @@ def init_db(db_path: Path | None = None, *, delete_legacy: bool = True) -> Path:
     conn = open_connection(path)
     try:
         apply_migrations(conn)
+        (applied,) = conn.execute("SELECT COUNT(*) FROM schema_version").fetchone()
+        _optimize(conn)
     finally:
         conn.close()
+    with _MIGRATED_LOCK:
+        _MIGRATED[path] = applied
     if delete_legacy:
-        _delete_legacy_history_db()
+        _clean_legacy_history_db()
     return path
 
 
+def _already_migrated(conn: sqlite3.Connection, path: Path) -> bool:
+    with _MIGRATED_LOCK:
+        expected = _MIGRATED.get(path)
+    if expected is None:
+        return False
+    try:
+        (applied,) = conn.execute("SELECT COUNT(*) FROM schema_version").fetchone()
+    except sqlite3.OperationalError:
+        # No ``schema_version`` table: the file was replaced since.
+        return False
+    return applied >= expected
+
+
+def _legacy_cleaned() -> bool:
+    with _MIGRATED_LOCK:
+        return LEGACY_HISTORY_DB_PATH in _LEGACY_CLEANED
+
+
 @contextlib.contextmanager
 def initialized_connection(
     db_path: Path | None = None,
@@ -198,13 +258,21 @@ def initialized_connection(
 
     Encapsulates ``init_db(...) + open_connection(path)`` so callers can
     treat the connection as "ready to query" without knowing about
-    migrations. Idempotent: ``apply_migrations`` early-returns when the
-    schema is already at the target version, so repeated use from hot
-    paths is safe.
+    migrations. ``init_db`` runs only the first time a given DB file is
+    seen in this process; later calls open a single connection and only
+    count ``schema_version`` rows to confirm the file was not replaced,
+    which is what keeps per-job recording from the CLI / monitor hot paths
+    cheap. ``PRAGMA optimize`` runs before the connection closes.
     """
-    path = init_db(db_path, delete_legacy=delete_legacy)
+    path = db_path or get_db_path()
     conn = open_connection(path)
     try:
+        if not _already_migrated(conn, path):
+            init_db(path, delete_legacy=delete_legacy)
+        elif delete_legacy and not _legacy_cleaned():
+            # Migrated by a ``delete_legacy=False`` caller earlier on.
+            _clean_legacy_history_db()
         yield conn
     finally:
+        _optimize(conn)
         conn.close()
@@ -575,6 +575,61 @@ CREATE INDEX idx_jobs_scheduler_key   ON jobs(scheduler_key);
 """
 
 
+# v7: covering indexes for the jobs aggregates. ``compute_stats`` (Web
+# ``/api/history`` summary) filters on a ``submitted_at`` range and reads
+# only status / duration / GPU columns; ``count_by_status_in_range`` (the
+# scheduled report) filters ``status IN (...)`` plus a ``completed_at``
+# range, which had no index and read every matching-status row. With
+# these every stats query is an index-only range scan.
+SCHEMA_V7_JOBS_STATS_INDEXES = """
+CREATE INDEX IF NOT EXISTS idx_jobs_stats_cover
+    ON jobs(submitted_at, status, duration_secs, gpus_per_node, nodes);
+CREATE INDEX IF NOT EXISTS idx_jobs_status_completed_at
+    ON jobs(status, completed_at);
+"""
+
+
+# v8: per-day rollup of the jobs aggregates read by ``compute_stats``.
+# One row per (submission day, scheduler_key, status) holding the job
+# count plus the partial sums behind the duration average and GPU hours,
+# so whole-day stats ranges read a few rows per day instead of every job.
+# ``JobRepository`` keeps it in step with every insert / status update /
+# delete; the INSERT below backfills the rows that already exist.
+SCHEMA_V8_JOBS_DAILY_ROLLUP = """
+CREATE TABLE jobs_daily_rollup (
+    day            TEXT NOT NULL,
+    scheduler_key  TEXT NOT NULL,
+    status         TEXT NOT NULL,
+    job_count      INTEGER NOT NULL DEFAULT 0,
+    duration_sum   INTEGER NOT NULL DEFAULT 0,
+    duration_count INTEGER NOT NULL DEFAULT 0,
+    gpu_secs       INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, scheduler_key, status)
+) WITHOUT ROWID;
+
+INSERT INTO jobs_daily_rollup (
+    day, scheduler_key, status,
+    job_count, duration_sum, duration_count, gpu_secs
+)
+SELECT substr(submitted_at, 1, 10), scheduler_key, status,
+       COUNT(*),
+       COALESCE(SUM(duration_secs), 0),
+       COUNT(duration_secs),
+       COALESCE(SUM(CASE WHEN gpus_per_node IS NOT NULL
+                    THEN duration_secs * gpus_per_node * nodes END), 0)
+    FROM jobs
+    GROUP BY substr(submitted_at, 1, 10), scheduler_key, status;
+"""
+
+
+# v9: drop the single-column status index. ``status`` has a handful of
+# distinct values, and v7's ``idx_jobs_status_completed_at`` leads with
+# it, so any status lookup the planner wants an index for still has one;
+# meanwhile every jobs insert / status update paid to maintain both.
+SCHEMA_V9_DROP_JOBS_STATUS_INDEX = """
+DROP INDEX IF EXISTS idx_jobs_status;
+"""
+
 # ---------------------------------------------------------------------------
 # Migration registry
 # ---------------------------------------------------------------------------
@@ -629,6 +684,24 @@ MIGRATIONS: list[Migration] = [
         sql=SCHEMA_V6,
         requires_fk_off=True,
     ),
+    Migration(
+        version=7,
+        name="v7_jobs_stats_indexes",
+        sql=SCHEMA_V7_JOBS_STATS_INDEXES,
+        requires_fk_off=False,
+    ),
+    Migration(
+        version=8,
+        name="v8_jobs_daily_rollup",
+        sql=SCHEMA_V8_JOBS_DAILY_ROLLUP,
+        requires_fk_off=False,
+    ),
+    Migration(
+        version=9,
+        name="v9_drop_jobs_status_index",
+        sql=SCHEMA_V9_DROP_JOBS_STATUS_INDEX,
+        requires_fk_off=False,
+    ),
 ]
 
 
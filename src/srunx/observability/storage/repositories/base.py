@@ -56,7 +56,9 @@ def _maybe_json_dump(value: Any) -> str | None:
         return None
     if isinstance(value, str):
         return value
-    return json.dumps(value)
+    # Compact separators: these blobs are only ever read back by
+    # ``_maybe_json_load``, never by a human.
+    return json.dumps(value, separators=(",", ":"))
 
 
 class BaseRepository:
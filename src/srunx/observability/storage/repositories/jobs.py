@@ -8,10 +8,101 @@ P2-4 #A cutover) with a narrower, typed API.
 from __future__ import annotations
 
 import sqlite3
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from typing import Any
 
+from srunx.observability.storage.connection import transaction
 from srunx.observability.storage.models import Job, SubmissionSource, TransportType
-from srunx.observability.storage.repositories.base import BaseRepository, now_iso
+from srunx.observability.storage.repositories.base import (
+    BaseRepository,
+    _parse_dt,
+    now_iso,
+)
+
+_INSERT_JOB_SQL = """
+INSERT OR IGNORE INTO jobs (
+    job_id, transport_type, profile_name, scheduler_key,
+    name, command, status,
+    nodes, gpus_per_node, memory_per_node, time_limit,
+    partition, nodelist,
+    conda, venv, container, env_vars,
+    submitted_at,
+    workflow_run_id, submission_source,
+    log_file, metadata
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Columns that feed the ``jobs_daily_rollup`` (v8) aggregates.
+_ROLLUP_COLUMNS = "submitted_at, status, duration_secs, gpus_per_node, nodes"
+
+_SELECT_ROLLUP_SQL = (
+    f"SELECT {_ROLLUP_COLUMNS} FROM jobs WHERE scheduler_key = ? AND job_id = ?"
+)
+
+_UPSERT_ROLLUP_SQL = """
+INSERT INTO jobs_daily_rollup (
+    day, scheduler_key, status,
+    job_count, duration_sum, duration_count, gpu_secs
+) VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (day, scheduler_key, status) DO UPDATE SET
+    job_count = job_count + excluded.job_count,
+    duration_sum = duration_sum + excluded.duration_sum,
+    duration_count = duration_count + excluded.duration_count,
+    gpu_secs = gpu_secs + excluded.gpu_secs
+"""
+
+# ``compute_stats`` results, keyed by database file and query range.
+# Repositories are built per request, so the cache lives at module level;
+# every write through ``JobRepository`` clears it once committed and the
+# TTL bounds how stale it can get when another process (CLI, poller) or
+# raw SQL writes the jobs.
+_STATS_TTL_SECONDS = 30.0
+_STATS_CACHE: dict[
+    tuple[str, str | None, str | None, str | None], tuple[float, dict[str, Any]]
+] = {}
+_STATS_CACHE_LOCK = threading.Lock()
+# Bumped on every invalidation: a ``compute_stats`` that raced a commit
+# must not store what it read before it.
+_stats_generation = 0
+# Connections whose jobs write joined a caller's transaction that may not
+# have committed yet; the cache is bypassed until each one's ends.
+_UNCOMMITTED_CONNS: set[sqlite3.Connection] = set()
+
+
+def _invalidate_stats_cache_locked() -> None:
+    global _stats_generation
+    _STATS_CACHE.clear()
+    _stats_generation += 1
+
+
+def _invalidate_stats_cache(conn: sqlite3.Connection) -> None:
+    """Drop cached stats after a jobs write on ``conn``.
+
+    Call once the write is done. If it joined a caller's transaction the
+    cache is invalidated again when that transaction ends.
+    """
+    with _STATS_CACHE_LOCK:
+        _invalidate_stats_cache_locked()
+        if conn.in_transaction:
+            _UNCOMMITTED_CONNS.add(conn)
+        _prune_uncommitted_locked()
+
+
+def _prune_uncommitted_locked() -> bool:
+    """Forget connections whose transaction ended; return whether any remain."""
+    for conn in list(_UNCOMMITTED_CONNS):
+        try:
+            pending = conn.in_transaction
+        except sqlite3.ProgrammingError:  # closed
+            pending = False
+        if not pending:
+            _UNCOMMITTED_CONNS.discard(conn)
+            _invalidate_stats_cache_locked()
+    return bool(_UNCOMMITTED_CONNS)
+
 
 # Validate that the (transport_type, profile_name, scheduler_key) triple
 # matches the V5 CHECK constraint on the ``jobs`` table. Raising here
@@ -20,6 +111,10 @@ from srunx.observability.storage.repositories.base import BaseRepository, now_is
 _SCHEDULER_KEY_LOCAL = "local"
 
 
+def _copy_stats(stats: dict[str, Any]) -> dict[str, Any]:
+    return {**stats, "jobs_by_status": dict(stats["jobs_by_status"])}
+
+
 def _validate_transport_triple(
     transport_type: TransportType,
     profile_name: str | None,
@@ -99,6 +194,9 @@ class JobRepository(BaseRepository):
         "log_file",
         "metadata",
     )
+    # Built once so every read passes sqlite3 the same SQL text and hits
+    # the connection's prepared-statement cache.
+    _SELECT_SQL = f"SELECT {', '.join(_COLUMNS)} FROM jobs"
 
     def record_submission(
         self,
@@ -154,50 +252,46 @@ class JobRepository(BaseRepository):
         _validate_transport_triple(transport_type, profile_name, scheduler_key)
 
         submitted_at = submitted_at or now_iso()
-        cur = self.conn.execute(
-            """
-            INSERT OR IGNORE INTO jobs (
-                job_id, transport_type, profile_name, scheduler_key,
-                name, command, status,
-                nodes, gpus_per_node, memory_per_node, time_limit,
-                partition, nodelist,
-                conda, venv, container, env_vars,
-                submitted_at,
-                workflow_run_id, submission_source,
-                log_file, metadata
-            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """,
-            (
-                job_id,
-                transport_type,
-                profile_name,
-                scheduler_key,
-                name,
-                self._encode_json(command),
-                status,
-                nodes,
-                gpus_per_node,
-                memory_per_node,
-                time_limit,
-                partition,
-                nodelist,
-                conda,
-                venv,
-                container,
-                self._encode_json(env_vars),
-                submitted_at,
-                workflow_run_id,
-                submission_source,
-                log_file,
-                self._encode_json(metadata),
-            ),
+        # Encode the JSON columns before taking the write lock.
+        params = (
+            job_id,
+            transport_type,
+            profile_name,
+            scheduler_key,
+            name,
+            self._encode_json(command),
+            status,
+            nodes,
+            gpus_per_node,
+            memory_per_node,
+            time_limit,
+            partition,
+            nodelist,
+            conda,
+            venv,
+            container,
+            self._encode_json(env_vars),
+            submitted_at,
+            workflow_run_id,
+            submission_source,
+            log_file,
+            self._encode_json(metadata),
         )
+        with self._write():
+            cur = self.conn.execute(_INSERT_JOB_SQL, params)
+            if cur.rowcount:
+                self._bump_rollup(
+                    scheduler_key,
+                    (submitted_at, status, None, gpus_per_node, nodes),
+                    1,
+                )
         # ``lastrowid`` is only meaningful when rowcount > 0. SQLite (and
         # the Python driver) preserve the prior successful rowid from the
         # same connection across an IGNORE no-op, so relying on it would
         # make duplicates look like fresh inserts. Gate on rowcount.
         if cur.rowcount == 0:
             return 0
+        _invalidate_stats_cache(self.conn)
         return int(cur.lastrowid or 0)
 
     def update_status(
@@ -220,27 +314,15 @@ class JobRepository(BaseRepository):
         target the local-SLURM row when they meant an SSH transport.
         Pass ``scheduler_key='local'`` explicitly for local SLURM.
         """
-        sets: list[str] = ["status = ?"]
-        vals: list[Any] = [status]
-        if started_at is not None:
-            sets.append("started_at = ?")
-            vals.append(started_at)
-        if completed_at is not None:
-            sets.append("completed_at = ?")
-            vals.append(completed_at)
-        if duration_secs is not None:
-            sets.append("duration_secs = ?")
-            vals.append(duration_secs)
-        if nodelist is not None:
-            sets.append("nodelist = ?")
-            vals.append(nodelist)
-        vals.extend([scheduler_key, job_id])
-
-        cur = self.conn.execute(
-            f"UPDATE jobs SET {', '.join(sets)} WHERE scheduler_key = ? AND job_id = ?",
-            vals,
+        return self._update(
+            job_id,
+            status,
+            scheduler_key=scheduler_key,
+            started_at=started_at,
+            completed_at=completed_at,
+            duration_secs=duration_secs,
+            nodelist=nodelist,
         )
-        return cur.rowcount > 0
 
     def update_completion(
         self,
@@ -259,27 +341,77 @@ class JobRepository(BaseRepository):
         the local row for SSH transports.
         """
         completed_at = completed_at or now_iso()
-        row = self.conn.execute(
-            "SELECT submitted_at FROM jobs WHERE scheduler_key = ? AND job_id = ?",
-            (scheduler_key, job_id),
-        ).fetchone()
-        duration: int | None = None
-        if row is not None:
-            from srunx.observability.storage.repositories.base import _parse_dt
-
-            submitted = _parse_dt(row["submitted_at"])
-            done = _parse_dt(completed_at)
-            if submitted and done:
-                duration = int((done - submitted).total_seconds())
-
-        return self.update_status(
+        return self._update(
             job_id,
             status,
             scheduler_key=scheduler_key,
             completed_at=completed_at,
-            duration_secs=duration,
+            duration_until=completed_at,
         )
 
+    def _update(
+        self,
+        job_id: int,
+        status: str,
+        *,
+        scheduler_key: str,
+        started_at: str | None = None,
+        completed_at: str | None = None,
+        duration_secs: int | None = None,
+        nodelist: str | None = None,
+        duration_until: str | None = None,
+    ) -> bool:
+        """Shared body of :meth:`update_status` / :meth:`update_completion`.
+
+        The row read that feeds the rollup also supplies ``submitted_at``,
+        so ``duration_until`` (a completion timestamp) is turned into
+        ``duration_secs`` without a second lookup.
+        """
+        with self._write():
+            before = self.conn.execute(
+                _SELECT_ROLLUP_SQL, (scheduler_key, job_id)
+            ).fetchone()
+            if before is None:
+                return False
+            if duration_until is not None:
+                submitted = _parse_dt(before["submitted_at"])
+                done = _parse_dt(duration_until)
+                if submitted and done:
+                    duration_secs = int((done - submitted).total_seconds())
+
+            sets: list[str] = ["status = ?"]
+            vals: list[Any] = [status]
+            if started_at is not None:
+                sets.append("started_at = ?")
+                vals.append(started_at)
+            if completed_at is not None:
+                sets.append("completed_at = ?")
+                vals.append(completed_at)
+            if duration_secs is not None:
+                sets.append("duration_secs = ?")
+                vals.append(duration_secs)
+            if nodelist is not None:
+                sets.append("nodelist = ?")
+                vals.append(nodelist)
+            vals.extend([scheduler_key, job_id])
+            self.conn.execute(
+                f"UPDATE jobs SET {', '.join(sets)} WHERE scheduler_key = ? AND job_id = ?",
+                vals,
+            )
+
+            after = (
+                before["submitted_at"],
+                status,
+                before["duration_secs"] if duration_secs is None else duration_secs,
+                before["gpus_per_node"],
+                before["nodes"],
+            )
+            if tuple(before) != after:
+                self._bump_rollup(scheduler_key, tuple(before), -1)
+                self._bump_rollup(scheduler_key, after, 1)
+        _invalidate_stats_cache(self.conn)
+        return True
+
     def get(self, job_id: int, *, scheduler_key: str) -> Job | None:
         """Return the jobs row for ``(scheduler_key, job_id)``.
 
@@ -290,8 +422,7 @@ class JobRepository(BaseRepository):
         already has ``jobs.id``.
         """
         row = self.conn.execute(
-            f"SELECT {', '.join(self._COLUMNS)} FROM jobs "
-            "WHERE scheduler_key = ? AND job_id = ?",
+            self._SELECT_SQL + " WHERE scheduler_key = ? AND job_id = ?",
             (scheduler_key, job_id),
         ).fetchone()
         return self._row_to_model(row, Job)
@@ -305,7 +436,7 @@ class JobRepository(BaseRepository):
         directly instead of the SLURM ``job_id``.
         """
         row = self.conn.execute(
-            f"SELECT {', '.join(self._COLUMNS)} FROM jobs WHERE id = ?",
+            self._SELECT_SQL + " WHERE id = ?",
             (row_id,),
         ).fetchone()
         return self._row_to_model(row, Job)
@@ -317,7 +448,7 @@ class JobRepository(BaseRepository):
         offset: int = 0,
         workflow_run_id: int | None = None,
     ) -> list[Job]:
-        sql = f"SELECT {', '.join(self._COLUMNS)} FROM jobs"
+        sql = self._SELECT_SQL
         params: list[Any] = []
         if workflow_run_id is not None:
             sql += " WHERE workflow_run_id = ?"
@@ -384,11 +515,57 @@ class JobRepository(BaseRepository):
         ``scheduler_key`` is required (SF5). Pass ``'local'`` explicitly
         for local SLURM.
         """
-        cur = self.conn.execute(
-            "DELETE FROM jobs WHERE scheduler_key = ? AND job_id = ?",
-            (scheduler_key, job_id),
+        with self._write():
+            row = self.conn.execute(
+                "DELETE FROM jobs WHERE scheduler_key = ? AND job_id = ? "
+                f"RETURNING {_ROLLUP_COLUMNS}",
+                (scheduler_key, job_id),
+            ).fetchone()
+            if row is None:
+                return False
+            self._bump_rollup(scheduler_key, tuple(row), -1)
+        _invalidate_stats_cache(self.conn)
+        return True
+
+    @contextmanager
+    def _write(self) -> Iterator[None]:
+        """Run a jobs write and its rollup update atomically.
+
+        Joins the caller's transaction when one is open; otherwise opens
+        an IMMEDIATE one so the read-then-write in :meth:`update_status`
+        never has to upgrade its lock.
+        """
+        if self.conn.in_transaction:
+            yield
+        else:
+            with transaction(self.conn, "IMMEDIATE"):
+                yield
+
+    def _bump_rollup(
+        self, scheduler_key: str, values: tuple[Any, ...], sign: int
+    ) -> None:
+        """Add (``sign=1``) or remove (``-1``) one job from its rollup row.
+
+        ``values`` follows ``_ROLLUP_COLUMNS``.
+        """
+        submitted_at, status, duration, gpus_per_node, nodes = values
+        gpu_secs = (
+            duration * gpus_per_node * nodes
+            if None not in (duration, gpus_per_node, nodes)
+            else 0
+        )
+        self.conn.execute(
+            _UPSERT_ROLLUP_SQL,
+            (
+                submitted_at[:10],
+                scheduler_key,
+                status,
+                sign,
+                sign * (duration or 0),
+                sign if duration is not None else 0,
+                sign * gpu_secs,
+            ),
         )
-        return cur.rowcount > 0
 
     # ------------------------------------------------------------------
     # Display-shaped readers (history cutover — P2-4 #A)
@@ -448,7 +625,7 @@ class JobRepository(BaseRepository):
 
         if job_ids:
             placeholders = ",".join("?" * len(job_ids))
-            rows = self.conn.execute(
+            return self._fetch_dicts(
                 f"""
                 SELECT
                     j.job_id,
@@ -475,11 +652,10 @@ class JobRepository(BaseRepository):
                 ORDER BY j.submitted_at DESC
                 """,
                 tuple(job_ids) + scheduler_param,
-            ).fetchall()
-            return [dict(r) for r in rows]
+            )
 
         where_clause = " WHERE j.scheduler_key = ?" if scheduler_key is not None else ""
-        rows = self.conn.execute(
+        return self._fetch_dicts(
             f"""
             SELECT
                 j.job_id,
@@ -513,8 +689,20 @@ class JobRepository(BaseRepository):
             LIMIT ?
             """,
             scheduler_param + (limit,),
-        ).fetchall()
-        return [dict(r) for r in rows]
+        )
+
+    def _fetch_dicts(self, sql: str, params: tuple[Any, ...]) -> list[dict[str, Any]]:
+        """Run ``sql`` and return each row as a plain dict.
+
+        Fetches bare tuples and zips them with the column names read once
+        from the cursor, instead of building a :class:`sqlite3.Row` per
+        row only to copy it into a dict.
+        """
+        cur = self.conn.cursor()
+        cur.row_factory = None
+        cur.execute(sql, params)
+        columns = [d[0] for d in cur.description]
+        return [dict(zip(columns, row, strict=True)) for row in cur.fetchall()]
 
     def compute_stats(
         self,
@@ -532,6 +720,113 @@ class JobRepository(BaseRepository):
         ``scheduler_key`` (e.g. ``"local"`` / ``"ssh:dgx"``) scopes the
         aggregate to a single transport so the Web ``/api/history``
         summary reflects only that cluster.
+
+        Results for file-backed databases are cached for
+        ``_STATS_TTL_SECONDS``. A write through this repository drops the
+        cache once its transaction commits, and nothing is cached while
+        such a transaction is still open. Writes that bypass the repository
+        (raw SQL, the ``jobs_daily_rollup`` table edited directly) are not
+        seen until the cached entry expires.
+        """
+        db_file = self.conn.execute("PRAGMA database_list").fetchone()["file"]
+        cache_key = (db_file, from_date, to_date, scheduler_key)
+        generation = cached = None
+        if db_file:
+            with _STATS_CACHE_LOCK:
+                if not _prune_uncommitted_locked():
+                    generation = _stats_generation
+                    cached = _STATS_CACHE.get(cache_key)
+            if (
+                generation is not None
+                and cached is not None
+                and time.monotonic() - cached[0] < _STATS_TTL_SECONDS
+            ):
+                return _copy_stats(cached[1])
+
+        # Whole-day ranges are answered from the per-day rollup (v8);
+        # anything finer-grained scans the jobs rows themselves.
+        if all(d is None or "T" not in d for d in (from_date, to_date)):
+            rows = self._stats_rows_from_rollup(from_date, to_date, scheduler_key)
+        else:
+            rows = self._stats_rows_from_jobs(from_date, to_date, scheduler_key)
+
+        total = 0
+        jobs_by_status: dict[str, int] = {}
+        duration_sum = 0.0
+        duration_count = 0
+        gpu_seconds: float | None = None
+        for r in rows:
+            count = int(r["c"])
+            total += count
+            jobs_by_status[r["status"]] = count
+            if r["dur_count"]:
+                duration_sum += r["dur_sum"]
+                duration_count += r["dur_count"]
+            if r["gpu_secs"] is not None:
+                gpu_seconds = (gpu_seconds or 0.0) + r["gpu_secs"]
+
+        avg_duration_seconds = duration_sum / duration_count if duration_count else None
+        total_gpu_hours = gpu_seconds / 3600.0 if gpu_seconds else 0
+
+        stats = {
+            "total_jobs": total,
+            "jobs_by_status": jobs_by_status,
+            "avg_duration_seconds": avg_duration_seconds,
+            "total_gpu_hours": total_gpu_hours,
+            "from_date": from_date,
+            "to_date": to_date,
+        }
+        if generation is not None:
+            with _STATS_CACHE_LOCK:
+                if generation == _stats_generation:
+                    _STATS_CACHE[cache_key] = (time.monotonic(), stats)
+            return _copy_stats(stats)
+        return stats
+
+    def _stats_rows_from_rollup(
+        self,
+        from_date: str | None,
+        to_date: str | None,
+        scheduler_key: str | None,
+    ) -> list[sqlite3.Row]:
+        """Per-status partial aggregates summed from ``jobs_daily_rollup``.
+
+        Counts every job submitted on ``to_date``, including the final
+        second that the row scan's ``< to_date + 'T23:59:59'`` bound
+        leaves out.
+        """
+        conditions: list[str] = []
+        params: list[Any] = []
+        if from_date:
+            conditions.append("day >= ?")
+            params.append(from_date)
+        if to_date:
+            conditions.append("day <= ?")
+            params.append(to_date)
+        if scheduler_key is not None:
+            conditions.append("scheduler_key = ?")
+            params.append(scheduler_key)
+        where_clause = (" WHERE " + " AND ".join(conditions)) if conditions else ""
+        return self.conn.execute(
+            "SELECT status, SUM(job_count) AS c, "
+            "SUM(duration_sum) AS dur_sum, "
+            "SUM(duration_count) AS dur_count, "
+            "SUM(gpu_secs) AS gpu_secs "
+            f"FROM jobs_daily_rollup{where_clause} "
+            "GROUP BY status HAVING SUM(job_count) > 0",
+            params,
+        ).fetchall()
+
+    def _stats_rows_from_jobs(
+        self,
+        from_date: str | None,
+        to_date: str | None,
+        scheduler_key: str | None,
+    ) -> list[sqlite3.Row]:
+        """Per-status partial aggregates from one pass over ``jobs``.
+
+        Averaged / summed metrics only cover rows that have the relevant
+        columns populated.
         """
         conditions: list[str] = []
         params: list[Any] = []
@@ -546,61 +841,15 @@ class JobRepository(BaseRepository):
             conditions.append("scheduler_key = ?")
             params.append(scheduler_key)
         where_clause = (" WHERE " + " AND ".join(conditions)) if conditions else ""
-
-        total = int(
-            self.conn.execute(
-                f"SELECT COUNT(*) AS c FROM jobs{where_clause}", params
-            ).fetchone()["c"]
-        )
-
-        by_status_rows = self.conn.execute(
-            f"SELECT status, COUNT(*) AS c FROM jobs{where_clause} GROUP BY status",
+        return self.conn.execute(
+            "SELECT status, COUNT(*) AS c, "
+            "SUM(duration_secs) AS dur_sum, "
+            "COUNT(duration_secs) AS dur_count, "
+            "SUM(CASE WHEN gpus_per_node IS NOT NULL "
+            "THEN duration_secs * gpus_per_node * nodes END) AS gpu_secs "
+            f"FROM jobs{where_clause} GROUP BY status",
             params,
         ).fetchall()
-        jobs_by_status = {r["status"]: int(r["c"]) for r in by_status_rows}
-
-        # Averaged / summed metrics only over rows that have the
-        # relevant columns populated.
-        avg_duration_row = self.conn.execute(
-            f"SELECT AVG(duration_secs) AS a FROM jobs{where_clause} "
-            "AND duration_secs IS NOT NULL"
-            if where_clause
-            else "SELECT AVG(duration_secs) AS a FROM jobs "
-            "WHERE duration_secs IS NOT NULL",
-            params,
-        ).fetchone()
-        avg_duration_seconds = (
-            float(avg_duration_row["a"]) if avg_duration_row["a"] is not None else None
-        )
-
-        total_gpu_hours_row = self.conn.execute(
-            (
-                f"SELECT SUM(duration_secs * gpus_per_node * nodes) / 3600.0 AS h "
-                f"FROM jobs{where_clause} "
-                "AND duration_secs IS NOT NULL AND gpus_per_node IS NOT NULL"
-            )
-            if where_clause
-            else (
-                "SELECT SUM(duration_secs * gpus_per_node * nodes) / 3600.0 AS h "
-                "FROM jobs "
-                "WHERE duration_secs IS NOT NULL AND gpus_per_node IS NOT NULL"
-            ),
-            params,
-        ).fetchone()
-        total_gpu_hours = (
-            float(total_gpu_hours_row["h"])
-            if total_gpu_hours_row["h"] is not None
-            else 0
-        )
-
-        return {
-            "total_jobs": total,
-            "jobs_by_status": jobs_by_status,
-            "avg_duration_seconds": avg_duration_seconds,
-            "total_gpu_hours": total_gpu_hours,
-            "from_date": from_date,
-            "to_date": to_date,
-        }
 
     # Convenience — for callers that hold the raw connection/cursor.
     def _raw(self) -> sqlite3.Connection:
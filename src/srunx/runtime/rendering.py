@@ -19,6 +19,7 @@ truth for path fields. Translation from local → remote paths happens
 
 from __future__ import annotations
 
+import functools
 import shlex
 import tempfile
 from dataclasses import dataclass, field
@@ -463,6 +464,30 @@ def _find_mount_by_name(
 # ---------------------------------------------------------------------------
 
 
+@functools.lru_cache(maxsize=16)
+def _compile_template(path: str, mtime_ns: int, size: int) -> jinja2.Template:
+    """Compile the template at *path*, memoized per file version.
+
+    ``mtime_ns`` and ``size`` only key the cache: editing the file yields
+    a new key, so a stale compile is never reused.
+    """
+    with open(path, encoding="utf-8") as f:
+        template_content = f.read()
+
+    # ``keep_trailing_newline=True`` so the rendered output preserves
+    # the source file's trailing ``\n`` instead of silently stripping
+    # it (Jinja's default). Workflow Phase 2's IN_PLACE eligibility
+    # check relies on ``rendered_bytes == source_bytes``; with the
+    # default behaviour, every script ending in ``\n`` (i.e. every
+    # POSIX-conforming shell script) compared as different and the
+    # in-place path was effectively dead. Codex blocker #2 on PR #141.
+    return sandboxed_template(
+        template_content,
+        undefined=jinja2.StrictUndefined,
+        keep_trailing_newline=True,
+    )
+
+
 def _render_base_script(
     template_path: Path | str,
     template_vars: dict,
@@ -490,24 +515,11 @@ def _render_base_script(
     if not template_file.is_file():
         raise FileNotFoundError(f"Template file '{template_path}' not found")
 
-    with open(template_file, encoding="utf-8") as f:
-        template_content = f.read()
-
-    # ``keep_trailing_newline=True`` so the rendered output preserves
-    # the source file's trailing ``\n`` instead of silently stripping
-    # it (Jinja's default). Workflow Phase 2's IN_PLACE eligibility
-    # check relies on ``rendered_bytes == source_bytes``; with the
-    # default behaviour, every script ending in ``\n`` (i.e. every
-    # POSIX-conforming shell script) compared as different and the
-    # in-place path was effectively dead. Codex blocker #2 on PR #141.
-    template = sandboxed_template(
-        template_content,
-        undefined=jinja2.StrictUndefined,
-        keep_trailing_newline=True,
-    )
+    st = template_file.stat()
+    template = _compile_template(str(template_file), st.st_mtime_ns, st.st_size)
 
     # Debug: log template variables
-    logger.debug(f"Template variables: {template_vars}")
+    logger.debug("Template variables: {}", template_vars)
 
     rendered_content = template.render(template_vars)
 
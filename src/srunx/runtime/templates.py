@@ -1,5 +1,6 @@
 """Job template management for common use cases."""
 
+import functools
 import json
 import re
 from importlib.resources import files
@@ -71,11 +72,16 @@ def list_templates() -> list[dict[str, str]]:
     return result
 
 
+@functools.cache
+def _builtin_template_path(template_file: str) -> str:
+    """Resolve a packaged template file (fixed for the life of the process)."""
+    return str(files("srunx.runtime").joinpath("_jinja", template_file))
+
+
 def get_template_path(template_name: str) -> str:
     """Get the path to a template file."""
     if template_name in BUILTIN_TEMPLATES:
-        template_file = BUILTIN_TEMPLATES[template_name]["path"]
-        return str(files("srunx.runtime").joinpath("_jinja", template_file))
+        return _builtin_template_path(BUILTIN_TEMPLATES[template_name]["path"])
 
     user_file = _user_template_file(template_name)
     if user_file.exists():
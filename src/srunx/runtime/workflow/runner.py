@@ -8,7 +8,7 @@ re-exporting the public symbols defined here.
 import time
 from collections import defaultdict
 from collections.abc import Sequence
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from contextlib import AbstractContextManager, nullcontext
 from functools import cached_property
 from pathlib import Path
@@ -17,7 +17,7 @@ from typing import TYPE_CHECKING, Any, Self
 import jinja2
 import yaml  # type: ignore
 
-from srunx.callbacks import Callback
+from srunx.callbacks import Callback, implements
 from srunx.common.exceptions import WorkflowValidationError
 from srunx.common.logging import get_logger
 from srunx.domain import (
@@ -49,6 +49,13 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# libyaml's C loader parses workflow YAML several times faster than the
+# pure-Python SafeLoader; PyYAML builds without libyaml fall back to it.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Upper bound on jobs a single workflow run submits and monitors at once.
+_MAX_PARALLEL_JOBS = 32
+
 
 class WorkflowRunner:
     """Runner for executing workflows defined in YAML with dynamic job scheduling.
@@ -161,12 +168,14 @@ class WorkflowRunner:
             yaml.YAMLError: If the YAML is malformed.
             WorkflowValidationError: If the workflow structure is invalid.
         """
-        yaml_file = Path(yaml_path)
-        if not yaml_file.exists():
-            raise FileNotFoundError(f"Workflow file not found: {yaml_path}")
-
-        with open(yaml_file, encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+        # One open() instead of exists() + open(): no second stat and no
+        # window for the file to vanish in between. The loader decodes the
+        # bytes itself (UTF-8 unless a BOM says otherwise).
+        try:
+            with open(yaml_path, "rb") as f:
+                data = yaml.load(f, Loader=_YamlLoader)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Workflow file not found: {yaml_path}") from e
 
         name = data.get("name", "unnamed")
         args = {**(data.get("args") or {}), **(args_override or {})}
@@ -273,7 +282,7 @@ class WorkflowRunner:
                 raise WorkflowValidationError(
                     f"Failed to render job '{job_name}': {e}"
                 ) from e
-            rendered[job_name] = yaml.safe_load(rendered_yaml)
+            rendered[job_name] = yaml.load(rendered_yaml, Loader=_YamlLoader)
 
         return [rendered[j["name"]] for j in jobs_data if j.get("name") in rendered]
 
@@ -437,12 +446,16 @@ class WorkflowRunner:
             )
 
         for callback in self.callbacks:
-            callback.on_workflow_started(self.workflow)
+            if implements(callback, "on_workflow_started"):
+                callback.on_workflow_started(self.workflow)
 
         # Track jobs to execute and results
         all_jobs = jobs_to_execute.copy()
+        # Name index built once per run; the scheduling callbacks below
+        # look jobs up by name on every start / completion.
+        jobs_by_name = {job.name: job for job in all_jobs}
         results: dict[str, RunnableJobType] = {}
-        running_futures: dict[str, Any] = {}
+        running_futures: dict[str, Future[RunnableJobType]] = {}
 
         # For partial execution, we need to handle dependencies differently
         ignore_dependencies = from_job is not None
@@ -592,7 +605,7 @@ class WorkflowRunner:
         # Special handling for single job execution - completely ignore all dependencies
         if single_job is not None:
             # Execute only the single job without any dependency processing
-            single_job_obj = next(job for job in all_jobs if job.name == single_job)
+            single_job_obj = jobs_by_name[single_job]
 
             try:
                 result = execute_job_with_retry(single_job_obj)
@@ -615,7 +628,8 @@ class WorkflowRunner:
                     _transition_workflow_run(workflow_run_id, "running", "completed")
 
                 for callback in self.callbacks:
-                    callback.on_workflow_completed(self.workflow)
+                    if implements(callback, "on_workflow_completed"):
+                        callback.on_workflow_completed(self.workflow)
 
                 return results
 
@@ -654,9 +668,7 @@ class WorkflowRunner:
             # Find newly ready jobs that depend on this job starting
             newly_ready = []
             for dependent_name in dependents[job_name]:
-                dependent_job = next(
-                    (j for j in all_jobs if j.name == dependent_name), None
-                )
+                dependent_job = jobs_by_name.get(dependent_name)
                 if dependent_job is None:
                     continue
 
@@ -702,9 +714,7 @@ class WorkflowRunner:
             # Find newly ready jobs
             newly_ready = []
             for dependent_name in dependents[job_name]:
-                dependent_job = next(
-                    (j for j in all_jobs if j.name == dependent_name), None
-                )
+                dependent_job = jobs_by_name.get(dependent_name)
                 if dependent_job is None:
                     continue
 
@@ -730,8 +740,20 @@ class WorkflowRunner:
 
             return newly_ready
 
-        # Execute workflow with ThreadPoolExecutor
-        with ThreadPoolExecutor(max_workers=8) as executor:
+        # Execute workflow with ThreadPoolExecutor. Each worker submits
+        # *and* monitors its job, so the pool size caps how many jobs are
+        # in flight: size it to the workflow so a wide fan-out is
+        # submitted at once rather than eight at a time.
+        max_workers = max(1, min(len(all_jobs), _MAX_PARALLEL_JOBS))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Reverse index so completions map straight back to job names.
+            future_names: dict[Future[RunnableJobType], str] = {}
+
+            def submit(job: RunnableJobType) -> None:
+                future = executor.submit(execute_job_with_retry, job)
+                running_futures[job.name] = future
+                future_names[future] = job.name
+
             # Submit initial ready jobs
             if ignore_dependencies:
                 # For partial execution, start with all jobs (dependencies are ignored or filtered)
@@ -751,32 +773,24 @@ class WorkflowRunner:
                             initial_jobs.append(job)
 
             for job in initial_jobs:
-                future = executor.submit(execute_job_with_retry, job)
-                running_futures[job.name] = future
+                submit(job)
 
                 # Check for jobs that should start immediately after this job starts
                 newly_ready_on_start = on_job_started(job.name)
                 for ready_name in newly_ready_on_start:
                     if ready_name not in running_futures:
-                        ready_job = next(j for j in all_jobs if j.name == ready_name)
-                        new_future = executor.submit(execute_job_with_retry, ready_job)
-                        running_futures[ready_name] = new_future
+                        submit(jobs_by_name[ready_name])
 
-            # Process completed jobs and schedule new ones
+            # Process completed jobs and schedule new ones. ``wait`` blocks
+            # until a job finishes, so completions are handled immediately
+            # instead of on the next poll.
             while running_futures:
-                # Check for completed futures
-                completed = []
-                for job_name, future in list(running_futures.items()):
-                    if future.done():
-                        completed.append((job_name, future))
-                        del running_futures[job_name]
-
-                if not completed:
-                    time.sleep(0.1)  # Brief sleep to avoid busy waiting
-                    continue
+                done, _ = wait(future_names, return_when=FIRST_COMPLETED)
 
                 # Handle completed jobs
-                for job_name, future in completed:
+                for future in done:
+                    job_name = future_names.pop(future)
+                    del running_futures[job_name]
                     try:
                         result = future.result()
                         newly_ready_names = on_job_complete(job_name, result)
@@ -784,27 +798,13 @@ class WorkflowRunner:
                         # Schedule newly ready jobs
                         for ready_name in newly_ready_names:
                             if ready_name not in running_futures:
-                                ready_job = next(
-                                    j for j in all_jobs if j.name == ready_name
-                                )
-                                new_future = executor.submit(
-                                    execute_job_with_retry, ready_job
-                                )
-                                running_futures[ready_name] = new_future
+                                submit(jobs_by_name[ready_name])
 
                                 # Check for jobs that should start immediately after this job starts
                                 newly_ready_on_start = on_job_started(ready_name)
                                 for start_ready_name in newly_ready_on_start:
                                     if start_ready_name not in running_futures:
-                                        start_ready_job = next(
-                                            j
-                                            for j in all_jobs
-                                            if j.name == start_ready_name
-                                        )
-                                        start_future = executor.submit(
-                                            execute_job_with_retry, start_ready_job
-                                        )
-                                        running_futures[start_ready_name] = start_future
+                                        submit(jobs_by_name[start_ready_name])
 
                     except Exception as e:
                         logger.error(f"❌ Job {job_name} failed: {e}")
@@ -846,7 +846,8 @@ class WorkflowRunner:
             _transition_workflow_run(workflow_run_id, "running", "completed")
 
         for callback in self.callbacks:
-            callback.on_workflow_completed(self.workflow)
+            if implements(callback, "on_workflow_completed"):
+                callback.on_workflow_completed(self.workflow)
 
         return results
 
@@ -10,11 +10,16 @@ makes the parsing rules independently reviewable and testable.
 
 from __future__ import annotations
 
+from collections import Counter
 from typing import TYPE_CHECKING, Any
 
 from srunx.common.logging import get_logger
 from srunx.slurm.clients._ssh_helpers import _run_slurm_cmd, _validate_identifier
-from srunx.slurm.parsing import GPU_TRES_RE
+from srunx.slurm.parsing import (
+    GPU_TRES_RE,
+    SQUEUE_STATE_USER_FORMAT,
+    count_states_by_user,
+)
 from srunx.slurm.protocols import (
     JobSnapshot,
     parse_slurm_datetime,
@@ -132,6 +137,29 @@ def list_active_jobs(
     return jobs, seen_ids
 
 
+def queue_status_counts(
+    client: SlurmSSHClient, user: str | None = None
+) -> Counter[tuple[str, str]]:
+    """Count active jobs by ``(state, user)`` from one two-column ``squeue``.
+
+    States are mapped as :meth:`SlurmSSHClient.queue` maps them: anything
+    that is not a :class:`~srunx.domain.JobStatus` value counts as
+    ``UNKNOWN``.
+    """
+    from srunx.domain import JobStatus
+
+    cmd = f'squeue --format "{SQUEUE_STATE_USER_FORMAT}" --noheader'
+    if user:
+        _validate_identifier(user, "user")
+        cmd += f" --user {user}"
+    known = {s.value for s in JobStatus}
+    counts: Counter[tuple[str, str]] = Counter()
+    raw = count_states_by_user(_run_slurm_cmd(client, cmd).splitlines())
+    for (state, owner), n in raw.items():
+        counts[state if state in known else JobStatus.UNKNOWN.value, owner] += n
+    return counts
+
+
 def list_jobs(client: SlurmSSHClient, user: str | None = None) -> list[dict[str, Any]]:
     """List SLURM jobs via squeue + recent completed/failed jobs via sacct.
 
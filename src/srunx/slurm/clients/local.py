@@ -2,13 +2,17 @@
 
 from __future__ import annotations
 
-import glob
+import functools
+import mmap
 import os
 import re
 import shutil
 import subprocess
 import tempfile
+import threading
 import time
+from collections import Counter
+from collections.abc import Iterator
 from importlib.resources import files
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
@@ -24,7 +28,11 @@ from srunx.domain import (
 )
 from srunx.runtime.lifecycle import JobLifecycleSink, NoOpSink
 from srunx.runtime.rendering import render_job_script, render_shell_job_script
-from srunx.slurm.parsing import GPU_TRES_RE
+from srunx.slurm.parsing import (
+    GPU_TRES_RE,
+    SQUEUE_STATE_USER_FORMAT,
+    count_states_by_user,
+)
 from srunx.utils import get_job_status, job_status_msg
 
 if TYPE_CHECKING:
@@ -62,6 +70,234 @@ def _sbatch_invocation(
     )
 
 
+_TERMINAL_STATUSES: frozenset[JobStatus] = frozenset(
+    {JobStatus.COMPLETED, JobStatus.FAILED, JobStatus.CANCELLED, JobStatus.TIMEOUT}
+)
+_STATUS_BY_NAME: dict[str, JobStatus] = {s.value: s for s in JobStatus}
+
+# Consecutive batched ``sacct`` snapshots a watched job may be absent from
+# before it is reported UNKNOWN (``BaseJob.refresh`` makes three attempts).
+_SACCT_MISSES_BEFORE_UNKNOWN = 3
+
+# Seconds between job-status checks while ``tail_log(follow=True)`` waits
+# for new log lines.
+_FOLLOW_STATUS_INTERVAL = 10.0
+
+# How much of a failed job's log the monitor quotes in its RuntimeError.
+_ERROR_LOG_TAIL_BYTES = 64 * 1024
+
+
+def _read_last_lines(path: str | Path, n: int) -> tuple[str, int]:
+    """Return the last *n* lines of *path* and the file size in bytes.
+
+    Scans backwards for newlines over an ``mmap`` so only the tail is ever
+    copied and decoded, however large the log has grown.
+    """
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return "", 0  # mmap refuses empty files
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            pos = size - 1 if mm[-1:] == b"\n" else size
+            for _ in range(n):
+                pos = mm.rfind(b"\n", 0, pos)
+                if pos < 0:
+                    break
+            data = mm[pos + 1 :]
+    return data.decode("utf-8", errors="replace"), size
+
+
+def _read_tail(path: str | Path, max_bytes: int) -> str:
+    """Return at most the last *max_bytes* of *path*, noting any cut."""
+    with open(path, "rb") as f:
+        size = f.seek(0, os.SEEK_END)
+        f.seek(max(0, size - max_bytes))
+        data = f.read()
+    text = data.decode("utf-8", errors="replace")
+    if size > max_bytes:
+        text = f"[... {size - max_bytes} earlier bytes omitted ...]\n{text}"
+    return text
+
+
+def _log_name_pattern(job_id: str, job_name: str | None) -> re.Pattern[str]:
+    """Compile the log file names SLURM / srunx may use for a job.
+
+    One capturing group per name pattern, in priority order; glob's ``*``
+    never matches a leading dot, hence the ``(?!\\.)`` guard.
+    """
+    job_id = re.escape(job_id)
+    patterns = [
+        rf"(?!\.).*_{job_id}\.log",
+        rf"(?!\.).*_{job_id}\.out",
+        rf"slurm-{job_id}\.out",
+        rf"slurm-{job_id}\.err",
+        rf"job_{job_id}\.log",
+        rf"{job_id}\.log",
+    ]
+    if job_name:
+        name = re.escape(job_name)
+        patterns[:0] = [rf"{name}_{job_id}\.log", rf"{name}_{job_id}\.out"]
+    return re.compile("|".join(f"({p})" for p in patterns))
+
+
+def _stream_lines(cmd: list[str]) -> Iterator[str]:
+    """Yield *cmd*'s stdout line by line while it runs.
+
+    Raises :class:`subprocess.CalledProcessError` once the output is
+    exhausted if the command failed, like ``subprocess.run(check=True)``.
+    stderr goes to a temporary file rather than a second pipe: a command
+    that fills an unread stderr pipe would block before closing stdout.
+    """
+    with (
+        tempfile.TemporaryFile(mode="w+") as err,
+        subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=err, text=True) as proc,
+    ):
+        assert proc.stdout is not None
+        yield from proc.stdout
+        proc.wait()
+        err.seek(0)
+        stderr = err.read()
+    if proc.returncode:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stderr=stderr)
+
+
+def _script_tmpdir() -> str | None:
+    """Directory for rendered sbatch scripts: tmpfs unless ``TMPDIR`` is set.
+
+    ``sbatch`` copies the script at submission, so it only has to live for
+    the duration of the call; ``/dev/shm`` keeps it off (possibly
+    networked) disk. An explicit ``TMPDIR`` always wins. ``None`` falls
+    back to :func:`tempfile.gettempdir`.
+    """
+    if os.environ.get("TMPDIR"):
+        return None
+    shm = "/dev/shm"
+    if os.path.isdir(shm) and os.access(shm, os.W_OK | os.X_OK):
+        return shm
+    return None
+
+
+@functools.cache
+def _default_template_path() -> str:
+    # Resolved once per process: every ``LocalClient()`` (and each
+    # ``submit_job`` / ``retrieve_job`` convenience call) needs it.
+    return str(files("srunx.runtime").joinpath("_jinja", "base.slurm.jinja"))
+
+
+class _StatusBatcher:
+    """Coalesce concurrent monitor polls into one ``sacct`` call per tick.
+
+    Every :meth:`LocalClient.monitor` loop registers its job here. The first
+    loop to poll once the cached snapshot is older than its poll interval
+    queries ``sacct`` for *all* watched jobs at once; the others reuse that
+    snapshot. A workflow monitoring N jobs in parallel therefore forks one
+    ``sacct`` per tick instead of N.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Held across the ``sacct`` call so concurrent pollers wait for one
+        # query instead of racing their own; ``_lock`` stays free meanwhile.
+        self._query_lock = threading.Lock()
+        self._watched: dict[int, int] = {}
+        self._states: dict[int, str] = {}
+        self._misses: dict[int, int] = {}
+        self._fetched_at = float("-inf")
+
+    def watch(self, job_id: int) -> None:
+        with self._lock:
+            self._watched[job_id] = self._watched.get(job_id, 0) + 1
+
+    def unwatch(self, job_id: int) -> None:
+        with self._lock:
+            remaining = self._watched.get(job_id, 0) - 1
+            if remaining > 0:
+                self._watched[job_id] = remaining
+            else:
+                self._watched.pop(job_id, None)
+                self._states.pop(job_id, None)
+                self._misses.pop(job_id, None)
+
+    def refresh(self, job: BaseJob, max_age: float) -> None:
+        """Update ``job``'s status from a snapshot at most ``max_age`` old.
+
+        A job monitored on its own has nothing to share a query with and
+        uses :meth:`BaseJob.refresh` directly. In a batch, a job ``sacct``
+        does not list yet (common right after submission) or a failed query
+        keeps the job's status until the next tick; after
+        ``_SACCT_MISSES_BEFORE_UNKNOWN`` snapshots without it the job turns
+        UNKNOWN, as :meth:`BaseJob.refresh` does after its retries.
+        """
+        job_id = job.job_id
+        with self._lock:
+            batched = job_id is not None and len(self._watched) > 1
+        if not batched:
+            job.refresh()
+            return
+        with self._query_lock:
+            with self._lock:
+                stale = time.monotonic() - self._fetched_at >= max_age
+                job_ids = list(self._watched)
+            if stale:
+                states = self._query(job_ids)
+                with self._lock:
+                    self._fetched_at = time.monotonic()
+                    if states is not None:
+                        self._record(job_ids, states)
+        with self._lock:
+            state = self._states.get(job_id)
+            misses = self._misses.get(job_id, 0)
+        if state is not None:
+            status = _STATUS_BY_NAME.get(state)
+            if status is not None:  # unknown state: keep it, as refresh() does
+                job.status = status
+        elif misses >= _SACCT_MISSES_BEFORE_UNKNOWN:
+            job.status = JobStatus.UNKNOWN
+        # Mark the job fresh so reading ``job.status`` doesn't re-query sacct.
+        job._last_refresh = time.time()
+
+    def _record(self, job_ids: list[int], states: dict[int, str]) -> None:
+        for job_id in job_ids:
+            if job_id in states:
+                self._misses.pop(job_id, None)
+            else:
+                self._misses[job_id] = self._misses.get(job_id, 0) + 1
+        self._states = states
+
+    @staticmethod
+    def _query(job_ids: list[int]) -> dict[int, str] | None:
+        try:
+            result = subprocess.run(
+                [
+                    "sacct",
+                    "-j",
+                    ",".join(map(str, job_ids)),
+                    "--format",
+                    "JobID,State",
+                    "--noheader",
+                    "--parsable2",
+                ],
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+        except (OSError, subprocess.CalledProcessError) as e:
+            logger.debug("Batched sacct query failed: {}", e)
+            return None
+        states: dict[int, str] = {}
+        for line in result.stdout.splitlines():
+            raw_id, _, state = line.partition("|")
+            # Skip job steps ("123.batch") and array elements ("123_4").
+            if not raw_id.isdigit() or not state:
+                continue
+            # "CANCELLED by 1000" → "CANCELLED", as in BaseJob.refresh
+            states.setdefault(int(raw_id), state.partition(" ")[0])
+        return states
+
+
+_STATUS_BATCHER = _StatusBatcher()
+
+
 class LocalClient:
     """Client for interacting with the local SLURM workload manager."""
 
@@ -132,14 +368,14 @@ class LocalClient:
         if isinstance(job, Job):
             template = template_path or self.default_template
 
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=_script_tmpdir()) as temp_dir:
                 script_path = render_job_script(
                     template,
                     job,
                     temp_dir,
                     verbose,
                 )
-                logger.debug(f"Generated SLURM script at: {script_path}")
+                logger.debug("Generated SLURM script at: {}", script_path)
 
                 # Submit job with sbatch --parsable for reliable job ID
                 # extraction. --export=ALL + composed env applies ONLY when
@@ -149,9 +385,9 @@ class LocalClient:
                     script_path, job.environment.env_vars
                 )
                 if job.environment.container:
-                    logger.debug(f"Using container: {job.environment.container}")
+                    logger.debug("Using container: {}", job.environment.container)
 
-                logger.debug(f"Executing command: {' '.join(sbatch_cmd)}")
+                logger.debug("Executing command: {}", " ".join(sbatch_cmd))
 
                 try:
                     result = subprocess.run(
@@ -170,7 +406,7 @@ class LocalClient:
                     raise
 
         elif isinstance(job, ShellJob):
-            with tempfile.TemporaryDirectory() as temp_dir:
+            with tempfile.TemporaryDirectory(dir=_script_tmpdir()) as temp_dir:
                 script_path = render_shell_job_script(
                     job.script_path, job, temp_dir, verbose
                 )
@@ -209,7 +445,7 @@ class LocalClient:
         job.job_id = job_id
         job.status = JobStatus.PENDING
 
-        logger.debug(f"Successfully submitted job '{job.name}' with ID {job_id}")
+        logger.debug("Successfully submitted job '{}' with ID {}", job.name, job_id)
 
         # Lifecycle events fan out through the instance sink (+ optional
         # per-call sink). The default :class:`DBRecorderSink` persists the
@@ -357,6 +593,16 @@ class LocalClient:
         """
         if not path:
             return "", offset
+        if offset == 0 and last_n is not None and last_n > 0:
+            # New offset is the file size so the follow loop picks up
+            # future writes from EOF.
+            try:
+                return _read_last_lines(path, last_n)
+            except FileNotFoundError:
+                return "", offset
+            except OSError as exc:
+                logger.warning(f"Failed to read log file {path}: {exc}")
+                return "", offset
         try:
             with open(path, "rb") as f:
                 if offset:
@@ -371,12 +617,6 @@ class LocalClient:
             text = data.decode("utf-8")
         except UnicodeDecodeError:
             text = data.decode("utf-8", errors="replace")
-
-        if offset == 0 and last_n is not None and last_n > 0:
-            # Slice to last N lines; new offset stays at file size so
-            # the follow loop picks up future writes from EOF.
-            lines = text.splitlines(keepends=True)
-            text = "".join(lines[-last_n:]) if lines else ""
         return text, offset + len(data)
 
     def submit_remote_sbatch(
@@ -448,14 +688,15 @@ class LocalClient:
         if user:
             cmd.extend(["--user", user])
 
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
-
+        # Rows are parsed as squeue writes them, so the full listing is
+        # never buffered as one string on large clusters.
         jobs = []
-        for line in result.stdout.strip().split("\n"):
+        for line in _stream_lines(cmd):
             if not line.strip():
                 continue
 
-            parts = line.split("|")
+            # TRES is the last column: cap the split so it is never cut up.
+            parts = line.split("|", 10)
             if len(parts) < 11:
                 continue
 
@@ -475,10 +716,8 @@ class LocalClient:
             nodelist = parts[9].strip() or None
             tres = parts[10].strip()
 
-            try:
-                status = JobStatus(status_str)
-            except ValueError:
-                status = JobStatus.PENDING  # Default for unknown status
+            # Default for unknown status
+            status = _STATUS_BY_NAME.get(status_str, JobStatus.PENDING)
 
             try:
                 nodes = int(nodes_str)
@@ -517,6 +756,33 @@ class LocalClient:
 
         return jobs
 
+    def queue_status_iter(self, user: str | None = None) -> Iterator[str]:
+        """Yield raw ``state|user`` squeue rows as squeue writes them.
+
+        No :class:`BaseJob` is built and the listing is never held in
+        memory as a whole, so status-only consumers stay cheap on queues
+        with tens of thousands of jobs.
+        """
+        cmd = ["squeue", "--format", SQUEUE_STATE_USER_FORMAT, "--noheader"]
+        if user:
+            cmd.extend(["--user", user])
+        yield from _stream_lines(cmd)
+
+    def queue_status_counts(self, user: str | None = None) -> Counter[tuple[str, str]]:
+        """Count active jobs by ``(state, user)`` from a single ``squeue`` call.
+
+        Cheaper than :meth:`queue` when only per-state tallies are needed;
+        see :meth:`queue_status_iter`. Keying on the owner lets one
+        all-users call answer both the cluster-wide and the per-user
+        question. States are mapped as :meth:`queue` maps them, so e.g.
+        ``COMPLETING`` counts as ``PENDING``.
+        """
+        counts: Counter[tuple[str, str]] = Counter()
+        raw = count_states_by_user(self.queue_status_iter(user))
+        for (state, owner), n in raw.items():
+            counts[_STATUS_BY_NAME.get(state, JobStatus.PENDING).value, owner] += n
+        return counts
+
     def queue_by_ids(self, job_ids: list[int]) -> dict[int, JobSnapshot]:
         """Return a mapping of ``job_id`` -> :class:`JobSnapshot` for active jobs.
 
@@ -647,30 +913,52 @@ class LocalClient:
         msg = f"👀 {'MONITORING':<12} Job {job.name:<12} (ID: {job.job_id})"
         logger.info(msg)
 
+        # A job already known to be finished (e.g. monitoring a completed
+        # dependency) needs no sacct round trip.
+        if job._status in _TERMINAL_STATUSES:
+            return self._handle_terminal(job, sink)
+
+        job_id = job.job_id
+        if job_id is not None:
+            _STATUS_BATCHER.watch(job_id)
+        try:
+            return self._poll_until_terminal(job, poll_interval, sink)
+        finally:
+            if job_id is not None:
+                _STATUS_BATCHER.unwatch(job_id)
+
+    def _poll_until_terminal(
+        self,
+        job: JobType,
+        poll_interval: int,
+        sink: JobLifecycleSink | None,
+    ) -> JobType:
         previous_status = None
 
         while True:
-            job.refresh()
+            _STATUS_BATCHER.refresh(job, max_age=poll_interval)
 
             # Log status changes
             if job.status != previous_status:
                 status_str = job.status.value if job.status else "Unknown"
-                logger.debug(f"Job(name={job.name}, id={job.job_id}) is {status_str}")
+                logger.debug(
+                    "Job(name={}, id={}) is {}", job.name, job.job_id, status_str
+                )
                 previous_status = job.status
 
-            match job.status:
-                case JobStatus.COMPLETED:
-                    logger.info(job_status_msg(job))
-                    self._emit_terminal(job, sink)
-                    return job
-                case JobStatus.FAILED:
-                    self._emit_terminal(job, sink)
-                    raise RuntimeError(self._build_error_msg(job))
-                case JobStatus.CANCELLED | JobStatus.TIMEOUT:
-                    self._emit_terminal(job, sink)
-                    raise RuntimeError(self._build_error_msg(job))
+            if job.status in _TERMINAL_STATUSES:
+                return self._handle_terminal(job, sink)
             time.sleep(poll_interval)
 
+    def _handle_terminal(self, job: JobType, sink: JobLifecycleSink | None) -> JobType:
+        """Emit the terminal event; return a completed job, raise otherwise."""
+        if job.status == JobStatus.COMPLETED:
+            logger.info(job_status_msg(job))
+            self._emit_terminal(job, sink)
+            return job
+        self._emit_terminal(job, sink)
+        raise RuntimeError(self._build_error_msg(job))
+
     def _emit_terminal(self, job: BaseJob, extra_sink: JobLifecycleSink | None) -> None:
         """Fire on_terminal on the instance sink (+ optional per-call sink)."""
         self._sink.on_terminal(job)
@@ -684,9 +972,8 @@ class LocalClient:
         if isinstance(job, Job):
             log_file = Path(job.log_dir) / f"{job.name}_{job.job_id}.log"
             if log_file.exists():
-                with open(log_file) as f:
-                    err_msg += f.read()
-                    err_msg += f"\nLog file: {log_file}"
+                err_msg += _read_tail(log_file, _ERROR_LOG_TAIL_BYTES)
+                err_msg += f"\nLog file: {log_file}"
             else:
                 err_msg += f"Log file not found: {log_file}"
         return err_msg
@@ -741,18 +1028,7 @@ class LocalClient:
         Returns:
             Tuple of (found_files, searched_dirs)
         """
-        job_id_str = str(job_id)
-        potential_log_patterns: list[str | None] = [
-            f"{job_name}_{job_id_str}.log" if job_name else None,
-            f"{job_name}_{job_id_str}.out" if job_name else None,
-            f"*_{job_id_str}.log",
-            f"*_{job_id_str}.out",
-            f"slurm-{job_id_str}.out",
-            f"slurm-{job_id_str}.err",
-            f"job_{job_id_str}.log",
-            f"{job_id_str}.log",
-        ]
-        patterns = [p for p in potential_log_patterns if p is not None]
+        log_name_re = _log_name_pattern(str(job_id), job_name)
         # Deliberately excludes /tmp: it is world-writable on shared login
         # nodes, so another user could plant `*_<jobid>.log` (or a symlink to
         # a file we can read) and have us read/print it. Restrict discovery to
@@ -767,10 +1043,20 @@ class LocalClient:
             if not log_dir:
                 continue
             log_dir_path = Path(log_dir)
-            if not log_dir_path.exists():
+            # One directory listing matched against every pattern at once,
+            # ordered by pattern priority (``lastindex`` is the alternative
+            # that matched) so the primary log comes first.
+            try:
+                with os.scandir(log_dir_path) as entries:
+                    matches = [
+                        (m.lastindex, entry.name)
+                        for entry in entries
+                        if (m := log_name_re.fullmatch(entry.name))
+                    ]
+            except OSError:
                 continue
-            for pattern in patterns:
-                found_files.extend(glob.glob(str(log_dir_path / pattern)))
+            matches.sort(key=lambda match: match[0])
+            found_files.extend(str(log_dir_path / name) for _, name in matches)
 
         return found_files, [d for d in log_dirs if d]
 
@@ -820,10 +1106,10 @@ class LocalClient:
         Returns:
             Tuple of (output_content, error_content)
         """
-        found_files, _ = self._find_log_files(job_id, job_name)
-        if not found_files:
+        info = self.get_job_output_detailed(job_id, job_name)
+        if not info["found_files"]:
             logger.warning(f"No log files found for job {job_id}")
-        return self._read_log_contents(found_files)
+        return str(info["output"]), str(info["error"])
 
     def get_job_output_detailed(
         self, job_id: int | str, job_name: str | None = None, skip_content: bool = False
@@ -872,8 +1158,6 @@ class LocalClient:
             last_n: Show only the last N lines
             poll_interval: Polling interval in seconds for follow mode
         """
-        from collections import deque
-
         from rich.console import Console
 
         console = Console()
@@ -915,22 +1199,27 @@ class LocalClient:
 
                 # If last_n is specified, show last N lines first
                 if last_n:
-                    with open(log_file, encoding="utf-8") as f:
-                        tail_lines = deque(f, maxlen=last_n)
-                        for line in tail_lines:
-                            console.print(line, end="")
+                    tail_text, _ = _read_last_lines(log_file, last_n)
+                    for line in tail_text.splitlines(keepends=True):
+                        console.print(line, end="", markup=False, highlight=False)
 
                 # Start streaming from current position
                 with open(log_file, encoding="utf-8") as f:
                     # Always seek to end to avoid duplicating already-printed lines
                     f.seek(0, os.SEEK_END)
 
+                    # Reading the file is cheap; asking sacct whether the
+                    # job is done forks a process, so only do that every
+                    # _FOLLOW_STATUS_INTERVAL seconds of idle log. The first
+                    # check runs at the first EOF, so following a job that
+                    # has already finished returns at once.
+                    next_status_check = time.monotonic()
                     while True:
                         line = f.readline()
                         if line:
-                            console.print(line, end="")
-                        else:
-                            # Check if job is still running
+                            console.print(line, end="", markup=False, highlight=False)
+                            continue
+                        if time.monotonic() >= next_status_check:
                             job = self.retrieve(int(job_id))
                             if job.status.value in [
                                 "COMPLETED",
@@ -938,23 +1227,28 @@ class LocalClient:
                                 "CANCELLED",
                                 "TIMEOUT",
                             ]:
+                                # Flush whatever was written before exit.
+                                for line in f:
+                                    console.print(
+                                        line, end="", markup=False, highlight=False
+                                    )
                                 console.print(
                                     f"\n[yellow]Job {job_id} finished with status: {job.status.value}[/yellow]"
                                 )
                                 break
-                            time.sleep(poll_interval)
+                            next_status_check = (
+                                time.monotonic() + _FOLLOW_STATUS_INTERVAL
+                            )
+                        time.sleep(poll_interval)
             else:
                 # Static display mode
                 if last_n:
-                    # Read only last N lines efficiently using deque
-                    with open(log_file, encoding="utf-8") as f:
-                        tail_lines = deque(f, maxlen=last_n)
-                    output = "".join(tail_lines)
+                    output, _ = _read_last_lines(log_file, last_n)
                 else:
                     output = str(log_info.get("output", ""))
 
                 if output:
-                    console.print(output)
+                    console.print(output, markup=False, highlight=False)
                 else:
                     console.print("[yellow]Log file is empty[/yellow]")
 
@@ -1016,4 +1310,4 @@ class LocalClient:
 
     def _get_default_template(self) -> str:
         """Get the default job template path."""
-        return str(files("srunx.runtime").joinpath("_jinja", "base.slurm.jinja"))
+        return _default_template_path()
@@ -27,11 +27,12 @@ connection lock + lifecycle.
 from __future__ import annotations
 
 import threading
+from collections import Counter
 from collections.abc import Sequence
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
-from srunx.callbacks import Callback
+from srunx.callbacks import Callback, implements
 from srunx.common.logging import get_logger
 
 # Imported at runtime (not under TYPE_CHECKING) because the literal types
@@ -50,6 +51,9 @@ from srunx.slurm.clients._ssh_queries import (
 from srunx.slurm.clients._ssh_queries import (
     queue_by_ids as _queue_by_ids_impl,
 )
+from srunx.slurm.clients._ssh_queries import (
+    queue_status_counts as _queue_status_counts_impl,
+)
 from srunx.slurm.clients._ssh_recording import (
     record_completion_safe as _record_completion_safe_impl,
 )
@@ -386,6 +390,9 @@ class SlurmSSHClient:
     def queue_by_ids(self, job_ids: list[int]) -> dict[int, JobSnapshot]:
         return _queue_by_ids_impl(self, job_ids)
 
+    def queue_status_counts(self, user: str | None = None) -> Counter[tuple[str, str]]:
+        return _queue_status_counts_impl(self, user)
+
     def get_job(self, job_id: int) -> dict[str, Any]:
         return _get_job(self, job_id)
 
@@ -534,6 +541,8 @@ class SlurmSSHClient:
 
         # Fire on_job_submitted callbacks. Mirrors :meth:`submit` step 4.
         for callback in self.callbacks:
+            if not implements(callback, "on_job_submitted"):
+                continue
             try:
                 callback.on_job_submitted(callbacks_job)
             except Exception as exc:  # noqa: BLE001
@@ -1161,6 +1170,8 @@ class SlurmSSHClient:
 
         # --- 4. Fire on_job_submitted callbacks ---
         for callback in self.callbacks:
+            if not implements(callback, "on_job_submitted"):
+                continue
             try:
                 callback.on_job_submitted(job)
             except Exception as exc:  # noqa: BLE001
@@ -1197,14 +1208,17 @@ class SlurmSSHClient:
 
         # --- 6. Dispatch terminal callback + handle failure ---
         self._record_completion_safe(job_id, job.status)
+        hook = {
+            JobStatus.COMPLETED: "on_job_completed",
+            JobStatus.FAILED: "on_job_failed",
+            JobStatus.CANCELLED: "on_job_cancelled",
+            JobStatus.TIMEOUT: "on_job_cancelled",
+        }.get(job.status)
         for callback in self.callbacks:
+            if hook is None or not implements(callback, hook):
+                continue
             try:
-                if job.status == JobStatus.COMPLETED:
-                    callback.on_job_completed(job)
-                elif job.status == JobStatus.FAILED:
-                    callback.on_job_failed(job)
-                elif job.status in {JobStatus.CANCELLED, JobStatus.TIMEOUT}:
-                    callback.on_job_cancelled(job)
+                getattr(callback, hook)(job)
             except Exception as exc:  # noqa: BLE001
                 # Same callback-failure policy as the on_job_submitted hook.
                 logger.warning(f"Terminal callback failed for job {job.name}: {exc}")
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import re
+from collections import Counter
+from collections.abc import Iterable
 
 from srunx.slurm.protocols import parse_slurm_datetime, parse_slurm_duration
 
@@ -10,4 +12,25 @@ from srunx.slurm.protocols import parse_slurm_datetime, parse_slurm_duration
 # Matches: "gpu:8", "gres/gpu=8", "gpu:NVIDIA-A100:8", "gpu/4", etc.
 GPU_TRES_RE = re.compile(r"gpu[:/=](?:[^:]+:)?(\d+)", re.IGNORECASE)
 
-__all__ = ["GPU_TRES_RE", "parse_slurm_datetime", "parse_slurm_duration"]
+# squeue ``--format`` producing the two columns :func:`count_states_by_user`
+# reads: long state name and owner.
+SQUEUE_STATE_USER_FORMAT = "%T|%u"
+
+
+def count_states_by_user(lines: Iterable[str]) -> Counter[tuple[str, str]]:
+    """Tally ``squeue --format "%T|%u"`` lines into ``(state, user)`` counts."""
+    counts: Counter[tuple[str, str]] = Counter()
+    for line in lines:
+        state, sep, owner = line.partition("|")
+        if sep:
+            counts[state.strip(), owner.strip()] += 1
+    return counts
+
+
+__all__ = [
+    "GPU_TRES_RE",
+    "SQUEUE_STATE_USER_FORMAT",
+    "count_states_by_user",
+    "parse_slurm_datetime",
+    "parse_slurm_duration",
+]
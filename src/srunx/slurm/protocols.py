@@ -15,6 +15,8 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 from pydantic import BaseModel, Field
 
 if TYPE_CHECKING:
+    from collections import Counter
+
     from srunx.domain import BaseJob, RunnableJobType
     from srunx.runtime.rendering import SubmissionRenderContext
 
@@ -137,6 +139,16 @@ class JobOperations(Protocol):
         """
         ...
 
+    def queue_status_counts(self, user: str | None = None) -> Counter[tuple[str, str]]:
+        """Count active jobs by ``(state, user)`` from a single ``squeue`` call.
+
+        Cheaper than :meth:`queue` for callers that only need per-state
+        tallies (e.g. scheduled reports): no ``BaseJob`` is built per row.
+        ``user`` filters the same way as for :meth:`queue`, and each state
+        is the ``JobStatus`` value :meth:`queue` would report for the row.
+        """
+        ...
+
     def tail_log_incremental(
         self,
         job_id: int,
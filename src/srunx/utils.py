@@ -9,6 +9,16 @@ __all__ = ["get_job_status", "job_status_msg"]
 
 logger = get_logger(__name__)
 
+_STATUS_ICONS = {
+    JobStatus.COMPLETED: "✅",
+    JobStatus.RUNNING: "🚀",
+    JobStatus.PENDING: "⌛",
+    JobStatus.FAILED: "❌",
+    JobStatus.CANCELLED: "🛑",
+    JobStatus.TIMEOUT: "⏰",
+    JobStatus.UNKNOWN: "❓",
+}
+
 
 def get_job_status(job_id: int) -> BaseJob:
     """Get job status and information.
@@ -79,17 +89,8 @@ def job_status_msg(job: BaseJob) -> str:
     Returns:
         Formatted status message with icons and job information.
     """
-    icons = {
-        JobStatus.COMPLETED: "✅",
-        JobStatus.RUNNING: "🚀",
-        JobStatus.PENDING: "⌛",
-        JobStatus.FAILED: "❌",
-        JobStatus.CANCELLED: "🛑",
-        JobStatus.TIMEOUT: "⏰",
-        JobStatus.UNKNOWN: "❓",
-    }
-    status_icon = icons.get(job.status, "❓")
+    # ``job.status`` may refresh from sacct, so read it exactly once.
+    status = job.status
+    status_icon = _STATUS_ICONS.get(status, "❓")
     job_id_display = job.job_id if job.job_id is not None else "—"
-    return (
-        f"{status_icon} {job.status.name:<12} Job {job.name:<12} (ID: {job_id_display})"
-    )
+    return f"{status_icon} {status.name:<12} Job {job.name:<12} (ID: {job_id_display})"
@@ -85,6 +85,20 @@ def _isolate_legacy_history_db(tmp_path_factory, monkeypatch):
     monkeypatch.setattr(_conn, "LEGACY_HISTORY_DB_PATH", safe_legacy)
 
 
+@pytest.fixture(autouse=True)
+def _isolate_shared_webhook_clients(monkeypatch):
+    """Give every test an empty process-wide webhook-client pool.
+
+    :func:`shared_webhook_client` keeps one keep-alive client per webhook
+    URL for the whole process. Tests that redirect ``WebhookClient`` to a
+    local server would otherwise reuse a client (and socket) bound to an
+    earlier test's server.
+    """
+    import srunx.observability.notifications.webhook_client as _wc
+
+    monkeypatch.setattr(_wc, "_SHARED_CLIENTS", {})
+
+
 @pytest.fixture
 def temp_dir():
     """Create a temporary directory for tests."""
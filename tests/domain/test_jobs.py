@@ -342,6 +342,17 @@ class TestBaseJob:
         mock_run.assert_called_once()
         assert job._status.value == "RUNNING"
 
+    @patch("subprocess.run")
+    @patch.object(BaseJob, "refresh", wraps=BaseJob.refresh)
+    def test_base_job_refresh_cancelled_by_user(self, mock_refresh, mock_run):
+        """sacct's ``CANCELLED by <uid>`` maps to CANCELLED."""
+        mock_run.return_value.stdout = "12345|CANCELLED by 1000\n"
+
+        job = BaseJob(job_id=12345)
+        BaseJob.refresh(job)
+
+        assert job._status is JobStatus.CANCELLED
+
     @patch("subprocess.run")
     @patch.object(BaseJob, "refresh", wraps=BaseJob.refresh)
     def test_base_job_refresh_no_job_id(self, mock_refresh, mock_run):
@@ -132,6 +132,36 @@ class TestWorkflow:
         with pytest.raises(WorkflowValidationError, match="Circular dependency"):
             workflow.validate()
 
+    def test_workflow_validate_self_dependency(self):
+        """A job depending on itself is a cycle."""
+        job = Job(name="job1", command=["echo", "1"], depends_on=["job1"])
+
+        workflow = Workflow(name="test", jobs=[job])
+        with pytest.raises(WorkflowValidationError, match="involving job 'job1'"):
+            workflow.validate()
+
+    def test_workflow_validate_cycle_lists_blocked_jobs(self):
+        """Every job stuck behind the cycle is named, not just the first."""
+        jobs = [
+            Job(name="a", command=["true"], depends_on=["b"]),
+            Job(name="b", command=["true"], depends_on=["a"]),
+            Job(name="c", command=["true"], depends_on=["b"]),
+            Job(name="d", command=["true"]),
+        ]
+
+        with pytest.raises(WorkflowValidationError, match=r"\(unresolvable: a, b, c\)"):
+            Workflow(name="test", jobs=jobs).validate()
+
+    def test_workflow_validate_long_chain(self):
+        """Chains deeper than the recursion limit validate fine."""
+        jobs = [Job(name="job0", command=["true"])]
+        for i in range(1, 3000):
+            jobs.append(
+                Job(name=f"job{i}", command=["true"], depends_on=[f"job{i - 1}"])
+            )
+
+        Workflow(name="test", jobs=jobs).validate()
+
 
 class TestWorkflowAdd:
     """Test Workflow.add() method with dependency validation."""
@@ -161,3 +191,25 @@ class TestWorkflowAdd:
         job = Job(name="job1", command=["echo", "1"], depends_on=["nonexistent"])
         with pytest.raises(WorkflowValidationError, match="unknown job 'nonexistent'"):
             wf.add(job)
+
+
+class TestWorkflowShow:
+    """Test Workflow.show() plan rendering."""
+
+    def test_show_prints_each_job(self, capsys):
+        wf = Workflow(
+            name="plan",
+            jobs=[
+                Job(name="job1", command=["echo", "1"]),
+                Job(name="job2", command="ls", depends_on=["job1"]),
+            ],
+        )
+        wf.show()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines[0] == f"{' PLAN ':=^80}"
+        assert lines[1:3] == ["Workflow: plan", "Jobs: 2"]
+        assert "    Job: job1" in lines
+        assert "        Command:      echo 1" in lines
+        assert "        Dependencies: job1" in lines
+        assert lines[-2] == "=" * 80
@@ -1,4 +1,4 @@
-"""Tests for ScheduledReporter._get_historical_counts (L9).
+"""Tests for ScheduledReporter (historical counts: L9).
 
 Coverage split:
 
@@ -10,15 +10,27 @@ Coverage split:
   stubs ``_db_historical_counts`` to ``None`` so the fallback runs.
 - ``TestParseTimeframeToDelta`` — the new timeframe parser the DB
   path relies on.
+- ``TestQueueCounts`` — job / user / running sections share one squeue
+  snapshot.
+- ``TestSignalHandlers`` — one shared, weakly-referencing stop handler.
+- ``TestSendReport`` — the report hook is resolved once at construction.
+- ``TestReportConfigInclude`` — section list validation.
 """
 
-from datetime import timedelta
+import gc
+import signal
+import weakref
+from collections import Counter
+from datetime import datetime, timedelta
 from unittest.mock import MagicMock, patch
 
 import pytest
 
+from srunx.callbacks import Callback
+from srunx.domain import BaseJob, JobStatus
+from srunx.observability.monitoring import scheduler as scheduler_module
 from srunx.observability.monitoring.scheduler import ScheduledReporter
-from srunx.observability.monitoring.types import ReportConfig
+from srunx.observability.monitoring.types import Report, ReportConfig
 
 
 def _make_reporter(timeframe: str = "24h") -> ScheduledReporter:
@@ -245,3 +257,155 @@ class TestParseTimeframeToDelta:
     def test_rejects_invalid(self, bad):
         with pytest.raises(ValueError):
             ScheduledReporter._parse_timeframe_to_delta(bad)
+
+
+class TestQueueCounts:
+    """Job and user stats are derived from one ``queue_status_counts`` call."""
+
+    COUNTS = Counter(
+        {
+            ("RUNNING", "alice"): 2,
+            ("PENDING", "alice"): 1,
+            ("RUNNING", "bob"): 3,
+            ("PENDING", "bob"): 4,
+        }
+    )
+
+    def _reporter(
+        self, include: tuple[str, ...] = ("jobs", "user")
+    ) -> ScheduledReporter:
+        config = ReportConfig(schedule="1h", include=list(include), user="alice")
+        reporter = ScheduledReporter(
+            client=MagicMock(), callback=MagicMock(), config=config
+        )
+        reporter.client.queue_status_counts.return_value = self.COUNTS
+        reporter._get_historical_counts = MagicMock(return_value=(0, 0, 0))  # type: ignore[method-assign]
+        return reporter
+
+    def test_report_queries_squeue_once(self):
+        reporter = self._reporter()
+        report = reporter._generate_report()
+
+        reporter.client.queue_status_counts.assert_called_once_with()
+        reporter.client.queue.assert_not_called()
+        assert report.job_stats is not None
+        assert (report.job_stats.pending, report.job_stats.running) == (5, 5)
+        assert report.user_stats is not None
+        assert (report.user_stats.pending, report.user_stats.running) == (1, 2)
+
+    def test_queue_failure_yields_zero_stats(self):
+        reporter = self._reporter()
+        reporter.client.queue_status_counts.side_effect = OSError("no squeue")
+        report = reporter._generate_report()
+
+        assert report.job_stats is not None
+        assert report.job_stats.pending == report.job_stats.running == 0
+        assert report.user_stats is not None
+        assert report.user_stats.pending == report.user_stats.running == 0
+
+    def test_running_section_reuses_full_listing(self):
+        jobs = []
+        for job_id, (state, user) in enumerate(self.COUNTS.elements()):
+            job = BaseJob(name="j", job_id=job_id, user=user)
+            job.status = JobStatus(state)
+            jobs.append(job)
+        reporter = self._reporter(include=("jobs", "user", "running"))
+        reporter.client.queue.return_value = jobs
+
+        first = reporter._generate_report()
+        second = reporter._generate_report()
+
+        reporter.client.queue.assert_called_once_with()
+        reporter.client.queue_status_counts.assert_not_called()
+        for report in (first, second):
+            assert report.job_stats is not None
+            assert (report.job_stats.pending, report.job_stats.running) == (5, 5)
+            assert report.user_stats is not None
+            assert (report.user_stats.pending, report.user_stats.running) == (1, 2)
+            assert len(report.running_jobs) == len(jobs)
+
+
+class TestSignalHandlers:
+    """Reporters share one module-level SIGINT/SIGTERM handler."""
+
+    def test_handler_stops_every_live_reporter(self):
+        first = _make_reporter()
+        second = _make_reporter()
+        first.stop = MagicMock()  # type: ignore[method-assign]
+        second.stop = MagicMock()  # type: ignore[method-assign]
+
+        handler = signal.getsignal(signal.SIGTERM)
+        assert handler is scheduler_module._stop_reporters
+        assert signal.getsignal(signal.SIGINT) is handler
+        with pytest.raises(SystemExit):
+            handler(signal.SIGTERM, None)
+
+        first.stop.assert_called_once_with()
+        second.stop.assert_called_once_with()
+
+    def test_registry_does_not_keep_reporters_alive(self):
+        reporter = _make_reporter()
+        assert reporter in scheduler_module._REPORTERS
+        ref = weakref.ref(reporter)
+        del reporter
+        gc.collect()
+        assert ref() is None
+
+
+class TestSendReport:
+    """``_send_report`` calls the hook bound at construction time."""
+
+    def test_report_goes_to_implemented_hook(self):
+        received: list[Report] = []
+
+        class _Sink(Callback):
+            def on_scheduled_report(self, report: Report) -> None:
+                received.append(report)
+
+        reporter = ScheduledReporter(
+            client=MagicMock(),
+            callback=_Sink(),
+            config=ReportConfig(schedule="1h", include=["jobs"]),
+        )
+        report = Report(timestamp=datetime.now())
+        reporter._send_report(report)
+
+        assert received == [report]
+
+    def test_callback_without_hook_is_skipped(self):
+        class _NoReports(Callback):
+            pass
+
+        reporter = ScheduledReporter(
+            client=MagicMock(),
+            callback=_NoReports(),
+            config=ReportConfig(schedule="1h", include=["jobs"]),
+        )
+
+        assert reporter._report_sink is None
+        reporter._send_report(MagicMock())  # no AttributeError, no delivery
+
+    def test_duck_typed_callback_without_hook_is_skipped(self):
+        class _Plain:
+            pass
+
+        reporter = ScheduledReporter(
+            client=MagicMock(),
+            callback=_Plain(),  # type: ignore[arg-type]
+            config=ReportConfig(schedule="1h", include=["jobs"]),
+        )
+
+        assert reporter._report_sink is None
+        reporter._send_report(MagicMock())
+
+
+class TestReportConfigInclude:
+    """``include`` is coerced to a frozenset for O(1) section checks."""
+
+    def test_list_input_becomes_frozenset(self):
+        config = ReportConfig(schedule="1h", include=["jobs", "user", "jobs"])
+        assert config.include == frozenset({"jobs", "user"})
+
+    def test_unknown_section_rejected(self):
+        with pytest.raises(ValueError, match="Invalid include options"):
+            ReportConfig(schedule="1h", include=["jobs", "bogus"])
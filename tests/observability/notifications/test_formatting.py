@@ -1,6 +1,6 @@
 """Tests for SlackTableFormatter and SlackNotificationFormatter."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 
 from srunx.observability.notifications.formatting import (
     SlackNotificationFormatter,
@@ -110,6 +110,11 @@ class TestHeader:
         assert "2025-03-15 10:30:45" in result
         assert "🕐" in result
 
+    def test_aware_timestamp_shown_in_local_time(self):
+        ts = datetime(2025, 3, 15, 10, 30, 45, tzinfo=UTC)
+        result = SlackTableFormatter.header("Title", timestamp=ts)
+        assert ts.astimezone().strftime("%Y-%m-%d %H:%M:%S") in result
+
     def test_without_timestamp(self):
         result = SlackTableFormatter.header("Title")
         assert "🕐" not in result
@@ -273,6 +278,11 @@ class TestProgressBar:
         result = SlackTableFormatter.progress_bar(5, 10)
         assert len(result) == 10
 
+    def test_default_width_matches_computed_bar(self):
+        for value in range(11):
+            result = SlackTableFormatter.progress_bar(value, 10)
+            assert result == "█" * value + "░" * (10 - value)
+
 
 # ---------------------------------------------------------------------------
 # SlackNotificationFormatter
@@ -336,6 +346,17 @@ class TestJobStatusChange:
         )
         assert "gpu" in result
 
+    def test_sanitizes_partition(self):
+        result = self.fmt.job_status_change(
+            job_id=1,
+            name="job",
+            old_status="RUNNING",
+            new_status="COMPLETED",
+            partition="<gpu>*bold*",
+        )
+        assert "<gpu>" not in result
+        assert "&lt;gpu&gt;\\*bold\\*" in result
+
     def test_optional_runtime(self):
         result = self.fmt.job_status_change(
             job_id=1,
@@ -572,6 +593,20 @@ class TestClusterStatus:
         )
         assert "3d05:10" in result
 
+    def test_running_jobs_with_dict_runtime(self):
+        result = self.fmt.cluster_status(
+            running_jobs=[
+                {
+                    "job_id": 250,
+                    "name": "dict_job",
+                    "user": "dave",
+                    "runtime": {"days": 1, "seconds": 3 * 3600 + 7 * 60},
+                    "gpus": 1,
+                },
+            ],
+        )
+        assert "1d03:07" in result
+
     def test_running_jobs_no_runtime(self):
         result = self.fmt.cluster_status(
             running_jobs=[
@@ -9,7 +9,14 @@ break the shared utility's test surface.
 
 from __future__ import annotations
 
-from srunx.observability.notifications.sanitize import sanitize_slack_text
+import pytest
+
+from srunx.observability.notifications.sanitize import (
+    SLACK_WEBHOOK_URL_RE,
+    _sanitize_bounded,
+    is_valid_slack_webhook_url,
+    sanitize_slack_text,
+)
 
 
 class TestSanitizeSlackText:
@@ -104,3 +111,76 @@ class TestEmptyAndIdentity:
 
     def test_plain_text_unchanged(self) -> None:
         assert sanitize_slack_text("hello world") == "hello world"
+
+
+class TestSanitizeCache:
+    """Results are memoized on the truncated input."""
+
+    def test_repeated_input_hits_cache(self) -> None:
+        _sanitize_bounded.cache_clear()
+        first = sanitize_slack_text("train_job")
+        second = sanitize_slack_text("train_job")
+        assert first == second == "train\\_job"
+        assert _sanitize_bounded.cache_info().hits == 1
+
+    def test_huge_inputs_are_cached_by_their_bounded_prefix(self) -> None:
+        _sanitize_bounded.cache_clear()
+        sanitize_slack_text("x" * 2000 + "first traceback tail")
+        sanitize_slack_text("x" * 2000 + "second traceback tail")
+        assert _sanitize_bounded.cache_info().hits == 1
+
+
+class TestPreTruncation:
+    """Input is cut before escaping without changing the result."""
+
+    def test_escaped_prefix_matches_full_input(self) -> None:
+        text = "a_" * 600 + "<tail>"
+        result = sanitize_slack_text(text)
+        assert len(result) == 1003
+        assert result.startswith("a\\_a\\_")
+        assert result.endswith("...")
+
+    def test_exactly_max_length_input_with_escapes_truncated(self) -> None:
+        # 1000 input chars expand past the limit once escaped.
+        result = sanitize_slack_text("*" * 1000)
+        assert result == "\\*" * 500 + "..."
+
+
+class TestIsValidSlackWebhookUrl:
+    """The string check must agree with ``SLACK_WEBHOOK_URL_RE``."""
+
+    def test_valid_url(self) -> None:
+        assert is_valid_slack_webhook_url(
+            "https://hooks.slack.com/services/T000/B000/abc_DEF-123"
+        )
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            None,
+            123,
+            "",
+            "http://hooks.slack.com/services/T/B/X",
+            "https://hooks.slack.com.evil.com/services/T/B/X",
+            "https://hooks.slack.com/services/T/B",
+            "https://hooks.slack.com/services/T/B/X/Y",
+            "https://hooks.slack.com/services/T//X",
+            "https://hooks.slack.com/services/T/B/X?q=1",
+            "https://hooks.slack.com/services/T/B/X/",
+            "https://hooks.slack.com/services/T/B/X\n",
+            "https://hooks.slack.com/services/T/B/\u0661",
+        ],
+    )
+    def test_invalid_urls(self, url: object) -> None:
+        assert not is_valid_slack_webhook_url(url)
+
+    @pytest.mark.parametrize(
+        "url",
+        [
+            "https://hooks.slack.com/services/A/B/C",
+            "https://hooks.slack.com/services/A/B/C.D",
+            "https://hooks.slack.com/services/A-1/B_2/",
+        ],
+    )
+    def test_agrees_with_regex(self, url: str) -> None:
+        assert is_valid_slack_webhook_url(url) == bool(SLACK_WEBHOOK_URL_RE.match(url))
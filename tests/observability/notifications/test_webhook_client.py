@@ -0,0 +1,166 @@
+"""Tests for :class:`srunx.observability.notifications.webhook_client.KeepAliveWebhookClient`.
+
+Runs against a throwaway local HTTP/1.1 server so the connection reuse
+and error mapping are exercised end-to-end without touching Slack.
+"""
+
+from __future__ import annotations
+
+import inspect
+import json
+import socket
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+from urllib.error import URLError
+
+import pytest
+from slack_sdk import WebhookClient
+from slack_sdk.webhook import WebhookResponse
+
+from srunx.observability.notifications.webhook_client import (
+    KeepAliveWebhookClient,
+    close_shared_clients,
+    shared_webhook_client,
+)
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self) -> None:  # noqa: N802 — http.server naming
+        length = int(self.headers["Content-Length"])
+        self.server.bodies.append(json.loads(self.rfile.read(length)))  # type: ignore[attr-defined]
+        self.server.peers.add(self.client_address)  # type: ignore[attr-defined]
+        if self.path.endswith("/fail"):
+            status, body = 500, b"boom"
+        elif self.path.endswith("/limited") and len(self.server.bodies) == 1:  # type: ignore[attr-defined]
+            status, body = 429, b"rate_limited"
+        else:
+            status, body = 200, b"ok"
+        self.send_response(status)
+        if status == 429:
+            self.send_header("Retry-After", "0")
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server() -> Iterator[ThreadingHTTPServer]:
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    httpd.bodies = []  # type: ignore[attr-defined]
+    httpd.peers = set()  # type: ignore[attr-defined]
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield httpd
+    finally:
+        httpd.shutdown()
+        httpd.server_close()
+
+
+def _url(server: ThreadingHTTPServer, path: str = "/services/T/B/X") -> str:
+    host, port = server.server_address[:2]
+    return f"http://{host}:{port}{path}"
+
+
+class TestKeepAliveWebhookClient:
+    def test_sdk_still_calls_the_overridden_hook(self) -> None:
+        """Guard the private ``slack_sdk`` method the client overrides.
+
+        A release that renames it would silently bypass the keep-alive
+        transport; one that changes its signature would break every post.
+        """
+        hook = WebhookClient._perform_http_request_internal
+        assert list(inspect.signature(hook).parameters) == ["self", "url", "req"]
+
+        response = WebhookResponse(url="", status_code=200, body="ok", headers={})
+        with patch.object(
+            KeepAliveWebhookClient,
+            "_perform_http_request_internal",
+            return_value=response,
+        ) as perform:
+            KeepAliveWebhookClient("https://hooks.slack.com/services/T/B/X").send(
+                text="hello"
+            )
+
+        perform.assert_called_once()
+
+    def test_sends_json_body(self, server: ThreadingHTTPServer) -> None:
+        client = KeepAliveWebhookClient(_url(server))
+        resp = client.send(text="hello", blocks=[{"type": "divider"}])
+        client.close()
+
+        assert resp.status_code == 200
+        assert resp.body == "ok"
+        assert server.bodies == [  # type: ignore[attr-defined]
+            {"text": "hello", "blocks": [{"type": "divider"}]}
+        ]
+
+    def test_reuses_connection_across_sends(self, server: ThreadingHTTPServer) -> None:
+        client = KeepAliveWebhookClient(_url(server))
+        for i in range(3):
+            assert client.send(text=f"msg {i}").status_code == 200
+        client.close()
+
+        assert len(server.bodies) == 3  # type: ignore[attr-defined]
+        assert len(server.peers) == 1  # type: ignore[attr-defined]
+
+    def test_reconnects_after_close(self, server: ThreadingHTTPServer) -> None:
+        client = KeepAliveWebhookClient(_url(server))
+        client.send(text="first")
+        client.close()
+        client.send(text="second")
+        client.close()
+
+        assert len(server.peers) == 2  # type: ignore[attr-defined]
+
+    def test_error_status_returned_as_response(
+        self, server: ThreadingHTTPServer
+    ) -> None:
+        client = KeepAliveWebhookClient(_url(server, "/services/T/B/fail"))
+        resp = client.send(text="hello")
+        client.close()
+
+        assert resp.status_code == 500
+        assert resp.body == "boom"
+
+    def test_rate_limited_send_is_retried(self, server: ThreadingHTTPServer) -> None:
+        client = KeepAliveWebhookClient(_url(server, "/services/T/B/limited"))
+        resp = client.send(text="hello")
+        client.close()
+
+        assert resp.status_code == 200
+        assert len(server.bodies) == 2  # type: ignore[attr-defined]
+
+    def test_connection_refused_raises_url_error(self) -> None:
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        client = KeepAliveWebhookClient(
+            f"http://127.0.0.1:{port}/services/T/B/X", retry_handlers=[]
+        )
+
+        with pytest.raises(URLError):
+            client.send(text="hello")
+
+
+class TestSharedWebhookClient:
+    def test_one_client_per_url(self) -> None:
+        url_a = "https://hooks.slack.com/services/A/B/C"
+        url_b = "https://hooks.slack.com/services/D/E/F"
+
+        assert shared_webhook_client(url_a) is shared_webhook_client(url_a)
+        assert shared_webhook_client(url_a) is not shared_webhook_client(url_b)
+
+    def test_close_shared_clients_forgets_clients(self) -> None:
+        url = "https://hooks.slack.com/services/A/B/C"
+        first = shared_webhook_client(url)
+        close_shared_clients()
+        assert shared_webhook_client(url) is not first
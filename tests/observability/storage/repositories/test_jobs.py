@@ -134,6 +134,22 @@ def test_record_submission_ignore_preserves_fk_references(
     assert [r[0] for r in rows] == [jobs_row_id]
 
 
+def test_record_submission_stores_compact_json(repo: JobRepository) -> None:
+    repo.record_submission(
+        job_id=131,
+        name="t",
+        status="PENDING",
+        submission_source="cli",
+        command=["python", "train.py"],
+        metadata={"a": 1, "b": [1, 2]},
+    )
+    row = repo.conn.execute(
+        "SELECT command, metadata FROM jobs WHERE job_id = 131"
+    ).fetchone()
+    assert row["command"] == '["python","train.py"]'
+    assert row["metadata"] == '{"a":1,"b":[1,2]}'
+
+
 def test_update_status_fills_optional_fields(repo: JobRepository) -> None:
     repo.record_submission(
         job_id=303, name="j", status="PENDING", submission_source="web"
@@ -235,6 +251,129 @@ def test_list_all_respects_limit_and_offset(repo: JobRepository) -> None:
     assert len(page1) == 2 and len(page2) == 2
 
 
+def test_compute_stats_aggregates_in_range(repo: JobRepository) -> None:
+    seeds = [
+        (
+            801,
+            "COMPLETED",
+            2,
+            1,
+            "2026-04-19T10:00:00.000Z",
+            "2026-04-19T11:00:00.000Z",
+        ),
+        (
+            802,
+            "FAILED",
+            None,
+            1,
+            "2026-04-19T10:00:00.000Z",
+            "2026-04-19T10:30:00.000Z",
+        ),
+        (803, "PENDING", 4, 2, "2026-04-19T10:00:00.000Z", None),
+        (
+            804,
+            "COMPLETED",
+            8,
+            1,
+            "2026-03-01T10:00:00.000Z",
+            "2026-03-01T20:00:00.000Z",
+        ),
+    ]
+    for jid, status, gpus, nodes, submitted, completed in seeds:
+        repo.record_submission(
+            job_id=jid,
+            name=f"j{jid}",
+            status="PENDING",
+            submission_source="cli",
+            nodes=nodes,
+            gpus_per_node=gpus,
+            submitted_at=submitted,
+        )
+        if completed is not None:
+            repo.update_completion(
+                jid, status, completed_at=completed, scheduler_key="local"
+            )
+
+    stats = repo.compute_stats("2026-04-01", "2026-04-30")
+    assert stats["total_jobs"] == 3
+    assert stats["jobs_by_status"] == {"COMPLETED": 1, "FAILED": 1, "PENDING": 1}
+    assert stats["avg_duration_seconds"] == pytest.approx(2700.0)
+    # Only 801 has both a duration and GPUs: 1h * 2 GPUs * 1 node.
+    assert stats["total_gpu_hours"] == pytest.approx(2.0)
+
+    empty = repo.compute_stats("2027-01-01", "2027-01-31")
+    assert empty["total_jobs"] == 0
+    assert empty["jobs_by_status"] == {}
+    assert empty["avg_duration_seconds"] is None
+    assert empty["total_gpu_hours"] == 0
+
+
+def test_compute_stats_is_cached_until_next_write(repo: JobRepository) -> None:
+    repo.record_submission(
+        job_id=811,
+        name="j811",
+        status="PENDING",
+        submission_source="cli",
+        submitted_at="2026-04-19T10:00:00.000Z",
+    )
+    assert repo.compute_stats()["total_jobs"] == 1
+
+    # Writes that bypass the repository are only picked up after the TTL.
+    repo.conn.execute("DELETE FROM jobs")
+    repo.conn.execute("DELETE FROM jobs_daily_rollup")
+    assert repo.compute_stats()["total_jobs"] == 1
+
+    repo.record_submission(
+        job_id=812, name="j812", status="PENDING", submission_source="cli"
+    )
+    assert repo.compute_stats()["total_jobs"] == 1
+    assert repo.compute_stats()["jobs_by_status"] == {"PENDING": 1}
+
+
+def test_compute_stats_does_not_cache_uncommitted_writes(
+    repo: JobRepository,
+) -> None:
+    assert repo.compute_stats()["total_jobs"] == 0
+
+    repo.conn.execute("BEGIN")
+    repo.record_submission(
+        job_id=815, name="j815", status="PENDING", submission_source="cli"
+    )
+    assert repo.compute_stats()["total_jobs"] == 1
+    repo.conn.rollback()
+
+    assert repo.compute_stats()["total_jobs"] == 0
+
+
+def test_compute_stats_rollup_matches_row_scan(repo: JobRepository) -> None:
+    for jid, gpus in [(821, 1), (822, 2), (823, None)]:
+        repo.record_submission(
+            job_id=jid,
+            name=f"j{jid}",
+            status="PENDING",
+            submission_source="cli",
+            nodes=2,
+            gpus_per_node=gpus,
+            submitted_at=f"2026-05-0{jid - 820}T08:00:00.000Z",
+        )
+    repo.update_status(821, "RUNNING", scheduler_key="local")
+    repo.update_completion(
+        822, "FAILED", completed_at="2026-05-02T08:30:00.000Z", scheduler_key="local"
+    )
+    repo.update_completion(
+        823, "COMPLETED", completed_at="2026-05-03T09:00:00.000Z", scheduler_key="local"
+    )
+    repo.delete(821, scheduler_key="local")
+
+    by_day = repo.compute_stats("2026-05-01", "2026-05-31")
+    by_time = repo.compute_stats("2026-05-01T00:00:00", "2026-05-31T23:59:59")
+    for key in ("total_jobs", "jobs_by_status", "avg_duration_seconds"):
+        assert by_day[key] == by_time[key]
+    assert by_day["total_gpu_hours"] == pytest.approx(by_time["total_gpu_hours"])
+    assert by_day["jobs_by_status"] == {"FAILED": 1, "COMPLETED": 1}
+    assert by_day["total_gpu_hours"] == pytest.approx(0.5 * 2 * 2)
+
+
 def test_count_by_status_in_range(repo: JobRepository) -> None:
     for jid, status in [(701, "COMPLETED"), (702, "COMPLETED"), (703, "FAILED")]:
         repo.record_submission(
@@ -128,3 +128,22 @@ class TestCreateCliWorkflowRun:
 
         monkeypatch.setattr(connection_mod, "init_db", boom)
         assert create_cli_workflow_run(workflow_name="pipeline") is None
+
+
+class TestRecordSubmissionFromJob:
+    def test_row_and_seed_transition_commit_together(self, _isolated_db, monkeypatch):
+        """A failed transition insert rolls the ``jobs`` row back too."""
+        from srunx.observability.storage.repositories.job_state_transitions import (
+            JobStateTransitionRepository,
+        )
+
+        def boom(*a, **kw):
+            raise RuntimeError("disk full")
+
+        with monkeypatch.context() as m:
+            m.setattr(JobStateTransitionRepository, "insert", boom)
+            record_submission_from_job(_make_job("rolled_back", 200))
+        assert list_recent_jobs() == []
+
+        record_submission_from_job(_make_job("kept", 201))
+        assert [j["job_name"] for j in list_recent_jobs()] == ["kept"]
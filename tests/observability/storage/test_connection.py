@@ -57,12 +57,16 @@ def test_open_connection_applies_pragmas(tmp_path: Path) -> None:
         fk = conn.execute("PRAGMA foreign_keys").fetchone()[0]
         journal = conn.execute("PRAGMA journal_mode").fetchone()[0]
         busy = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        synchronous = conn.execute("PRAGMA synchronous").fetchone()[0]
+        temp_store = conn.execute("PRAGMA temp_store").fetchone()[0]
     finally:
         conn.close()
 
     assert fk == 1
     assert journal.lower() == "wal"
     assert busy == 5000
+    assert synchronous == 1  # NORMAL
+    assert temp_store == 2  # MEMORY
 
 
 def test_open_connection_creates_file_with_mode_0600(tmp_path: Path) -> None:
@@ -252,6 +256,97 @@ def test_initialized_connection_is_idempotent_across_multiple_calls(
     assert count == 1
 
 
+def test_initialized_connection_migrates_each_db_file_once(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(conn_mod, "LEGACY_HISTORY_DB_PATH", tmp_path / "nope.db")
+    calls: list[Path | None] = []
+    real_init_db = conn_mod.init_db
+
+    def counting_init_db(db_path: Path | None = None, **kwargs: object) -> Path:
+        calls.append(db_path)
+        return real_init_db(db_path, **kwargs)  # type: ignore[arg-type]
+
+    monkeypatch.setattr(conn_mod, "init_db", counting_init_db)
+
+    with initialized_connection():
+        pass
+    with initialized_connection():
+        pass
+    assert len(calls) == 1
+
+
+def test_initialized_connection_remigrates_a_recreated_db_file(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(conn_mod, "LEGACY_HISTORY_DB_PATH", tmp_path / "nope.db")
+    with initialized_connection():
+        pass
+
+    # Truncating in place keeps the inode, as a recreated file may.
+    db_path = get_db_path()
+    for sidecar in db_path.parent.glob(db_path.name + "-*"):
+        sidecar.unlink()
+    db_path.write_bytes(b"")
+
+    with initialized_connection() as conn:
+        names = {
+            r[0] for r in conn.execute("SELECT name FROM schema_version").fetchall()
+        }
+    assert "v1_initial" in names
+
+
+def test_init_db_without_legacy_cleanup_still_marks_db_migrated(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    legacy = tmp_path / "history.db"
+    legacy.write_bytes(b"")
+    monkeypatch.setattr(conn_mod, "LEGACY_HISTORY_DB_PATH", legacy)
+    init_db(delete_legacy=False)
+    assert legacy.exists()
+
+    calls: list[Path | None] = []
+    monkeypatch.setattr(
+        conn_mod, "init_db", lambda db_path=None, **kw: calls.append(db_path)
+    )
+    with initialized_connection(delete_legacy=False):
+        pass
+    assert calls == []
+    assert legacy.exists()
+
+    # A later caller that wants the legacy DB gone still gets its cleanup.
+    with initialized_connection():
+        pass
+    assert calls == []
+    assert not legacy.exists()
+
+
+def test_initialized_connection_runs_optimize_on_close(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.setattr(conn_mod, "LEGACY_HISTORY_DB_PATH", tmp_path / "nope.db")
+    seen: list[str] = []
+    monkeypatch.setattr(
+        conn_mod, "_optimize", lambda conn: seen.append(type(conn).__name__)
+    )
+
+    with initialized_connection():
+        assert seen == ["Connection"]  # init_db's connection
+    assert seen == ["Connection", "Connection"]
+
+
+def test_optimize_swallows_operational_error() -> None:
+    class _Busy:
+        def execute(self, sql: str) -> None:
+            raise sqlite3.OperationalError("database is locked")
+
+    conn_mod._optimize(_Busy())  # type: ignore[arg-type]
+
+
 def test_initialized_connection_closes_on_exception(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
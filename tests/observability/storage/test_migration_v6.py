@@ -24,11 +24,10 @@ def _apply(conn: sqlite3.Connection, max_version: int) -> None:
 
 
 class TestV6WidensSubmissionSource:
-    def test_v6_is_registered_last(self):
+    def test_v6_is_registered(self):
         v6 = next(m for m in MIGRATIONS if m.version == 6)
         assert v6.name == "v6_widen_submission_source_mcp"
         assert v6.requires_fk_off is True
-        assert max(m.version for m in MIGRATIONS) == 6
 
     def test_mcp_submission_source_accepted_after_v6(self, tmp_path: Path):
         conn = open_connection(tmp_path / "v6.db")
@@ -0,0 +1,52 @@
+"""Tests for the V7 migration: covering indexes for the jobs aggregates."""
+
+from __future__ import annotations
+
+import sqlite3
+from pathlib import Path
+
+from srunx.observability.storage.connection import open_connection
+from srunx.observability.storage.migrations import MIGRATIONS, apply_migrations
+
+
+def _plan(conn: sqlite3.Connection, sql: str, params: tuple) -> str:
+    rows = conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return " | ".join(r[3] for r in rows)
+
+
+class TestV7JobsStatsIndexes:
+    def test_v7_is_registered(self):
+        v7 = next(m for m in MIGRATIONS if m.version == 7)
+        assert v7.name == "v7_jobs_stats_indexes"
+        assert v7.requires_fk_off is False
+
+    def test_stats_queries_use_covering_indexes(self, tmp_path: Path):
+        conn = open_connection(tmp_path / "v7.db")
+        try:
+            apply_migrations(conn)
+            by_status = _plan(
+                conn,
+                "SELECT status, COUNT(*) FROM jobs "
+                "WHERE submitted_at >= ? AND submitted_at < ? GROUP BY status",
+                ("2026-01-01", "2026-02-01"),
+            )
+            gpu_hours = _plan(
+                conn,
+                "SELECT SUM(duration_secs * gpus_per_node * nodes) FROM jobs "
+                "WHERE submitted_at >= ? AND duration_secs IS NOT NULL "
+                "AND gpus_per_node IS NOT NULL",
+                ("2026-01-01",),
+            )
+            completed = _plan(
+                conn,
+                "SELECT status, COUNT(*) FROM jobs "
+                "WHERE completed_at >= ? AND completed_at < ? "
+                "AND status IN (?, ?) GROUP BY status",
+                ("2026-01-01", "2026-02-01", "COMPLETED", "FAILED"),
+            )
+        finally:
+            conn.close()
+
+        assert "COVERING INDEX idx_jobs_stats_cover" in by_status
+        assert "COVERING INDEX idx_jobs_stats_cover" in gpu_hours
+        assert "COVERING INDEX idx_jobs_status_completed_at" in completed
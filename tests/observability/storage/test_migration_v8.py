@@ -0,0 +1,52 @@
+"""Tests for the V8 migration: the ``jobs_daily_rollup`` table."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from srunx.observability.storage.connection import open_connection
+from srunx.observability.storage.migrations import MIGRATIONS, apply_migrations
+
+
+class TestV8JobsDailyRollup:
+    def test_v8_is_registered(self):
+        v8 = next(m for m in MIGRATIONS if m.version == 8)
+        assert v8.name == "v8_jobs_daily_rollup"
+        assert v8.requires_fk_off is False
+
+    def test_backfills_existing_jobs(self, tmp_path: Path, monkeypatch):
+        import srunx.observability.storage.migrations as mig_mod
+
+        conn = open_connection(tmp_path / "v8.db")
+        try:
+            monkeypatch.setattr(
+                mig_mod, "MIGRATIONS", [m for m in MIGRATIONS if m.version < 8]
+            )
+            apply_migrations(conn)
+            rows = [
+                (1, "COMPLETED", 2, 1, "2026-04-19T10:00:00.000Z", 3600),
+                (2, "COMPLETED", None, 1, "2026-04-19T11:00:00.000Z", 60),
+                (3, "PENDING", 4, 1, "2026-04-20T10:00:00.000Z", None),
+            ]
+            for job_id, status, gpus, nodes, submitted, duration in rows:
+                conn.execute(
+                    "INSERT INTO jobs (job_id, transport_type, scheduler_key, "
+                    "name, status, gpus_per_node, nodes, submitted_at, "
+                    "duration_secs, submission_source) "
+                    "VALUES (?, 'local', 'local', 'j', ?, ?, ?, ?, ?, 'cli')",
+                    (job_id, status, gpus, nodes, submitted, duration),
+                )
+            monkeypatch.setattr(mig_mod, "MIGRATIONS", MIGRATIONS)
+            assert apply_migrations(conn)[0] == "v8_jobs_daily_rollup"
+
+            got = conn.execute(
+                "SELECT day, status, job_count, duration_sum, duration_count, "
+                "gpu_secs FROM jobs_daily_rollup ORDER BY day, status"
+            ).fetchall()
+        finally:
+            conn.close()
+
+        assert [tuple(r) for r in got] == [
+            ("2026-04-19", "COMPLETED", 2, 3660, 2, 7200),
+            ("2026-04-20", "PENDING", 1, 0, 0, 0),
+        ]
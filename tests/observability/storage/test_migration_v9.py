@@ -0,0 +1,41 @@
+"""Tests for the V9 migration: drop the redundant ``idx_jobs_status``."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from srunx.observability.storage.connection import open_connection
+from srunx.observability.storage.migrations import MIGRATIONS, apply_migrations
+
+
+class TestV9DropJobsStatusIndex:
+    def test_v9_is_registered_last(self):
+        v9 = next(m for m in MIGRATIONS if m.version == 9)
+        assert v9.name == "v9_drop_jobs_status_index"
+        assert v9.requires_fk_off is False
+        assert max(m.version for m in MIGRATIONS) == 9
+
+    def test_status_lookups_use_composite_index(self, tmp_path: Path):
+        conn = open_connection(tmp_path / "v9.db")
+        try:
+            apply_migrations(conn)
+            idx = {
+                r[0]
+                for r in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='index' "
+                    "AND tbl_name='jobs'"
+                ).fetchall()
+            }
+            plan = " | ".join(
+                r[3]
+                for r in conn.execute(
+                    "EXPLAIN QUERY PLAN SELECT COUNT(*) FROM jobs WHERE status = ?",
+                    ("RUNNING",),
+                ).fetchall()
+            )
+        finally:
+            conn.close()
+
+        assert "idx_jobs_status" not in idx
+        assert "idx_jobs_status_completed_at" in idx
+        assert "idx_jobs_status_completed_at" in plan
@@ -0,0 +1,48 @@
+"""Tests for :class:`srunx.observability.recorder.DBRecorderSink`."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+from srunx.callbacks import Callback
+from srunx.domain import Job, JobStatus
+from srunx.observability.recorder import DBRecorderSink
+from srunx.slurm.local import Slurm
+
+
+def _job(job_id: int = 42) -> Job:
+    job = Job(name="train", command=["python", "train.py"], job_id=job_id)
+    job.status = JobStatus.COMPLETED
+    return job
+
+
+class TestDBRecorderSink:
+    def test_callbacks_see_the_recorded_row(self):
+        """``Slurm`` runs the DB sink first so callbacks can read their job."""
+        events: list[str] = []
+
+        class _Probe(Callback):
+            def on_job_submitted(self, job):
+                events.append("callback")
+
+        sbatch = MagicMock(stdout="42", stderr="", returncode=0)
+        job = Job(name="train", command=["python", "train.py"], log_dir="", work_dir="")
+        with (
+            patch("srunx.slurm.clients.local.subprocess.run", return_value=sbatch),
+            patch(
+                "srunx.observability.storage.cli_helpers.record_submission_from_job",
+                side_effect=lambda *a, **kw: events.append("recorded"),
+            ),
+        ):
+            Slurm(callbacks=[_Probe()]).submit(job)
+
+        assert job.job_id == 42
+        assert events == ["recorded", "callback"]
+
+    def test_record_history_false_skips_write(self):
+        with patch(
+            "srunx.observability.storage.cli_helpers.record_submission_from_job"
+        ) as rec:
+            DBRecorderSink().on_submit(_job(), record_history=False)
+
+        rec.assert_not_called()
@@ -814,6 +814,17 @@ class TestRenderJobScript:
         captured = capsys.readouterr()
         assert "Test template: test_job" in captured.out
 
+    def test_render_job_script_recompiles_edited_template(self, sample_job, temp_dir):
+        """The compiled-template cache is keyed on the file's mtime/size."""
+        template_path = temp_dir / "edited.jinja"
+        template_path.write_text("v1 {{ job_name }}")
+        script_path = render_job_script(template_path, sample_job, temp_dir)
+        assert Path(script_path).read_text() == "v1 test_job"
+
+        template_path.write_text("version2 {{ job_name }}")
+        script_path = render_job_script(template_path, sample_job, temp_dir)
+        assert Path(script_path).read_text() == "version2 test_job"
+
 
 class TestExportsValidation:
     """Test exports field validation on BaseJob."""
@@ -175,7 +175,7 @@ class TestWorkflowRunner:
 
     def test_from_yaml_nonexistent_file(self):
         """Test loading workflow from nonexistent file."""
-        with pytest.raises(FileNotFoundError):
+        with pytest.raises(FileNotFoundError, match="Workflow file not found"):
             WorkflowRunner.from_yaml("/nonexistent/file.yaml")
 
     def test_from_yaml_malformed_yaml(self, temp_dir):
@@ -12,6 +12,7 @@ Phase 2 Step 1 of the SSH sweep integration. Verifies that:
 
 from __future__ import annotations
 
+import threading
 from contextlib import contextmanager
 from typing import Any
 from unittest.mock import Mock, patch
@@ -327,3 +328,59 @@ jobs:
     runner = WorkflowRunner.from_yaml(yaml_path, submission_context=ctx)
 
     assert runner._submission_context is ctx
+
+
+@patch("srunx.runtime.workflow.runner._transition_workflow_run")
+@patch("srunx.observability.storage.cli_helpers.create_cli_workflow_run")
+def test_wide_fan_out_runs_jobs_concurrently(
+    mock_create: Mock,
+    _mock_transition: Mock,
+) -> None:
+    """Independent jobs are all in flight at once, not eight at a time."""
+    mock_create.return_value = 1
+    jobs = [Job(name=f"job{i}", command=["true"]) for i in range(12)]
+    barrier = threading.Barrier(len(jobs), timeout=5)
+
+    class _BlockingExecutor(_FakeExecutor):
+        def run(self, job: Any, **kwargs: Any) -> Any:
+            barrier.wait()  # breaks unless every job runs concurrently
+            return super().run(job, **kwargs)
+
+    executor = _BlockingExecutor()
+
+    @contextmanager
+    def factory() -> Any:
+        yield executor
+
+    results = WorkflowRunner(
+        Workflow(name="wide", jobs=list(jobs)), executor_factory=factory
+    ).run()
+
+    assert set(results) == {job.name for job in jobs}
+
+
+@patch("srunx.runtime.workflow.runner._transition_workflow_run")
+@patch("srunx.observability.storage.cli_helpers.create_cli_workflow_run")
+def test_dependents_are_scheduled_without_polling(
+    mock_create: Mock,
+    _mock_transition: Mock,
+) -> None:
+    """The scheduling loop blocks on completions instead of sleep-polling."""
+    mock_create.return_value = 1
+    first = Job(name="first", command=["true"])
+    second = Job(name="second", command=["true"], depends_on=["first"])
+    executor = _FakeExecutor()
+
+    @contextmanager
+    def factory() -> Any:
+        yield executor
+
+    runner = WorkflowRunner(
+        Workflow(name="chain", jobs=[first, second]), executor_factory=factory
+    )
+    with patch("srunx.runtime.workflow.runner.time.sleep") as mock_sleep:
+        results = runner.run()
+
+    assert set(results) == {"first", "second"}
+    assert [job.name for job, _ in executor.run_calls] == ["first", "second"]
+    mock_sleep.assert_not_called()
@@ -9,13 +9,23 @@ inspect the argv and the ``env=`` mapping.
 
 from __future__ import annotations
 
+import io
 import os
+import subprocess
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from srunx.domain import Job, JobEnvironment, ShellJob
-from srunx.slurm.clients.local import LocalClient
+from srunx.domain import BaseJob, Job, JobEnvironment, JobStatus, ShellJob
+from srunx.slurm.clients.local import (
+    _SACCT_MISSES_BEFORE_UNKNOWN,
+    LocalClient,
+    _read_last_lines,
+    _read_tail,
+    _script_tmpdir,
+    _StatusBatcher,
+    _stream_lines,
+)
 
 
 def _fake_run_result(job_id: str = "12345") -> MagicMock:
@@ -151,3 +161,319 @@ class TestLocalSubmitNoEnvPreservesExportPolicy:
         # The job still receives the overridden PATH via --export=ALL.
         assert kwargs["env"]["PATH"] == "/custom/bin"
         assert "--export=ALL" in args[0]
+
+
+class TestStatusBatcher:
+    """Concurrent monitors share one ``sacct`` query per tick."""
+
+    def test_single_job_uses_job_refresh(self):
+        batcher = _StatusBatcher()
+        job = MagicMock(job_id=1)
+        batcher.watch(1)
+        with patch("srunx.slurm.clients.local.subprocess.run") as mock_run:
+            batcher.refresh(job, max_age=5)
+
+        job.refresh.assert_called_once()
+        mock_run.assert_not_called()
+
+    def test_watched_jobs_share_one_query(self):
+        batcher = _StatusBatcher()
+        job_a = BaseJob(name="a", job_id=1)
+        job_b = BaseJob(name="b", job_id=2)
+        batcher.watch(1)
+        batcher.watch(2)
+        result = _fake_run_result("1|RUNNING\n1.batch|RUNNING\n2|CANCELLED by 1000\n")
+        with patch(
+            "srunx.slurm.clients.local.subprocess.run", return_value=result
+        ) as mock_run:
+            batcher.refresh(job_a, max_age=60)
+            batcher.refresh(job_b, max_age=60)
+
+        mock_run.assert_called_once()
+        assert "1,2" in mock_run.call_args[0][0]
+        assert job_a._status is JobStatus.RUNNING
+        assert job_b._status is JobStatus.CANCELLED
+
+    def test_unlisted_job_keeps_status_until_next_tick(self):
+        batcher = _StatusBatcher()
+        job = BaseJob(name="new", job_id=3)
+        batcher.watch(3)
+        batcher.watch(4)
+        with (
+            patch(
+                "srunx.slurm.clients.local.subprocess.run",
+                return_value=_fake_run_result("4|RUNNING\n"),
+            ) as mock_run,
+            patch.object(BaseJob, "refresh") as refresh,
+        ):
+            batcher.refresh(job, max_age=60)
+            batcher.refresh(job, max_age=60)
+
+        mock_run.assert_called_once()
+        refresh.assert_not_called()
+        assert job._status is JobStatus.PENDING
+
+    def test_job_missing_from_repeated_snapshots_is_unknown(self):
+        batcher = _StatusBatcher()
+        job = BaseJob(name="gone", job_id=3)
+        batcher.watch(3)
+        batcher.watch(4)
+        with patch(
+            "srunx.slurm.clients.local.subprocess.run",
+            return_value=_fake_run_result("4|RUNNING\n"),
+        ):
+            for _ in range(_SACCT_MISSES_BEFORE_UNKNOWN - 1):
+                batcher.refresh(job, max_age=0)
+            assert job._status is JobStatus.PENDING
+            batcher.refresh(job, max_age=0)
+
+        assert job._status is JobStatus.UNKNOWN
+
+    def test_failed_query_is_not_retried_within_tick(self):
+        batcher = _StatusBatcher()
+        job_a = BaseJob(name="a", job_id=1)
+        job_b = BaseJob(name="b", job_id=2)
+        batcher.watch(1)
+        batcher.watch(2)
+        with (
+            patch(
+                "srunx.slurm.clients.local.subprocess.run",
+                side_effect=subprocess.CalledProcessError(1, "sacct"),
+            ) as mock_run,
+            patch.object(BaseJob, "refresh") as refresh,
+        ):
+            batcher.refresh(job_a, max_age=60)
+            batcher.refresh(job_b, max_age=60)
+
+        mock_run.assert_called_once()
+        refresh.assert_not_called()
+        assert job_a._status is JobStatus.PENDING
+
+    def test_unwatch_forgets_job(self):
+        batcher = _StatusBatcher()
+        batcher.watch(1)
+        batcher.watch(1)
+        batcher.unwatch(1)
+        assert batcher._watched == {1: 1}
+        batcher.unwatch(1)
+        assert batcher._watched == {}
+
+
+def _fake_popen(stdout: str, returncode: int = 0) -> MagicMock:
+    proc = MagicMock()
+    proc.__enter__.return_value = proc
+    proc.stdout = io.StringIO(stdout)
+    proc.stderr = io.StringIO("")
+    proc.returncode = returncode
+    return proc
+
+
+class TestQueueStatusCounts:
+    """``queue_status_counts`` tallies a two-column squeue without BaseJobs."""
+
+    def test_counts_by_state_and_user(self, client):
+        proc = _fake_popen("RUNNING|alice\nPENDING|alice\nRUNNING|bob\nRUNNING|alice\n")
+        with patch(
+            "srunx.slurm.clients.local.subprocess.Popen", return_value=proc
+        ) as mock_popen:
+            counts = client.queue_status_counts()
+
+        mock_popen.assert_called_once()
+        assert mock_popen.call_args[0][0] == [
+            "squeue",
+            "--format",
+            "%T|%u",
+            "--noheader",
+        ]
+        assert counts == {
+            ("RUNNING", "alice"): 2,
+            ("PENDING", "alice"): 1,
+            ("RUNNING", "bob"): 1,
+        }
+
+    def test_states_are_mapped_like_queue(self, client):
+        """States ``queue`` has no member for count as pending, as there."""
+        proc = _fake_popen("COMPLETING|alice\nCONFIGURING|alice\nRUNNING|alice\n")
+        with patch("srunx.slurm.clients.local.subprocess.Popen", return_value=proc):
+            counts = client.queue_status_counts()
+
+        assert counts == {("PENDING", "alice"): 2, ("RUNNING", "alice"): 1}
+
+    def test_user_filter_is_passed_to_squeue(self, client):
+        with patch(
+            "srunx.slurm.clients.local.subprocess.Popen",
+            return_value=_fake_popen(""),
+        ) as mock_popen:
+            assert client.queue_status_counts(user="alice") == {}
+
+        assert mock_popen.call_args[0][0][-2:] == ["--user", "alice"]
+
+
+class TestStreamLines:
+    """``_stream_lines`` yields output as it arrives and checks the exit code."""
+
+    def test_yields_each_line(self):
+        assert list(_stream_lines(["printf", "a\\nb\\n"])) == ["a\n", "b\n"]
+
+    def test_failure_raises_after_output(self):
+        lines = _stream_lines(["sh", "-c", "echo partial; echo boom >&2; exit 3"])
+        assert next(lines) == "partial\n"
+        with pytest.raises(subprocess.CalledProcessError) as exc_info:
+            next(lines)
+        assert exc_info.value.returncode == 3
+        assert exc_info.value.stderr == "boom\n"
+
+    def test_heavy_stderr_does_not_block_stdout(self):
+        # Far more than a pipe buffer (64 KiB on Linux) of stderr before
+        # the first stdout line.
+        cmd = ["sh", "-c", "head -c 1000000 /dev/zero | tr '\\0' x >&2; echo ok"]
+        assert list(_stream_lines(cmd)) == ["ok\n"]
+
+
+class TestScriptTmpdir:
+    """Rendered scripts honor ``TMPDIR`` before falling back to tmpfs."""
+
+    def test_explicit_tmpdir_wins(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("TMPDIR", str(tmp_path))
+        assert _script_tmpdir() is None
+
+    def test_uses_dev_shm_without_tmpdir(self, monkeypatch):
+        monkeypatch.delenv("TMPDIR", raising=False)
+        with (
+            patch("os.path.isdir", return_value=True),
+            patch("os.access", return_value=True),
+        ):
+            assert _script_tmpdir() == "/dev/shm"
+
+
+class TestQueueStderr:
+    """``queue`` reads its rows even while ``squeue`` floods stderr."""
+
+    def test_heavy_stderr_does_not_block_queue(self, client, tmp_path, monkeypatch):
+        squeue = tmp_path / "squeue"
+        squeue.write_text(
+            "#!/bin/sh\n"
+            "head -c 1000000 /dev/zero | tr '\\0' x >&2\n"
+            "echo '7|gpu|train|alice|RUNNING|1:00|2:00|1|4|node1|N/A'\n"
+        )
+        squeue.chmod(0o755)
+        monkeypatch.setenv("PATH", f"{tmp_path}{os.pathsep}{os.environ['PATH']}")
+
+        assert [job.job_id for job in client.queue()] == [7]
+
+
+class TestMonitorTerminalJob:
+    """A job already in a terminal state is resolved without polling."""
+
+    def test_completed_job_returns_without_refresh(self):
+        sink = MagicMock()
+        client = LocalClient(sink=sink)
+        job = BaseJob(name="done", job_id=11)
+        job.status = JobStatus.COMPLETED
+
+        with (
+            patch.object(BaseJob, "refresh") as refresh,
+            patch("srunx.slurm.clients.local.time.sleep") as sleep,
+        ):
+            assert client.monitor(job) is job
+
+        refresh.assert_not_called()
+        sleep.assert_not_called()
+        sink.on_terminal.assert_called_once_with(job)
+
+    def test_failed_job_raises_without_refresh(self):
+        client = LocalClient()
+        job = BaseJob(name="broken", job_id=12)
+        job.status = JobStatus.FAILED
+
+        with patch.object(BaseJob, "refresh") as refresh:
+            with pytest.raises(RuntimeError):
+                client.monitor(job)
+
+        refresh.assert_not_called()
+
+
+class TestFindLogFiles:
+    """Log discovery lists matches once, best pattern first."""
+
+    @pytest.fixture
+    def log_dir(self, tmp_path, monkeypatch):
+        log_dir = tmp_path / "logs"
+        log_dir.mkdir()
+        monkeypatch.setenv("SLURM_LOG_DIR", str(log_dir))
+        # Keep the cwd search from picking up anything.
+        cwd = tmp_path / "cwd"
+        cwd.mkdir()
+        monkeypatch.chdir(cwd)
+        return log_dir
+
+    def test_orders_by_pattern_priority(self, log_dir):
+        for name in (
+            "123.log",
+            "slurm-123.err",
+            "other_123.out",
+            "train_123.log",
+            "train_1234.log",
+            ".hidden_123.log",
+        ):
+            (log_dir / name).touch()
+
+        found, searched = LocalClient._find_log_files(123, "train")
+
+        assert [os.path.basename(f) for f in found] == [
+            "train_123.log",
+            "other_123.out",
+            "slurm-123.err",
+            "123.log",
+        ]
+        assert searched == [str(log_dir), "./"]
+
+    def test_file_matching_several_patterns_listed_once(self, log_dir):
+        (log_dir / "job_7.log").touch()
+
+        found, _ = LocalClient._find_log_files(7)
+
+        assert found == [str(log_dir / "job_7.log")]
+
+    def test_job_name_is_not_a_glob(self, log_dir):
+        (log_dir / "a_9.log").touch()
+
+        found, _ = LocalClient._find_log_files(9, "[ab]")
+
+        assert found == [str(log_dir / "a_9.log")]
+
+    def test_missing_log_dir_is_skipped(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("SLURM_LOG_DIR", str(tmp_path / "nope"))
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / "slurm-5.out").touch()
+
+        found, _ = LocalClient._find_log_files(5)
+
+        assert found == ["slurm-5.out"]
+
+
+class TestLogTailReaders:
+    """Tail reads only decode the end of the log."""
+
+    @pytest.mark.parametrize(
+        ("content", "n", "expected"),
+        [
+            ("a\nb\nc\n", 2, "b\nc\n"),
+            ("a\nb\nc", 2, "b\nc"),
+            ("a\nb\n", 5, "a\nb\n"),
+            ("\n\nx\n", 2, "\nx\n"),
+            ("", 3, ""),
+        ],
+    )
+    def test_read_last_lines(self, tmp_path, content, n, expected):
+        path = tmp_path / "job.log"
+        path.write_bytes(content.encode())
+
+        assert _read_last_lines(path, n) == (expected, len(content))
+
+    def test_read_tail_caps_size(self, tmp_path):
+        path = tmp_path / "job.log"
+        path.write_text("x" * 100 + "END")
+
+        assert _read_tail(path, 1024) == "x" * 100 + "END"
+        assert _read_tail(path, 5) == "[... 98 earlier bytes omitted ...]\nxxEND"
@@ -301,6 +301,23 @@ class TestListJobsParsing:
         assert [j["job_id"] for j in jobs] == [18431]
 
 
+class TestQueueStatusCountsParsing:
+    def test_states_are_mapped_like_queue(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        monkeypatch.setattr(
+            "srunx.slurm.clients._ssh_queries._run_slurm_cmd",
+            lambda _a, _c: "RUNNING|alice\nCOMPLETING|alice\nPENDING|bob\n",
+        )
+        adapter = object.__new__(SlurmSSHClient)
+
+        assert adapter.queue_status_counts() == {
+            ("RUNNING", "alice"): 1,
+            ("UNKNOWN", "alice"): 1,
+            ("PENDING", "bob"): 1,
+        }
+
+
 # ── sacct Output Parsing ──────────────────────────
 
 
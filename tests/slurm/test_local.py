@@ -244,28 +244,28 @@ class TestSlurm:
         with pytest.raises(subprocess.CalledProcessError):
             client.cancel(12345)
 
-    @patch("subprocess.run")
-    def test_queue_empty(self, mock_run):
+    @patch("srunx.slurm.clients.local._stream_lines")
+    def test_queue_empty(self, mock_stream):
         """Test queue with no jobs."""
-        mock_run.return_value.stdout = ""
+        mock_stream.return_value = []
 
         client = Slurm()
         jobs = client.queue()
 
         assert jobs == []
 
-    @patch("subprocess.run")
-    def test_queue_with_jobs(self, mock_run):
+    @patch("srunx.slurm.clients.local._stream_lines")
+    def test_queue_with_jobs(self, mock_stream):
         """Test queue with jobs.
 
         Format: %i|%P|%j|%u|%T|%M|%l|%D|%C|%R|%b — new pipe-delimited
         shape gained when squeue started surfacing user/CPUs/NodeList
         alongside the original columns.
         """
-        mock_run.return_value.stdout = (
-            "12345|gpu|test_job1|user|RUNNING|5:00|1:00:00|1|8|node1|gpu:4\n"
-            "12346|cpu|test_job2|user|PENDING|0:00|30:00|1|4|(Priority)|(null)\n"
-        )
+        mock_stream.return_value = [
+            "12345|gpu|test_job1|user|RUNNING|5:00|1:00:00|1|8|node1|gpu:4\n",
+            "12346|cpu|test_job2|user|PENDING|0:00|30:00|1|4|(Priority)|(null)\n",
+        ]
 
         client = Slurm()
         jobs = client.queue()
@@ -283,15 +283,26 @@ class TestSlurm:
         assert jobs[1]._status == JobStatus.PENDING
         assert jobs[1].nodelist == "(Priority)"
 
-    @patch("subprocess.run")
-    def test_queue_with_user(self, mock_run):
+    @patch("srunx.slurm.clients.local._stream_lines")
+    def test_queue_unknown_state_defaults_to_pending(self, mock_stream):
+        """States srunx does not model (e.g. COMPLETING) map to PENDING."""
+        mock_stream.return_value = [
+            "12347|gpu|job3|user|COMPLETING|1:00|1:00:00|1|8|node1|(null)\n"
+        ]
+
+        jobs = Slurm().queue()
+
+        assert jobs[0]._status == JobStatus.PENDING
+
+    @patch("srunx.slurm.clients.local._stream_lines")
+    def test_queue_with_user(self, mock_stream):
         """Test queue with specific user."""
-        mock_run.return_value.stdout = ""
+        mock_stream.return_value = []
 
         client = Slurm()
         client.queue(user="testuser")
 
-        args, kwargs = mock_run.call_args
+        args, kwargs = mock_stream.call_args
         assert "--user" in args[0]
         assert "testuser" in args[0]
 
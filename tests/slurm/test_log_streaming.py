@@ -184,6 +184,37 @@ class TestLastNOptimization:
         assert "Line 100" in output_text
         assert "Line 97" not in output_text
 
+    def test_tail_log_prints_log_text_without_markup(self, tmp_path, monkeypatch):
+        """Log lines are printed verbatim: no Rich markup or highlighting."""
+        log_file = tmp_path / "job_101.log"
+        log_file.write_text("[red]not markup[/red]\n")
+
+        def mock_get_job_output_detailed(
+            self, job_id, job_name=None, skip_content=False
+        ):
+            return {
+                "found_files": [str(log_file)],
+                "primary_log": str(log_file),
+                "output": "",
+                "error": "",
+                "slurm_log_dir": str(tmp_path),
+                "searched_dirs": [str(tmp_path)],
+            }
+
+        monkeypatch.setattr(
+            Slurm, "get_job_output_detailed", mock_get_job_output_detailed
+        )
+        client = Slurm()
+
+        with patch("rich.console.Console") as MockConsole:
+            mock_console = MockConsole.return_value
+            client.tail_log(job_id=101, follow=False, last_n=1)
+
+        args, kwargs = mock_console.print.call_args_list[1]
+        assert args[0] == "[red]not markup[/red]\n"
+        assert kwargs["markup"] is False
+        assert kwargs["highlight"] is False
+
     def test_tail_log_static_no_last_n_reads_full_content(self, tmp_path, monkeypatch):
         """Test that static mode without last_n reads full content."""
         log_file = tmp_path / "job_200.log"
@@ -216,6 +247,57 @@ class TestLastNOptimization:
         # Should have called with skip_content=False
         assert skip_content_called_with == [False]
 
+    def test_tail_log_follow_flushes_tail_when_job_finishes(
+        self, tmp_path, monkeypatch
+    ):
+        """Lines written just before the job ends are still printed."""
+        from srunx.domain import BaseJob, JobStatus
+        from srunx.slurm.clients import local as local_mod
+
+        log_file = tmp_path / "job_300.log"
+        log_file.write_text("")
+
+        def mock_get_job_output_detailed(
+            self, job_id, job_name=None, skip_content=False
+        ):
+            return {
+                "found_files": [str(log_file)],
+                "primary_log": str(log_file),
+                "output": "",
+                "error": "",
+                "slurm_log_dir": str(tmp_path),
+                "searched_dirs": [str(tmp_path)],
+            }
+
+        retrieve_calls = []
+
+        def mock_retrieve(job_id):
+            retrieve_calls.append(job_id)
+            with open(log_file, "a") as f:
+                f.write("last line\n")
+            job = BaseJob(name="done", job_id=job_id)
+            job._status = JobStatus.COMPLETED
+            return job
+
+        monkeypatch.setattr(
+            Slurm, "get_job_output_detailed", mock_get_job_output_detailed
+        )
+        monkeypatch.setattr(Slurm, "retrieve", staticmethod(mock_retrieve))
+        # The first status check must not wait out the interval.
+        monkeypatch.setattr(local_mod, "_FOLLOW_STATUS_INTERVAL", 3600.0)
+        client = Slurm()
+
+        printed = []
+        with patch("rich.console.Console") as MockConsole:
+            MockConsole.return_value.print.side_effect = lambda *args, **kwargs: (
+                printed.append(args[0] if args else "")
+            )
+            client.tail_log(job_id=300, follow=True, poll_interval=0)
+
+        assert retrieve_calls == [300]
+        assert "last line\n" in printed
+        assert "finished with status: COMPLETED" in printed[-1]
+
 
 @pytest.mark.skip(reason="SSH tests require actual SSH connection")
 class TestSSHLogStreaming:
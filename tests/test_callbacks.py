@@ -1,11 +1,15 @@
 """Tests for srunx.callbacks module."""
 
+import gc
+import threading
+import time
+import weakref
 from unittest.mock import Mock, patch
 
 import pytest
 
-from srunx.callbacks import Callback, NotificationWatchCallback
-from srunx.domain import BaseJob, Job, JobEnvironment, JobStatus  # noqa: F401
+from srunx.callbacks import Callback, NotificationWatchCallback, implements
+from srunx.domain import BaseJob, Job, JobEnvironment, JobStatus, Workflow  # noqa: F401
 from srunx.observability.notifications.legacy_slack import SlackCallback
 
 
@@ -36,6 +40,22 @@ class TestCallback:
         assert callback.on_job_running(job) is None
         assert callback.on_job_cancelled(job) is None
 
+    def test_implemented_hooks_computed_for_subclasses(self):
+        """Subclasses record exactly the hooks they override."""
+
+        class CompletionOnly(Callback):
+            def on_job_completed(self, job):
+                pass
+
+        assert Callback._IMPLEMENTED == frozenset()
+        assert CompletionOnly._IMPLEMENTED == frozenset({"on_job_completed"})
+        assert implements(CompletionOnly(), "on_job_completed")
+        assert not implements(CompletionOnly(), "on_job_running")
+
+    def test_implements_assumes_duck_typed_callbacks_handle_everything(self):
+        """Non-Callback objects are always dispatched to."""
+        assert implements(Mock(), "on_job_running")
+
 
 class TestSlackCallback:
     """Test SlackCallback class."""
@@ -49,7 +69,7 @@ class TestSlackCallback:
         # Check that the client was initialized with the webhook URL
         assert hasattr(callback, "client")
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_slack_callback_init_with_mock(self, mock_webhook_client):
         """Test SlackCallback initialization with mock."""
         webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
@@ -61,7 +81,7 @@ class TestSlackCallback:
         mock_webhook_client.assert_called_once_with(webhook_url)
         assert callback.client is mock_client
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_on_job_completed(self, mock_webhook_client):
         """Test on_job_completed method."""
         mock_client = Mock()
@@ -74,6 +94,7 @@ class TestSlackCallback:
         job.status = JobStatus.COMPLETED
 
         callback.on_job_completed(job)
+        callback.close()
 
         # Check that the client.send was called
         mock_client.send.assert_called_once()
@@ -86,7 +107,7 @@ class TestSlackCallback:
         # Note: underscores are escaped in sanitization
         assert "Job test\\_job" in call_args[1]["blocks"][0]["text"]["text"]
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_on_job_failed(self, mock_webhook_client):
         """Test on_job_failed method."""
         mock_client = Mock()
@@ -99,6 +120,7 @@ class TestSlackCallback:
         job.status = JobStatus.FAILED
 
         callback.on_job_failed(job)
+        callback.close()
 
         # Check that the client.send was called
         mock_client.send.assert_called_once()
@@ -111,7 +133,7 @@ class TestSlackCallback:
         # Note: underscores are escaped in sanitization
         assert "Job failed\\_job" in call_args[1]["blocks"][0]["text"]["text"]
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_on_job_completed_with_full_job(self, mock_webhook_client):
         """Test on_job_completed with a full Job object."""
         mock_client = Mock()
@@ -129,13 +151,14 @@ class TestSlackCallback:
         job.status = JobStatus.COMPLETED
 
         callback.on_job_completed(job)
+        callback.close()
 
         mock_client.send.assert_called_once()
         call_args = mock_client.send.call_args
         # Note: underscores are escaped in sanitization
         assert "Job ml\\_training" in call_args[1]["blocks"][0]["text"]["text"]
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_on_job_failed_with_full_job(self, mock_webhook_client):
         """Test on_job_failed with a full Job object."""
         mock_client = Mock()
@@ -153,41 +176,38 @@ class TestSlackCallback:
         job.status = JobStatus.FAILED
 
         callback.on_job_failed(job)
+        callback.close()
 
         mock_client.send.assert_called_once()
         call_args = mock_client.send.call_args
         # No underscores in "preprocessing", so no escaping needed
         assert "Job preprocessing" in call_args[1]["blocks"][0]["text"]["text"]
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_slack_callback_other_methods_implemented(self, mock_webhook_client):
         """Test that on_job_running and on_job_cancelled send notifications."""
         mock_client = Mock()
         mock_webhook_client.return_value = mock_client
 
         webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
-        callback = SlackCallback(webhook_url)
+        callback = SlackCallback(webhook_url, batch_window=0)
 
         job = BaseJob(name="test_job", job_id=12345)
         job.status = JobStatus.RUNNING
 
         # Test on_job_running
         callback.on_job_running(job)
-        assert mock_client.send.call_count == 1
-        call_args = mock_client.send.call_args
-        assert call_args[1]["text"] == "Job running"
-
-        # Reset mock
-        mock_client.reset_mock()
 
         # Test on_job_cancelled
         job.status = JobStatus.CANCELLED
         callback.on_job_cancelled(job)
-        assert mock_client.send.call_count == 1
-        call_args = mock_client.send.call_args
-        assert call_args[1]["text"] == "Job cancelled"
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+        callback.close()
+        assert mock_client.send.call_count == 2
+        texts = [c[1]["text"] for c in mock_client.send.call_args_list]
+        assert texts == ["Job running", "Job cancelled"]
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_slack_callback_handles_send_error(self, mock_webhook_client):
         """Test SlackCallback handles send errors gracefully."""
         mock_client = Mock()
@@ -195,60 +215,296 @@ class TestSlackCallback:
         mock_webhook_client.return_value = mock_client
 
         webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
-        callback = SlackCallback(webhook_url)
+        callback = SlackCallback(webhook_url, batch_window=0)
 
         job = BaseJob(name="test_job", job_id=12345)
 
-        # Currently, SlackCallback doesn't handle errors gracefully
-        # This would raise exceptions, which is the current behavior
-        with pytest.raises(Exception):
+        # Sends run on the background pool: a failing post is logged by the
+        # worker and never propagates into the job-state loop.
+        callback.on_job_completed(job)
+        callback.on_job_failed(job)
+        callback.close()
+
+        assert mock_client.send.call_count == 2
+
+    @staticmethod
+    def _block_sender(callback, mock_client):
+        """Park the sender thread inside ``send`` and return its release event."""
+        entered = threading.Event()
+        release = threading.Event()
+
+        def blocking_send(**kwargs):
+            entered.set()
+            release.wait(5)
+
+        mock_client.send.side_effect = blocking_send
+        callback.on_job_submitted(BaseJob(name="blocker", job_id=0))
+        assert entered.wait(5)
+        return release
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_queue_overflow_drops_oldest(self, mock_webhook_client):
+        """A full queue drops the oldest pending notification."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(
+            webhook_url, rate_per_sec=1000, max_queue=2, batch_window=0
+        )
+        release = self._block_sender(callback, mock_client)
+
+        for job_id in (1, 2, 3):
+            job = BaseJob(name=f"job{job_id}", job_id=job_id)
+            job.status = JobStatus.COMPLETED
             callback.on_job_completed(job)
 
-        with pytest.raises(Exception):
-            callback.on_job_failed(job)
+        assert callback.dropped_total == 1
+        release.set()
+        callback.close()
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
-    def test_slack_callback_message_format(self, mock_webhook_client):
-        """Test SlackCallback message format details."""
+        texts = [
+            c[1]["blocks"][0]["text"]["text"] for c in mock_client.send.call_args_list
+        ]
+        assert len(texts) == 3
+        assert not any("job1" in t for t in texts)
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_counts_drops_from_many_threads(self, mock_webhook_client):
+        """Concurrent overflows each count exactly one dropped message."""
         mock_client = Mock()
         mock_webhook_client.return_value = mock_client
 
         webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
-        callback = SlackCallback(webhook_url)
+        callback = SlackCallback(
+            webhook_url, rate_per_sec=1000, max_queue=4, batch_window=0, dedup_ttl=0
+        )
+        release = self._block_sender(callback, mock_client)
 
-        job = BaseJob(name="format_test_job", job_id=99999)
-        job.status = JobStatus.COMPLETED  # Set status to avoid refresh call
+        def submit(offset):
+            for job_id in range(offset, offset + 50):
+                callback.on_job_completed(BaseJob(name="job", job_id=job_id))
+
+        threads = [
+            threading.Thread(target=submit, args=(1 + i * 50,)) for i in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert callback.dropped_total == 8 * 50 - 4
+        release.set()
+        callback.close()
+        assert mock_client.send.call_count == 1 + 4
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_close_times_out_on_full_queue(self, mock_webhook_client):
+        """``close`` bounds the wait while the sender is stuck behind a full queue."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(
+            webhook_url, rate_per_sec=1000, max_queue=1, batch_window=0
+        )
+        release = self._block_sender(callback, mock_client)
+        callback.on_job_completed(BaseJob(name="queued", job_id=1))
+
+        started = time.monotonic()
+        callback.close(timeout=0.1)
+        assert time.monotonic() - started < 2
+        release.set()
 
-        # Test completion message format
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_is_collectable(self, mock_webhook_client):
+        """A dropped callback is collected; its sender still posts what is queued."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        callback = SlackCallback(
+            "https://hooks.slack.com/services/T00/B00/XXX", batch_window=0
+        )
+        callback.on_job_completed(BaseJob(name="last_words", job_id=7))
+        ref = weakref.ref(callback)
+        worker = callback._worker
+        del callback
+        gc.collect()
+
+        assert ref() is None
+        worker.join(5)
+        assert not worker.is_alive()
+        mock_client.send.assert_called_once()
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_coalesces_repeated_job_event(self, mock_webhook_client):
+        """A repeated event for the same job replaces the queued one."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(webhook_url, rate_per_sec=1000, batch_window=0)
+        release = self._block_sender(callback, mock_client)
+
+        job = BaseJob(name="poll_job", job_id=7)
+        job.status = JobStatus.RUNNING
+        for _ in range(5):
+            callback.on_job_running(job)
+
+        release.set()
+        callback.close()
+
+        texts = [c[1]["text"] for c in mock_client.send.call_args_list]
+        assert texts == ["Job submitted", "Job running"]
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_batches_job_burst(self, mock_webhook_client):
+        """Job events within the batch window go out as one message."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(webhook_url, rate_per_sec=1000, batch_window=5)
+
+        for job_id in (1, 2, 3):
+            job = BaseJob(name=f"job{job_id}", job_id=job_id)
+            job.status = JobStatus.COMPLETED
+            callback.on_job_completed(job)
+        callback.on_workflow_completed(Workflow(name="wf", jobs=[]))
+        callback.close()
+
+        calls = mock_client.send.call_args_list
+        assert [c[1]["text"] for c in calls] == ["Job updates", "Workflow completed"]
+        job_texts = [b["text"]["text"] for b in calls[0][1]["blocks"]]
+        assert len(job_texts) == 3
+        assert all(f"job{i}" in t for i, t in zip((1, 2, 3), job_texts, strict=True))
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_batch_respects_block_limit(self, mock_webhook_client):
+        """A batch never exceeds Slack's 50-block message limit."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(webhook_url, rate_per_sec=1000, batch_window=5)
+
+        for job_id in range(1, 61):
+            job = BaseJob(name=f"job{job_id}", job_id=job_id)
+            job.status = JobStatus.COMPLETED
+            callback.on_job_completed(job)
+        callback.close()
+
+        sizes = [len(c[1]["blocks"]) for c in mock_client.send.call_args_list]
+        assert sizes == [50, 10]
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_suppresses_duplicate_notifications(
+        self, mock_webhook_client
+    ):
+        """An identical job notification within the TTL is only sent once."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(webhook_url, batch_window=0)
+
+        job = BaseJob(name="steady_job", job_id=11)
+        job.status = JobStatus.RUNNING
+        callback.on_job_running(job)
+        callback.on_job_running(job)
+        job.status = JobStatus.COMPLETED
         callback.on_job_completed(job)
+        callback.close()
+
+        texts = [c[1]["text"] for c in mock_client.send.call_args_list]
+        assert texts == ["Job running", "Job completed"]
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_on_scheduled_report(self, mock_webhook_client):
+        """Scheduled reports render queue, resource and running-job sections."""
+        from datetime import datetime, timedelta
+
+        from srunx.observability.monitoring.types import (
+            JobStats,
+            Report,
+            ResourceStats,
+            RunningJob,
+        )
+
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
+
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(webhook_url)
+
+        report = Report(
+            timestamp=datetime(2025, 1, 1, 12, 0),
+            job_stats=JobStats(
+                pending=3, running=2, completed=0, failed=0, cancelled=0
+            ),
+            resource_stats=ResourceStats(
+                partition="gpu",
+                total_gpus=8,
+                gpus_in_use=6,
+                gpus_available=2,
+                nodes_total=2,
+                nodes_idle=0,
+                nodes_down=0,
+            ),
+            running_jobs=[
+                RunningJob(
+                    job_id=42,
+                    name="trainer",
+                    user="alice",
+                    status="RUNNING",
+                    partition="gpu",
+                    runtime=timedelta(hours=1, minutes=5),
+                    nodes=1,
+                    gpus=4,
+                )
+            ],
+        )
+        callback.on_scheduled_report(report)
+        callback.close()
 
+        mock_client.send.assert_called_once()
         call_args = mock_client.send.call_args
-        blocks = call_args[1]["blocks"]
+        assert call_args[1]["text"] == "SLURM Status Report"
+        message = call_args[1]["blocks"][0]["text"]["text"]
+        assert "Total Active" in message
+        assert "GPU Resources (gpu)" in message
+        assert "trainer" in message
+        assert "01:05" in message
+
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
+    def test_slack_callback_message_format(self, mock_webhook_client):
+        """Test SlackCallback message format details."""
+        mock_client = Mock()
+        mock_webhook_client.return_value = mock_client
 
-        assert len(blocks) == 1
-        block = blocks[0]
-        assert block["type"] == "section"
-        assert block["text"]["type"] == "mrkdwn"
-        # Note: underscores are escaped in sanitization
-        assert "Job format\\_test\\_job" in block["text"]["text"]
+        webhook_url = "https://hooks.slack.com/services/T00/B00/XXX"
+        callback = SlackCallback(webhook_url, batch_window=0)
 
-        # Reset mock
-        mock_client.reset_mock()
+        job = BaseJob(name="format_test_job", job_id=99999)
+        job.status = JobStatus.COMPLETED  # Set status to avoid refresh call
 
-        # Test failure message format
+        # Test completion and failure message formats
+        callback.on_job_completed(job)
         callback.on_job_failed(job)
+        callback.close()
 
-        call_args = mock_client.send.call_args
-        blocks = call_args[1]["blocks"]
+        assert mock_client.send.call_count == 2
+        for call_args in mock_client.send.call_args_list:
+            blocks = call_args[1]["blocks"]
 
-        assert len(blocks) == 1
-        block = blocks[0]
-        assert block["type"] == "section"
-        assert block["text"]["type"] == "mrkdwn"
-        # Note: underscores are escaped in sanitization
-        assert "Job format\\_test\\_job" in block["text"]["text"]
+            assert len(blocks) == 1
+            block = blocks[0]
+            assert block["type"] == "section"
+            assert block["text"]["type"] == "mrkdwn"
+            # Note: underscores are escaped in sanitization
+            assert "Job format\\_test\\_job" in block["text"]["text"]
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_slack_callback_with_long_job_name(self, mock_webhook_client):
         """Test SlackCallback with very long job name."""
         mock_client = Mock()
@@ -266,6 +522,7 @@ class TestSlackCallback:
         job.status = JobStatus.COMPLETED  # Set status to avoid refresh call
 
         callback.on_job_completed(job)
+        callback.close()
 
         call_args = mock_client.send.call_args
         assert f"Job {escaped_name}" in call_args[1]["blocks"][0]["text"]["text"]
@@ -314,7 +571,7 @@ class TestSlackCallbackSecurity:
         with pytest.raises(ValueError, match="Invalid Slack webhook URL"):
             SlackCallback("not-a-url")
 
-    @patch("srunx.observability.notifications.legacy_slack.WebhookClient")
+    @patch("srunx.observability.notifications.legacy_slack.shared_webhook_client")
     def test_valid_webhook_url_accepted(self, mock_webhook_client):
         """Test that valid webhook URLs are accepted."""
         valid_urls = [
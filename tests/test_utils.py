@@ -339,3 +339,24 @@ class TestJobStatusMsg:
                 msg = job_status_msg(job)
                 assert expected_icon in msg
                 assert status.name in msg
+
+    def test_job_status_msg_reads_status_once(self):
+        """The status property (which may hit sacct) is read only once."""
+        job = BaseJob(name="once_job", job_id=77777)
+        job._status = JobStatus.RUNNING
+        reads = []
+
+        def read_status(self):
+            reads.append(1)
+            return self._status
+
+        with patch.object(
+            BaseJob, "status", new_callable=lambda: property(read_status)
+        ):
+            first = job_status_msg(job)
+            job._status = JobStatus.COMPLETED
+            second = job_status_msg(job)
+
+        assert len(reads) == 2
+        assert "RUNNING" in first
+        assert "COMPLETED" in second
@@ -23,6 +23,17 @@ class TestSlurmProtocolCompliance:
         """``Slurm()`` must be a runtime-checkable JobOperations."""
         assert isinstance(Slurm(), JobOperations)
 
+    def test_ssh_client_satisfies_protocol(self) -> None:
+        """The SSH adapter exposes every JobOperations method, too."""
+        from srunx.slurm.clients.ssh import SlurmSSHClient
+
+        missing = [
+            name
+            for name in JobOperations.__protocol_attrs__
+            if not hasattr(SlurmSSHClient, name)
+        ]
+        assert missing == []
+
     def test_status_delegates_to_retrieve(self) -> None:
         """``status`` is a thin alias for ``retrieve`` on the happy path."""
         s = Slurm()